@@ -6,9 +6,27 @@ This example demonstrates how suppress conditions and conditional formatting
 are automatically converted from Crystal Reports to Oracle Reports.
 """
 
+import xml.etree.ElementTree as ET
+
 from src.transformation.condition_mapper import ConditionMapper, FormatTrigger
 from src.parsing.report_model import Field, FormatSpec, FontSpec, Section, SectionType
 
+
+def _extract_return_line(plsql_code: str) -> str:
+    """Return the first ``return`` line that references a bind variable."""
+    start = plsql_code.find("return")
+    while start != -1:
+        line_start = plsql_code.rfind("\n", 0, start) + 1
+        line_end = plsql_code.find("\n", start)
+        if line_end == -1:
+            line_end = len(plsql_code)
+        line = plsql_code[line_start:line_end]
+        if ":" in line:
+            return line.strip()
+        start = plsql_code.find("return", line_end)
+    return ""
+
+
 def example_1_simple_suppress():
     """Example 1: Simple field suppress condition."""
     print("=" * 70)
@@ -61,10 +79,9 @@ def example_2_complex_condition():
     print(f"  Name: {trigger.name}")
     print(f"\nExtracted Boolean Expression:")
     # Extract just the return statement
-    for line in trigger.plsql_code.split('\n'):
-        if 'return' in line and ':' in line:
-            print(f"  {line.strip()}")
-            break
+    return_line = _extract_return_line(trigger.plsql_code)
+    if return_line:
+        print(f"  {return_line}")
 
 
 def example_3_null_checks():
@@ -90,10 +107,9 @@ def example_3_null_checks():
     print(f"\nCrystal Condition:")
     print(f"  {crystal_condition}")
     print(f"\nOracle Boolean Expression:")
-    for line in trigger.plsql_code.split('\n'):
-        if 'return' in line and ':' in line:
-            print(f"  {line.strip()}")
-            break
+    return_line = _extract_return_line(trigger.plsql_code)
+    if return_line:
+        print(f"  {return_line}")
 
 
 def example_4_suppress_if_zero_blank():
@@ -122,10 +138,9 @@ def example_4_suppress_if_zero_blank():
     print(f"\nGenerated Oracle Format Trigger:")
     print(f"  Name: {trigger.name}")
     print(f"\nBoolean Expression:")
-    for line in trigger.plsql_code.split('\n'):
-        if 'return' in line and ':' in line:
-            print(f"  {line.strip()}")
-            break
+    return_line = _extract_return_line(trigger.plsql_code)
+    if return_line:
+        print(f"  {return_line}")
 
 
 def example_5_multiple_fields():
@@ -167,26 +182,34 @@ def example_6_oracle_xml_output():
     condition = "{amount} > 5000"
     trigger = mapper.convert_suppress_condition(condition, "HIGH_AMOUNT")
 
+    field_elem = ET.Element(
+        "field",
+        name="F_AMOUNT",
+        source="AMOUNT",
+        formatTrigger=trigger.name,
+        x="100",
+        y="200",
+        width="150",
+        height="20",
+        fontName="Arial",
+        fontSize="10",
+    )
+
     print("\nField Element in Oracle XML:")
-    print(f'''
-<field name="F_AMOUNT"
-       source="AMOUNT"
-       formatTrigger="{trigger.name}"
-       x="100" y="200"
-       width="150" height="20"
-       fontName="Arial"
-       fontSize="10"/>
-    ''')
+    print(ET.tostring(field_elem, encoding="unicode"))
+
+    program_units = ET.Element("programUnits")
+    function_elem = ET.SubElement(
+        program_units, "function", name=trigger.name, returnType="BOOLEAN"
+    )
+    ET.SubElement(function_elem, "textSource").text = trigger.plsql_code
+    ET.SubElement(function_elem, "comment").text = (
+        f"Crystal condition: {trigger.original_condition}"
+    )
+    ET.indent(program_units)
 
     print("\nProgram Unit in Oracle XML:")
-    print(f'''
-<programUnits>
-  <function name="{trigger.name}" returnType="BOOLEAN">
-    <textSource>{trigger.plsql_code}</textSource>
-    <comment>Crystal condition: {trigger.original_condition}</comment>
-  </function>
-</programUnits>
-    ''')
+    print(ET.tostring(program_units, encoding="unicode"))
 
 
 def example_7_with_functions():
@@ -211,10 +234,9 @@ def example_7_with_functions():
     print(f"  trim() → TRIM()")
     print(f"  len() → LENGTH()")
     print(f"\nOracle Expression:")
-    for line in trigger.plsql_code.split('\n'):
-        if 'return' in line and ':' in line:
-            print(f"  {line.strip()}")
-            break
+    return_line = _extract_return_line(trigger.plsql_code)
+    if return_line:
+        print(f"  {return_line}")
 
 
 def main():
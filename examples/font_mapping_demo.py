@@ -14,15 +14,12 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from src.transformation.font_mapper import FontMapper
 
-
-def print_separator():
-    """Print a separator line."""
-    print("-" * 70)
+SEPARATOR = "-" * 70
 
 
 def demo_basic_mapping():
     """Demonstrate basic font mapping."""
-    print("\n=== BASIC FONT MAPPING ===\n")
+    lines = ["\n=== BASIC FONT MAPPING ===\n"]
 
     mapper = FontMapper()
 
@@ -37,17 +34,19 @@ def demo_basic_mapping():
         "Comic Sans MS",
     ]
 
-    print("Crystal Font              -> Oracle Font")
-    print_separator()
+    lines.append("Crystal Font              -> Oracle Font")
+    lines.append(SEPARATOR)
 
     for font in fonts_to_test:
         oracle_font = mapper.map_font(font)
-        print(f"{font:25} -> {oracle_font}")
+        lines.append(f"{font:25} -> {oracle_font}")
+
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 def demo_font_styles():
     """Demonstrate font style mapping."""
-    print("\n\n=== FONT STYLE MAPPING ===\n")
+    lines = ["\n\n=== FONT STYLE MAPPING ===\n"]
 
     mapper = FontMapper()
 
@@ -60,18 +59,20 @@ def demo_font_styles():
         (True, False, True, "Bold + Underlined text"),
     ]
 
-    print("Style Description             -> Oracle Style")
-    print_separator()
+    lines.append("Style Description             -> Oracle Style")
+    lines.append(SEPARATOR)
 
     for bold, italic, underline, description in style_combinations:
         style = mapper.map_font_style(bold, italic, underline)
         underline_note = " (underline tracked separately)" if underline else ""
-        print(f"{description:30} -> {style}{underline_note}")
+        lines.append(f"{description:30} -> {style}{underline_note}")
+
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 def demo_font_sizes():
     """Demonstrate font size mapping and constraints."""
-    print("\n\n=== FONT SIZE MAPPING ===\n")
+    lines = ["\n\n=== FONT SIZE MAPPING ===\n"]
 
     mapper = FontMapper()
 
@@ -87,17 +88,19 @@ def demo_font_sizes():
         (200, "200pt (too large)"),
     ]
 
-    print("Input Size                    -> Oracle Size")
-    print_separator()
+    lines.append("Input Size                    -> Oracle Size")
+    lines.append(SEPARATOR)
 
     for size, description in sizes_to_test:
         oracle_size = mapper.map_font_size(size)
-        print(f"{description:30} -> {oracle_size}pt")
+        lines.append(f"{description:30} -> {oracle_size}pt")
+
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 def demo_complete_font_info():
     """Demonstrate getting complete font information."""
-    print("\n\n=== COMPLETE FONT INFO ===\n")
+    lines = ["\n\n=== COMPLETE FONT INFO ===\n"]
 
     mapper = FontMapper()
 
@@ -108,20 +111,22 @@ def demo_complete_font_info():
         ("Georgia", 16, True, True, True, "Bold Italic Underlined Georgia 16pt"),
     ]
 
-    print("Input Font Info                                    -> Oracle Font Info")
-    print_separator()
+    lines.append("Input Font Info                                    -> Oracle Font Info")
+    lines.append(SEPARATOR)
 
     for font, size, bold, italic, underline, description in test_cases:
         info = mapper.get_font_info(font, size, bold, italic, underline)
         output = f"{info['oracle_font']} {info['oracle_size']}pt {info['oracle_style']}"
         if info['underline']:
             output += " (underlined)"
-        print(f"{description:50} -> {output}")
+        lines.append(f"{description:50} -> {output}")
+
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 def demo_unknown_fonts():
     """Demonstrate handling of unknown fonts."""
-    print("\n\n=== UNKNOWN FONT HANDLING ===\n")
+    lines = ["\n\n=== UNKNOWN FONT HANDLING ===\n"]
 
     mapper = FontMapper()
 
@@ -133,18 +138,20 @@ def demo_unknown_fonts():
         None,
     ]
 
-    print("Unknown Font                  -> Oracle Font (fallback)")
-    print_separator()
+    lines.append("Unknown Font                  -> Oracle Font (fallback)")
+    lines.append(SEPARATOR)
 
     for font in unknown_fonts:
         display_font = repr(font) if font is None or font == "" else font
         oracle_font = mapper.map_font(font)
-        print(f"{display_font:30} -> {oracle_font}")
+        lines.append(f"{display_font:30} -> {oracle_font}")
+
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 def demo_custom_mappings():
     """Demonstrate adding custom font mappings at runtime."""
-    print("\n\n=== CUSTOM FONT MAPPINGS ===\n")
+    lines = ["\n\n=== CUSTOM FONT MAPPINGS ===\n"]
 
     mapper = FontMapper()
 
@@ -152,21 +159,23 @@ def demo_custom_mappings():
     mapper.add_custom_mapping("CompanyFont", "Helvetica")
     mapper.add_custom_mapping("ReportFont", "Times")
 
-    print("Added custom mappings:")
-    print("  CompanyFont -> Helvetica")
-    print("  ReportFont  -> Times")
-    print()
+    lines.append("Added custom mappings:")
+    lines.append("  CompanyFont -> Helvetica")
+    lines.append("  ReportFont  -> Times")
+    lines.append("")
 
     # Test custom mappings
-    print("Testing custom mappings:")
-    print_separator()
-    print(f"CompanyFont -> {mapper.map_font('CompanyFont')}")
-    print(f"ReportFont  -> {mapper.map_font('ReportFont')}")
+    lines.append("Testing custom mappings:")
+    lines.append(SEPARATOR)
+    lines.append(f"CompanyFont -> {mapper.map_font('CompanyFont')}")
+    lines.append(f"ReportFont  -> {mapper.map_font('ReportFont')}")
+
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 def demo_case_sensitivity():
     """Demonstrate case-insensitive matching."""
-    print("\n\n=== CASE SENSITIVITY ===\n")
+    lines = ["\n\n=== CASE SENSITIVITY ===\n"]
 
     mapper = FontMapper()
 
@@ -180,12 +189,14 @@ def demo_case_sensitivity():
         "TIMES NEW ROMAN",
     ]
 
-    print("Font Name (various cases)     -> Oracle Font")
-    print_separator()
+    lines.append("Font Name (various cases)     -> Oracle Font")
+    lines.append(SEPARATOR)
 
     for font in font_variations:
         oracle_font = mapper.map_font(font)
-        print(f"{font:30} -> {oracle_font}")
+        lines.append(f"{font:30} -> {oracle_font}")
+
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 def main():
@@ -5,23 +5,76 @@ Handles loading, validation, and access to configuration settings
 from YAML files and environment variables.
 """
 
+import copy
 import os
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Callable, Dict, Optional, Set, Tuple
 
 import yaml
 from dotenv import load_dotenv
 
+from .utils.compat import DATACLASS_OPTIONS
 
-@dataclass
+try:
+    # libyaml-backed loader is several times faster than the pure-Python one
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:  # pragma: no cover - depends on how PyYAML was built
+    from yaml import SafeLoader
+
+# Parsed YAML keyed by resolved path -> (mtime_ns, size, data)
+_YAML_CACHE: Dict[str, Tuple[int, int, Dict[str, Any]]] = {}
+
+
+def _load_yaml_cached(config_file: Path) -> Dict[str, Any]:
+    """Load a YAML file, reusing the parsed result while the file is unchanged.
+
+    Args:
+        config_file: Path to the YAML file.
+
+    Returns:
+        A private copy of the parsed data, safe for the caller to mutate.
+    """
+    stat = os.stat(config_file)
+    key = str(config_file.resolve())
+
+    cached = _YAML_CACHE.get(key)
+    if cached is not None and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size:
+        return copy.deepcopy(cached[2])
+
+    with open(config_file, "r", encoding="utf-8") as f:
+        data = yaml.load(f, Loader=SafeLoader) or {}
+
+    _YAML_CACHE[key] = (stat.st_mtime_ns, stat.st_size, data)
+    return copy.deepcopy(data)
+
+
+# Configured paths already found to exist
+_EXISTING_PATHS: Set[str] = set()
+
+
+def _path_exists(path: str) -> bool:
+    """Check whether a configured path exists.
+
+    Validation runs on every pipeline start, so a path found to exist is not
+    checked again. Missing paths are, so one installed later is picked up.
+    """
+    if path in _EXISTING_PATHS:
+        return True
+    if not Path(path).exists():
+        return False
+    _EXISTING_PATHS.add(path)
+    return True
+
+
+@dataclass(frozen=True, **DATACLASS_OPTIONS)
 class ExtractionDockerConfig:
     """Configuration for Docker-based RPT extraction."""
 
     image: str = "rpttoxml:latest"
 
 
-@dataclass
+@dataclass(**DATACLASS_OPTIONS)
 class ExtractionConfig:
     """Configuration for RPT extraction."""
 
@@ -37,9 +90,10 @@ class ExtractionConfig:
     timeout_seconds: int = 120
     parallel_workers: int = 4
     retry_attempts: int = 2
+    persistent_process: bool = False
 
 
-@dataclass
+@dataclass(frozen=True, **DATACLASS_OPTIONS)
 class OracleDockerConfig:
     """Configuration for Docker-based Oracle Reports."""
 
@@ -50,7 +104,7 @@ class OracleDockerConfig:
     db_service: str = "XE"
 
 
-@dataclass
+@dataclass(**DATACLASS_OPTIONS)
 class OracleConfig:
     """Configuration for Oracle Reports."""
 
@@ -66,7 +120,7 @@ class OracleConfig:
     reports_server: str = "localhost:9002"
 
 
-@dataclass
+@dataclass(frozen=True, **DATACLASS_OPTIONS)
 class PathsConfig:
     """Configuration for file paths."""
 
@@ -75,7 +129,7 @@ class PathsConfig:
     log_directory: str = "./logs"
 
 
-@dataclass
+@dataclass(**DATACLASS_OPTIONS)
 class ConversionConfig:
     """Configuration for conversion behavior."""
 
@@ -95,7 +149,7 @@ class ConversionConfig:
     default_font_size: int = 10
 
 
-@dataclass
+@dataclass(frozen=True, **DATACLASS_OPTIONS)
 class LoggingConfig:
     """Configuration for logging."""
 
@@ -106,7 +160,7 @@ class LoggingConfig:
     file_output: bool = True
 
 
-@dataclass
+@dataclass(**DATACLASS_OPTIONS)
 class Config:
     """Main configuration container."""
 
@@ -124,10 +178,7 @@ class Config:
         if not config_file.exists():
             raise FileNotFoundError(f"Configuration file not found: {config_path}")
 
-        with open(config_file, "r", encoding="utf-8") as f:
-            data = yaml.safe_load(f) or {}
-
-        return cls.from_dict(data)
+        return cls.from_dict(_load_yaml_cached(config_file))
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "Config":
@@ -135,18 +186,20 @@ class Config:
         config = cls()
 
         if "extraction" in data:
-            extraction_data = data["extraction"].copy()
+            extraction_data = data["extraction"]
             # Handle nested docker config
-            docker_data = extraction_data.pop("docker", {})
-            config.extraction = ExtractionConfig(**extraction_data)
+            docker_data = extraction_data.get("docker")
+            config.extraction = ExtractionConfig(
+                **{k: v for k, v in extraction_data.items() if k != "docker"}
+            )
             if docker_data:
                 config.extraction.docker = ExtractionDockerConfig(**docker_data)
 
         if "oracle" in data:
-            oracle_data = data["oracle"].copy()
+            oracle_data = data["oracle"]
             # Handle nested docker config
-            docker_data = oracle_data.pop("docker", {})
-            config.oracle = OracleConfig(**oracle_data)
+            docker_data = oracle_data.get("docker")
+            config.oracle = OracleConfig(**{k: v for k, v in oracle_data.items() if k != "docker"})
             if docker_data:
                 config.oracle.docker = OracleDockerConfig(**docker_data)
 
@@ -166,34 +219,13 @@ class Config:
 
         Environment variables take precedence over config file values.
         """
-        load_dotenv()
-
-        # Oracle configuration from environment
-        if os.getenv("ORACLE_HOME"):
-            self.oracle.home = os.getenv("ORACLE_HOME")
-
-        if os.getenv("ORACLE_CONNECTION"):
-            self.oracle.connection = os.getenv("ORACLE_CONNECTION")
-
-        if os.getenv("ORACLE_REPORTS_SERVER"):
-            self.oracle.reports_server = os.getenv("ORACLE_REPORTS_SERVER")
-
-        # Extraction configuration
-        if os.getenv("RPTTOXML_PATH"):
-            self.extraction.rpttoxml_path = os.getenv("RPTTOXML_PATH")
-
-        if os.getenv("EXTRACTION_WORKERS"):
-            self.extraction.parallel_workers = int(os.getenv("EXTRACTION_WORKERS"))
-
-        # Path configuration
-        if os.getenv("INPUT_DIRECTORY"):
-            self.paths.input_directory = os.getenv("INPUT_DIRECTORY")
+        _load_dotenv_once()
 
-        if os.getenv("OUTPUT_DIRECTORY"):
-            self.paths.output_directory = os.getenv("OUTPUT_DIRECTORY")
-
-        if os.getenv("LOG_DIRECTORY"):
-            self.paths.log_directory = os.getenv("LOG_DIRECTORY")
+        env = os.environ
+        for name, setter in _ENV_SPECS:
+            value = env.get(name)
+            if value:
+                setter(self, value)
 
     def validate(self) -> list[str]:
         """Validate configuration and return list of errors."""
@@ -210,7 +242,7 @@ class Config:
             # Native mode validation
             if not self.oracle.home:
                 errors.append("Oracle home path (oracle.home) is required for native mode")
-            elif not Path(self.oracle.home).exists():
+            elif not _path_exists(self.oracle.home):
                 errors.append(f"Oracle home path does not exist: {self.oracle.home}")
             if not self.oracle.connection:
                 errors.append(
@@ -233,8 +265,7 @@ class Config:
             # Note: We don't check if Docker/image exists here, that's done at runtime
         else:
             # Java or dotnet mode - check RptToXml path
-            rpttoxml_path = Path(self.extraction.rpttoxml_path)
-            if not rpttoxml_path.exists():
+            if not _path_exists(self.extraction.rpttoxml_path):
                 errors.append(f"RptToXml executable not found: {self.extraction.rpttoxml_path}")
 
         # Validate conversion options
@@ -274,6 +305,53 @@ class Config:
             Path(directory).mkdir(parents=True, exist_ok=True)
 
 
+# Environment variable -> setter applying its value to a Config
+_ENV_SPECS: Tuple[Tuple[str, Callable[[Config, str], None]], ...] = (
+    # Oracle configuration
+    ("ORACLE_HOME", lambda cfg, v: setattr(cfg.oracle, "home", v)),
+    ("ORACLE_CONNECTION", lambda cfg, v: setattr(cfg.oracle, "connection", v)),
+    ("ORACLE_REPORTS_SERVER", lambda cfg, v: setattr(cfg.oracle, "reports_server", v)),
+    # Extraction configuration
+    ("RPTTOXML_PATH", lambda cfg, v: setattr(cfg.extraction, "rpttoxml_path", v)),
+    ("EXTRACTION_WORKERS", lambda cfg, v: setattr(cfg.extraction, "parallel_workers", int(v))),
+    # Path configuration
+    (
+        "INPUT_DIRECTORY",
+        lambda cfg, v: setattr(cfg, "paths", replace(cfg.paths, input_directory=v)),
+    ),
+    (
+        "OUTPUT_DIRECTORY",
+        lambda cfg, v: setattr(cfg, "paths", replace(cfg.paths, output_directory=v)),
+    ),
+    ("LOG_DIRECTORY", lambda cfg, v: setattr(cfg, "paths", replace(cfg.paths, log_directory=v))),
+)
+
+
+# Whether the .env file has already been loaded into os.environ
+_DOTENV_LOADED = False
+
+
+def _load_dotenv_once() -> None:
+    """Load the .env file on first use only."""
+    global _DOTENV_LOADED
+
+    if not _DOTENV_LOADED:
+        load_dotenv()
+        _DOTENV_LOADED = True
+
+
+def reset_env_cache() -> None:
+    """Force the next configuration load to re-read the .env file.
+
+    Also forgets cached path-existence checks. Intended for tests that
+    change the .env file or configured paths between loads.
+    """
+    global _DOTENV_LOADED
+
+    _DOTENV_LOADED = False
+    _EXISTING_PATHS.clear()
+
+
 # Global configuration instance
 _config: Optional[Config] = None
 
@@ -1,5 +1,20 @@
 """Extraction module - Converts binary RPT files to XML format."""
 
-from .rpt_extractor import DockerRptExtractor, ExtractionResult, MockRptExtractor, RptExtractor
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .rpt_extractor import DockerRptExtractor, ExtractionResult, MockRptExtractor, RptExtractor
 
 __all__ = ["RptExtractor", "DockerRptExtractor", "MockRptExtractor", "ExtractionResult"]
+
+
+def __getattr__(name: str) -> Any:
+    """Import extractor classes on first access.
+
+    Keeps ``import src.extraction`` cheap for code paths that never extract.
+    """
+    if name in __all__:
+        from . import rpt_extractor
+
+        return getattr(rpt_extractor, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -8,21 +8,386 @@ Extracts Crystal Reports RPT files to XML format using either:
 The extractor automatically detects which version is available.
 """
 
+import asyncio
+import atexit
+import functools
+import hashlib
+import json
+import mmap
+import multiprocessing
 import os
 import platform
+import queue
+import random
 import shutil
+import signal
+import stat
+import string
 import subprocess
+import sys
+import threading
 import time
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from dataclasses import dataclass, field
+from concurrent.futures import (
+    BrokenExecutor,
+    Executor,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+)
+from dataclasses import dataclass, field, replace
 from pathlib import Path
-from typing import Callable, Optional
+from typing import Any, Callable, Iterator, Optional, Union
+from xml.sax.saxutils import escape
 
-from ..utils.error_handler import ConversionError, ErrorCategory
+from ..utils.compat import DATACLASS_OPTIONS
+from ..utils.error_handler import ConversionError, ErrorCategory, ErrorCode
 from ..utils.logger import get_logger
 
+# Error categories for which retrying extraction is pointless
+_UNRECOVERABLE_CATEGORIES = frozenset({ErrorCategory.EXTRACTION_TIMEOUT, ErrorCategory.RPT_CORRUPT})
 
-@dataclass
+
+def _has_xml_output(xml_path: Path) -> bool:
+    """Check with a single stat call whether RptToXml produced a non-empty XML."""
+    try:
+        return os.stat(xml_path).st_size > 0
+    except OSError:
+        return False
+
+
+def _content_digest(path: Path) -> Optional[bytes]:
+    """Hash a file's bytes with BLAKE2b through a read-only memory map.
+
+    Args:
+        path: File to hash.
+
+    Returns:
+        16-byte digest, or None if the file is empty or unreadable.
+    """
+    try:
+        with open(path, "rb") as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                return None
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                return hashlib.blake2b(mm, digest_size=16).digest()
+    except (OSError, ValueError):
+        return None
+
+
+def _group_identical_files(paths: list[Path]) -> dict[Path, list[Path]]:
+    """Group files with byte-identical content.
+
+    Only files whose sizes collide are hashed.
+
+    Args:
+        paths: Distinct (resolved) file paths.
+
+    Returns:
+        Mapping of the first file in each group to the other files in that
+        group. Files with unique content are left out.
+    """
+    by_size: dict[int, list[Path]] = {}
+    for path in paths:
+        try:
+            by_size.setdefault(os.stat(path).st_size, []).append(path)
+        except OSError:
+            pass
+
+    groups: dict[Path, list[Path]] = {}
+    for same_size in by_size.values():
+        if len(same_size) < 2:
+            continue
+        first_by_digest: dict[bytes, Path] = {}
+        for path in same_size:
+            digest = _content_digest(path)
+            if digest is None:
+                continue
+            first = first_by_digest.setdefault(digest, path)
+            if first != path:
+                groups.setdefault(first, []).append(path)
+    return groups
+
+
+def _link_or_copy(src: Path, dst: Path) -> None:
+    """Hard-link src to dst, replacing dst; copy if linking is not possible."""
+    try:
+        os.unlink(dst)
+    except FileNotFoundError:
+        pass
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copyfile(src, dst)
+
+
+def _ensure_dir(path: Path) -> None:
+    """Create a directory unless it already exists; one stat call when it does.
+
+    Args:
+        path: Directory to create.
+
+    Raises:
+        NotADirectoryError: If path exists but is not a directory.
+        OSError: If the directory cannot be created.
+    """
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        os.makedirs(path, exist_ok=True)
+        return
+    if not stat.S_ISDIR(st.st_mode):
+        raise NotADirectoryError(f"Not a directory: {path}")
+
+
+def _remove_file(path: Path) -> None:
+    """Delete a file if it exists."""
+    try:
+        os.unlink(path)
+    except FileNotFoundError:
+        pass
+
+
+def _output_text(data: Union[bytes, str, None]) -> str:
+    """Return captured process output as text, decoding bytes if needed."""
+    if isinstance(data, bytes):
+        return data.decode(errors="replace")
+    return data or ""
+
+
+# Suffix of the file next to an extracted XML recording which RPT it came from
+_SOURCE_SUFFIX = ".source"
+
+
+def _source_path(xml_path: Path) -> Path:
+    """Return the path of the source record kept next to an extracted XML."""
+    return xml_path.with_name(xml_path.name + _SOURCE_SUFFIX)
+
+
+def _source_record(rpt_file: Path, rpt_stat: os.stat_result) -> dict[str, Any]:
+    """Describe an RPT file for matching it against a previous extraction.
+
+    Args:
+        rpt_file: Path to the RPT file.
+        rpt_stat: stat result of rpt_file.
+
+    Returns:
+        The RPT's resolved path, size and modification time.
+    """
+    return {
+        "path": os.fspath(rpt_file.resolve()),
+        "size": rpt_stat.st_size,
+        "mtime_ns": rpt_stat.st_mtime_ns,
+    }
+
+
+def _write_source_record(source: dict[str, Any], xml_path: Path) -> None:
+    """Record which RPT a completed XML was extracted from, and the XML's size.
+
+    Failing to write the record only means the XML will not be reused.
+    """
+    try:
+        record = {**source, "xml_size": os.stat(xml_path).st_size}
+        with open(_source_path(xml_path), "w", encoding="utf-8") as f:
+            json.dump(record, f)
+    except OSError:
+        pass
+
+
+def _is_xml_current(source: dict[str, Any], xml_path: Path) -> bool:
+    """Check whether an XML was completely extracted from the RPT described by source.
+
+    The XML's source record must name the same resolved RPT path, size and
+    modification time, and the XML must still have the size it had when
+    the extraction finished.
+
+    Args:
+        source: Description of the RPT file from _source_record().
+        xml_path: Path of the previously extracted XML.
+
+    Returns:
+        True if the XML can be reused instead of re-extracting.
+    """
+    try:
+        xml_size = os.stat(xml_path).st_size
+        with open(_source_path(xml_path), encoding="utf-8") as f:
+            recorded = json.load(f)
+    except (OSError, ValueError):
+        return False
+    return xml_size > 0 and recorded == {**source, "xml_size": xml_size}
+
+
+# Run RptToXml in its own process group on POSIX so a timeout can kill its helpers too
+_NEW_SESSION = sys.platform != "win32"
+
+
+def _kill_process_tree(pid: int) -> None:
+    """Kill a process and any children it spawned.
+
+    On POSIX the process must have been started with start_new_session=True.
+
+    Args:
+        pid: Process ID of the tree's root.
+    """
+    if sys.platform == "win32":
+        subprocess.run(["taskkill", "/F", "/T", "/PID", str(pid)], capture_output=True)
+        return
+    try:
+        os.killpg(pid, signal.SIGKILL)
+    except ProcessLookupError:
+        pass
+
+
+# Status line written by RptToXml --stdin-mode after each request
+_DAEMON_RESULT_PREFIX = "RPTTOXML-RESULT\t"
+
+# Persistent RptToXml processes, one per (thread, executable); see RptExtractorDaemon
+_daemon_local = threading.local()
+_all_daemons: list["RptExtractorDaemon"] = []
+_all_daemons_lock = threading.Lock()
+
+
+class RptExtractorDaemon:
+    """A long-running RptToXml process that extracts one file per request.
+
+    The process is started with ``--stdin-mode`` and reads one
+    ``<input.rpt>\t<output.xml>`` line per request, answering with a
+    ``RPTTOXML-RESULT\tOK`` or ``RPTTOXML-RESULT\tERROR\t<message>`` line.
+    JVM and SDK start-up is paid once instead of once per file.
+    """
+
+    def __init__(self, rpttoxml_path: Path):
+        """Start the RptToXml process.
+
+        Args:
+            rpttoxml_path: Path to RptToXml executable or script.
+        """
+        self.cmd = [str(rpttoxml_path), "--stdin-mode"]
+        self.process = subprocess.Popen(
+            self.cmd,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            text=True,
+            encoding="utf-8",
+            bufsize=1,
+            start_new_session=_NEW_SESSION,
+        )
+
+    def is_alive(self) -> bool:
+        """Check whether the process is still running."""
+        return self.process.poll() is None
+
+    def request(self, rpt_file: Path, xml_path: Path, timeout: float) -> tuple[bool, str, str]:
+        """Extract one file.
+
+        Args:
+            rpt_file: Path to input RPT file.
+            xml_path: Path for output XML file.
+            timeout: Seconds to wait before killing the process.
+
+        Returns:
+            Tuple of (ok, error message, output printed before the status line).
+
+        Raises:
+            subprocess.TimeoutExpired: If the request took longer than timeout.
+                The process is killed and the daemon must be discarded.
+            RuntimeError: If the process exited without answering.
+        """
+        timed_out = threading.Event()
+
+        def expire() -> None:
+            timed_out.set()
+            # Kill the JVM too if a wrapper script started it, or it keeps stdout open
+            _kill_process_tree(self.process.pid)
+
+        watchdog = threading.Timer(timeout, expire)
+        watchdog.daemon = True
+        watchdog.start()
+        stdin, stdout = self.process.stdin, self.process.stdout
+        if stdin is None or stdout is None:
+            raise RuntimeError("RptToXml daemon was started without pipes")
+
+        output: list[str] = []
+        try:
+            stdin.write(f"{rpt_file}\t{xml_path}\n")
+            stdin.flush()
+            for line in stdout:
+                if line.startswith(_DAEMON_RESULT_PREFIX):
+                    status, _, message = (
+                        line[len(_DAEMON_RESULT_PREFIX) :].rstrip("\n").partition("\t")
+                    )
+                    return status == "OK", message, "".join(output)
+                output.append(line)
+        except (BrokenPipeError, ValueError):
+            pass
+        finally:
+            watchdog.cancel()
+
+        if timed_out.is_set():
+            raise subprocess.TimeoutExpired(self.cmd, timeout, output="".join(output))
+        raise RuntimeError(f"RptToXml exited unexpectedly: {''.join(output)[-500:]}")
+
+    def close(self) -> None:
+        """Close stdin so the process exits, killing it if it does not."""
+        if self.process.stdin is not None:
+            try:
+                self.process.stdin.close()
+            except OSError:
+                pass
+        try:
+            self.process.wait(timeout=5)
+        except subprocess.TimeoutExpired:
+            _kill_process_tree(self.process.pid)
+            self.process.wait()
+
+
+def _get_daemon(rpttoxml_path: Path) -> RptExtractorDaemon:
+    """Return this thread's daemon for rpttoxml_path, starting one if needed."""
+    daemons = getattr(_daemon_local, "daemons", None)
+    if daemons is None:
+        daemons = _daemon_local.daemons = {}
+
+    daemon = daemons.get(rpttoxml_path)
+    if daemon is None or not daemon.is_alive():
+        daemon = daemons[rpttoxml_path] = RptExtractorDaemon(rpttoxml_path)
+        with _all_daemons_lock:
+            _all_daemons.append(daemon)
+    return daemon
+
+
+def _discard_daemon(rpttoxml_path: Path) -> None:
+    """Close and forget this thread's daemon for rpttoxml_path."""
+    daemon = getattr(_daemon_local, "daemons", {}).pop(rpttoxml_path, None)
+    if daemon is not None:
+        daemon.close()
+        with _all_daemons_lock:
+            if daemon in _all_daemons:
+                _all_daemons.remove(daemon)
+
+
+@atexit.register
+def close_daemons() -> None:
+    """Shut down every persistent RptToXml process started by this process.
+
+    Worker processes need not call this: their daemons see EOF on stdin and
+    exit when the worker does.
+    """
+    with _all_daemons_lock:
+        daemons = list(_all_daemons)
+        _all_daemons.clear()
+    for daemon in daemons:
+        daemon.close()
+    _daemon_local.__dict__.pop("daemons", None)
+
+
+# Longest time completed results wait before progress_batch_callback sees them
+_PROGRESS_FLUSH_SECONDS = 0.5
+
+# Characters of stderr kept on successful results (warnings only; stdout is dropped)
+_SUCCESS_STDERR_LIMIT = 256
+
+
+@dataclass(**DATACLASS_OPTIONS)
 class ExtractionResult:
     """Result of extracting an RPT file to XML."""
 
@@ -45,6 +410,13 @@ class ExtractionResult:
         }
 
 
+def _with_rpt_path(result: ExtractionResult, rpt_path: Path) -> ExtractionResult:
+    """Return result, or a copy of it reporting rpt_path as its input."""
+    if result.rpt_path == rpt_path:
+        return result
+    return replace(result, rpt_path=rpt_path)
+
+
 class RptExtractor:
     """Extracts Crystal Reports RPT files to XML format.
 
@@ -62,6 +434,11 @@ class RptExtractor:
         temp_dir: str,
         timeout_seconds: int = 60,
         retry_attempts: int = 2,
+        base_delay: float = 1.0,
+        max_backoff: float = 30.0,
+        reuse_existing_xml: bool = False,
+        persistent_process: bool = False,
+        link_identical_reports: bool = False,
     ):
         """Initialize the RPT extractor.
 
@@ -70,19 +447,38 @@ class RptExtractor:
             temp_dir: Directory for temporary files.
             timeout_seconds: Timeout for extraction process.
             retry_attempts: Number of retry attempts on failure.
+            base_delay: Initial retry backoff in seconds (doubles per attempt).
+            max_backoff: Upper bound on the retry backoff in seconds.
+            reuse_existing_xml: Skip extraction when a previous run completely
+                extracted the same RPT file (same resolved path, size and
+                modification time) to the XML still in temp_dir.
+            persistent_process: Keep one RptToXml process per worker thread and
+                stream files to it instead of starting one per file. Only the
+                Java Edition supports this; it is ignored otherwise.
+            link_identical_reports: In batches, extract byte-identical RPT files
+                once and hard-link the XML for the copies. The linked XML keeps
+                the report name of the file that was actually extracted.
         """
         self.rpttoxml_path = Path(rpttoxml_path)
         self.temp_dir = Path(temp_dir)
         self.timeout_seconds = timeout_seconds
         self.retry_attempts = retry_attempts
+        self.base_delay = base_delay
+        self.max_backoff = max_backoff
+        self.reuse_existing_xml = reuse_existing_xml
+        self.persistent_process = persistent_process
+        self.link_identical_reports = link_identical_reports
         self.logger = get_logger("rpt_extractor")
+        self._executor: Optional[Executor] = None
+        self._executor_workers = 0
 
         # Auto-detect extractor type
         self.extractor_type = self._detect_extractor_type()
         self.logger.info(f"Using RptToXml extractor: {self.extractor_type}")
+        self._rpttoxml_str = os.fspath(self.rpttoxml_path)
 
         # Ensure temp directory exists
-        self.temp_dir.mkdir(parents=True, exist_ok=True)
+        _ensure_dir(self.temp_dir)
 
     def _detect_extractor_type(self) -> str:
         """Detect which RptToXml extractor to use.
@@ -147,11 +543,10 @@ class RptExtractor:
                     "RptToXml .NET Edition requires Windows. Use Java Edition on macOS/Linux."
                 )
 
-        if not self.temp_dir.exists():
-            try:
-                self.temp_dir.mkdir(parents=True, exist_ok=True)
-            except OSError as e:
-                errors.append(f"Cannot create temp directory: {e}")
+        try:
+            _ensure_dir(self.temp_dir)
+        except OSError as e:
+            errors.append(f"Cannot create temp directory: {e}")
 
         return errors
 
@@ -165,39 +560,81 @@ class RptExtractor:
             ExtractionResult with XML path or error information.
         """
         self.logger.info(f"Extracting: {rpt_file.name}")
-        start_time = time.time()
+        start_time = time.perf_counter()
 
-        # Validate input file
-        if not rpt_file.exists():
-            return ExtractionResult(
-                rpt_path=rpt_file,
-                success=False,
-                error=ConversionError(
+        xml_path, source, early_result = self._prepare_extract(rpt_file, start_time)
+        if early_result is not None:
+            return early_result
+
+        # Try extraction with retries
+        last_error = None
+        last_result = None
+        for attempt in range(self.retry_attempts + 1):
+            if attempt > 0:
+                if not self._should_retry(rpt_file, attempt, last_error):
+                    break
+                time.sleep(self._retry_delay(attempt))
+
+            try:
+                result = self._run_rpttoxml(rpt_file, xml_path)
+
+                if result.success:
+                    self.logger.info(f"Extracted {rpt_file.name} in {result.duration_seconds:.2f}s")
+                    if source is not None:
+                        _write_source_record(source, xml_path)
+                    return result
+
+                last_error = result.error
+                last_result = result
+
+            except Exception as e:
+                last_error = ConversionError(
                     category=ErrorCategory.EXTRACTION_FAILED,
-                    message=f"RPT file does not exist: {rpt_file}",
+                    message=f"Unexpected error: {str(e)}",
                     is_fatal=True,
-                ),
-                duration_seconds=time.time() - start_time,
-            )
+                )
 
-        # Determine output path
-        xml_path = self.temp_dir / f"{rpt_file.stem}.xml"
+        # Do not leave partial output from a failed or timed-out run behind
+        _remove_file(xml_path)
+        return self._exhausted_result(rpt_file, last_error, start_time, last_result)
+
+    async def extract_async(self, rpt_file: Path) -> ExtractionResult:
+        """Extract a single RPT file to XML without blocking the event loop.
+
+        Behaves like extract(), but runs RptToXml as an asyncio subprocess.
+
+        Args:
+            rpt_file: Path to the RPT file.
+
+        Returns:
+            ExtractionResult with XML path or error information.
+        """
+        self.logger.info(f"Extracting: {rpt_file.name}")
+        start_time = time.perf_counter()
+
+        xml_path, source, early_result = self._prepare_extract(rpt_file, start_time)
+        if early_result is not None:
+            return early_result
 
-        # Try extraction with retries
         last_error = None
+        last_result = None
         for attempt in range(self.retry_attempts + 1):
             if attempt > 0:
-                self.logger.warning(f"Retry attempt {attempt} for {rpt_file.name}")
-                time.sleep(1)  # Brief delay before retry
+                if not self._should_retry(rpt_file, attempt, last_error):
+                    break
+                await asyncio.sleep(self._retry_delay(attempt))
 
             try:
-                result = self._run_rpttoxml(rpt_file, xml_path)
+                result = await self._run_rpttoxml_async(rpt_file, xml_path)
 
                 if result.success:
                     self.logger.info(f"Extracted {rpt_file.name} in {result.duration_seconds:.2f}s")
+                    if source is not None:
+                        _write_source_record(source, xml_path)
                     return result
 
                 last_error = result.error
+                last_result = result
 
             except Exception as e:
                 last_error = ConversionError(
@@ -206,7 +643,96 @@ class RptExtractor:
                     is_fatal=True,
                 )
 
-        # All retries exhausted
+        # Do not leave partial output from a failed or timed-out run behind
+        _remove_file(xml_path)
+        return self._exhausted_result(rpt_file, last_error, start_time, last_result)
+
+    def _prepare_extract(
+        self, rpt_file: Path, start_time: float
+    ) -> tuple[Path, Optional[dict[str, Any]], Optional[ExtractionResult]]:
+        """Validate the input file and check for a reusable XML.
+
+        Args:
+            rpt_file: Path to the RPT file.
+            start_time: time.perf_counter() value when the extraction started.
+
+        Returns:
+            Tuple of (output XML path, source record to write once the XML is
+            extracted or None, result to return without extracting or None).
+        """
+        # Determine output path
+        xml_path = self.temp_dir / f"{rpt_file.stem}.xml"
+
+        # Validate input file
+        try:
+            rpt_stat = os.stat(rpt_file)
+        except OSError:
+            return (
+                xml_path,
+                None,
+                ExtractionResult(
+                    rpt_path=rpt_file,
+                    success=False,
+                    error=ConversionError(
+                        category=ErrorCategory.EXTRACTION_FAILED,
+                        message=f"RPT file does not exist: {rpt_file}",
+                        is_fatal=True,
+                    ),
+                    duration_seconds=time.perf_counter() - start_time,
+                ),
+            )
+
+        # Reuse XML from a previous run if it came from this RPT, unchanged since
+        source = _source_record(rpt_file, rpt_stat) if self.reuse_existing_xml else None
+        if source is not None and _is_xml_current(source, xml_path):
+            self.logger.info(f"Reusing existing XML for {rpt_file.name}")
+            return (
+                xml_path,
+                None,
+                ExtractionResult(
+                    rpt_path=rpt_file,
+                    success=True,
+                    xml_path=xml_path,
+                    duration_seconds=time.perf_counter() - start_time,
+                ),
+            )
+
+        # The XML is about to be rewritten, so an earlier record no longer applies
+        _remove_file(_source_path(xml_path))
+        return xml_path, source, None
+
+    def _should_retry(
+        self, rpt_file: Path, attempt: int, last_error: Optional[ConversionError]
+    ) -> bool:
+        """Decide whether to make another extraction attempt.
+
+        Args:
+            rpt_file: Path to the RPT file.
+            attempt: Retry attempt number (1 for the first retry).
+            last_error: Error from the previous attempt.
+
+        Returns:
+            True if the extraction should be retried.
+        """
+        # Timeouts, corrupt files and a missing RptToXml will not succeed on retry
+        if last_error and (
+            not last_error.is_recoverable or last_error.category in _UNRECOVERABLE_CATEGORIES
+        ):
+            return False
+        self.logger.warning(f"Retry attempt {attempt} for {rpt_file.name}")
+        return True
+
+    def _exhausted_result(
+        self,
+        rpt_file: Path,
+        last_error: Optional[ConversionError],
+        start_time: float,
+        last_result: Optional[ExtractionResult] = None,
+    ) -> ExtractionResult:
+        """Build the result returned once all attempts have failed.
+
+        Output captured by the last failed attempt is kept for diagnosis.
+        """
         return ExtractionResult(
             rpt_path=rpt_file,
             success=False,
@@ -216,9 +742,25 @@ class RptExtractor:
                 message="Extraction failed after all retries",
                 is_fatal=True,
             ),
-            duration_seconds=time.time() - start_time,
+            duration_seconds=time.perf_counter() - start_time,
+            stdout=last_result.stdout if last_result else "",
+            stderr=last_result.stderr if last_result else "",
         )
 
+    def _retry_delay(self, attempt: int) -> float:
+        """Compute the delay before a retry using exponential backoff with full jitter.
+
+        Jitter keeps parallel workers that failed together from retrying in lockstep.
+
+        Args:
+            attempt: Retry attempt number (1 for the first retry).
+
+        Returns:
+            Delay in seconds.
+        """
+        delay = min(self.max_backoff, self.base_delay * (2 ** (attempt - 1)))
+        return random.uniform(0, delay)
+
     def _run_rpttoxml(self, rpt_file: Path, xml_path: Path) -> ExtractionResult:
         """Run the RptToXml command.
 
@@ -229,104 +771,323 @@ class RptExtractor:
         Returns:
             ExtractionResult with outcome.
         """
-        start_time = time.time()
+        if self.persistent_process and self.extractor_type == "java":
+            return self._run_rpttoxml_daemon(rpt_file, xml_path)
 
-        # Build command
-        # RptToXml.exe <input.rpt> [output.xml]
-        cmd = [
-            str(self.rpttoxml_path),
-            str(rpt_file),
-            str(xml_path),
-        ]
+        start_time = time.perf_counter()
 
         try:
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=self.timeout_seconds,
-                cwd=str(rpt_file.parent),
+            return_code, stdout, stderr = self._run_process(rpt_file, xml_path)
+
+            return self._completed_result(
+                rpt_file,
+                xml_path,
+                return_code,
+                stdout,
+                stderr,
+                time.perf_counter() - start_time,
             )
 
-            duration = time.time() - start_time
+        except subprocess.TimeoutExpired as e:
+            return self._timeout_result(rpt_file, _output_text(e.stdout), _output_text(e.stderr))
 
-            # Check if XML was created
-            if xml_path.exists() and xml_path.stat().st_size > 0:
-                return ExtractionResult(
-                    rpt_path=rpt_file,
-                    success=True,
-                    xml_path=xml_path,
-                    duration_seconds=duration,
-                    stdout=result.stdout,
-                    stderr=result.stderr,
+        except FileNotFoundError:
+            return self._not_found_result(rpt_file, start_time)
+
+        except Exception as e:
+            return self._error_result(rpt_file, e, start_time)
+
+    def _run_process(self, rpt_file: Path, xml_path: Path) -> tuple[int, str, str]:
+        """Run RptToXml once, killing its whole process tree on timeout.
+
+        Standard output is always captured, so a failure can be diagnosed
+        without running RptToXml again; successful results drop it.
+
+        Args:
+            rpt_file: Path to input RPT file.
+            xml_path: Path for output XML file.
+
+        Returns:
+            Tuple of (return code, stdout, stderr).
+
+        Raises:
+            subprocess.TimeoutExpired: If RptToXml ran longer than the timeout;
+                carries the output captured before it was killed.
+        """
+        with subprocess.Popen(
+            self._build_command(rpt_file, xml_path),
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            text=True,
+            cwd=os.fspath(rpt_file.parent),
+            start_new_session=_NEW_SESSION,
+        ) as process:
+            try:
+                stdout, stderr = process.communicate(timeout=self.timeout_seconds)
+            except subprocess.TimeoutExpired:
+                # Kill helpers too, or they keep the pipes open and outlive the worker
+                _kill_process_tree(process.pid)
+                stdout, stderr = process.communicate()
+                raise subprocess.TimeoutExpired(
+                    process.args, self.timeout_seconds, output=stdout, stderr=stderr
                 )
 
-            # XML not created or empty - extraction failed
-            error_msg = result.stderr or result.stdout or "No output produced"
-            return ExtractionResult(
-                rpt_path=rpt_file,
-                success=False,
-                error=ConversionError(
-                    category=ErrorCategory.EXTRACTION_FAILED,
-                    message=f"RptToXml failed: {error_msg[:500]}",
-                    is_fatal=True,
-                    context={"return_code": result.returncode},
-                ),
-                duration_seconds=duration,
-                stdout=result.stdout,
-                stderr=result.stderr,
-            )
+        return process.returncode, stdout, stderr
 
-        except subprocess.TimeoutExpired:
-            return ExtractionResult(
-                rpt_path=rpt_file,
-                success=False,
-                error=ConversionError(
-                    category=ErrorCategory.EXTRACTION_TIMEOUT,
-                    message=f"Extraction timed out after {self.timeout_seconds} seconds",
-                    is_fatal=True,
-                    suggested_fix="Try increasing the timeout or check if the file is corrupted",
-                ),
-                duration_seconds=self.timeout_seconds,
+    async def _run_rpttoxml_async(self, rpt_file: Path, xml_path: Path) -> ExtractionResult:
+        """Run the RptToXml command as an asyncio subprocess.
+
+        Subclasses that override _run_rpttoxml, and the persistent-process
+        mode, run the synchronous implementation in a worker thread instead.
+
+        Args:
+            rpt_file: Path to input RPT file.
+            xml_path: Path for output XML file.
+
+        Returns:
+            ExtractionResult with outcome.
+        """
+        if type(self)._run_rpttoxml is not RptExtractor._run_rpttoxml or (
+            self.persistent_process and self.extractor_type == "java"
+        ):
+            return await asyncio.to_thread(self._run_rpttoxml, rpt_file, xml_path)
+
+        start_time = time.perf_counter()
+
+        try:
+            process = await asyncio.create_subprocess_exec(
+                *self._build_command(rpt_file, xml_path),
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+                cwd=os.fspath(rpt_file.parent),
+                start_new_session=_NEW_SESSION,
+            )
+            stdout_reader, stderr_reader = process.stdout, process.stderr
+            if stdout_reader is None or stderr_reader is None:
+                raise RuntimeError("RptToXml was started without pipes")
+
+            # Readers are never cancelled, so output written before a timeout is kept
+            readers = [
+                asyncio.ensure_future(stdout_reader.read()),
+                asyncio.ensure_future(stderr_reader.read()),
+            ]
+            waiter = asyncio.ensure_future(process.wait())
+            _, pending = await asyncio.wait([*readers, waiter], timeout=self.timeout_seconds)
+            if pending:
+                _kill_process_tree(process.pid)
+                await process.wait()
+
+            stdout, stderr = (
+                data.decode(errors="replace") for data in await asyncio.gather(*readers)
+            )
+            if pending:
+                return self._timeout_result(rpt_file, stdout, stderr)
+
+            return self._completed_result(
+                rpt_file,
+                xml_path,
+                waiter.result(),
+                stdout,
+                stderr,
+                time.perf_counter() - start_time,
             )
 
         except FileNotFoundError:
-            return ExtractionResult(
-                rpt_path=rpt_file,
-                success=False,
-                error=ConversionError(
-                    category=ErrorCategory.EXTRACTION_FAILED,
-                    message=f"RptToXml executable not found: {self.rpttoxml_path}",
-                    is_fatal=True,
-                    suggested_fix="Check rpttoxml_path in configuration",
-                ),
-                duration_seconds=time.time() - start_time,
-            )
+            return self._not_found_result(rpt_file, start_time)
 
         except Exception as e:
+            return self._error_result(rpt_file, e, start_time)
+
+    def _build_command(self, rpt_file: Path, xml_path: Path) -> list[str]:
+        """Build the RptToXml command line.
+
+        Args:
+            rpt_file: Path to input RPT file.
+            xml_path: Path for output XML file.
+
+        Returns:
+            Command as a list of arguments.
+        """
+        # RptToXml.exe <input.rpt> [output.xml]
+        return [self._rpttoxml_str, os.fspath(rpt_file), os.fspath(xml_path)]
+
+    def _completed_result(
+        self,
+        rpt_file: Path,
+        xml_path: Path,
+        return_code: int,
+        stdout: str,
+        stderr: str,
+        duration: float,
+    ) -> ExtractionResult:
+        """Build the result of an RptToXml run that exited on its own.
+
+        Args:
+            rpt_file: Path to input RPT file.
+            xml_path: Path for output XML file.
+            return_code: Process exit code.
+            stdout: Captured standard output.
+            stderr: Captured standard error.
+            duration: Run time in seconds.
+
+        Returns:
+            ExtractionResult with outcome.
+        """
+        # Check if XML was created; output of successful runs is not kept
+        if _has_xml_output(xml_path):
             return ExtractionResult(
                 rpt_path=rpt_file,
-                success=False,
-                error=ConversionError(
-                    category=ErrorCategory.EXTRACTION_FAILED,
-                    message=f"Extraction error: {str(e)}",
-                    is_fatal=True,
-                ),
-                duration_seconds=time.time() - start_time,
+                success=True,
+                xml_path=xml_path,
+                duration_seconds=duration,
+                stderr=stderr[:_SUCCESS_STDERR_LIMIT],
             )
 
+        # XML not created or empty - extraction failed
+        error_msg = stderr or stdout or "No output produced"
+        return ExtractionResult(
+            rpt_path=rpt_file,
+            success=False,
+            error=ConversionError(
+                category=ErrorCategory.EXTRACTION_FAILED,
+                message=f"RptToXml failed: {error_msg[:500]}",
+                is_fatal=True,
+                context={"return_code": return_code},
+            ),
+            duration_seconds=duration,
+            stdout=stdout,
+            stderr=stderr,
+        )
+
+    def _timeout_result(
+        self, rpt_file: Path, stdout: str = "", stderr: str = ""
+    ) -> ExtractionResult:
+        """Build the result of an RptToXml run that exceeded the timeout.
+
+        Args:
+            rpt_file: Path to input RPT file.
+            stdout: Output captured before the process was killed.
+            stderr: Error output captured before the process was killed.
+
+        Returns:
+            ExtractionResult with a timeout error.
+        """
+        return ExtractionResult(
+            rpt_path=rpt_file,
+            success=False,
+            error=ConversionError(
+                category=ErrorCategory.EXTRACTION_TIMEOUT,
+                message=f"Extraction timed out after {self.timeout_seconds} seconds",
+                is_fatal=True,
+                suggested_fix="Try increasing the timeout or check if the file is corrupted",
+            ),
+            duration_seconds=self.timeout_seconds,
+            stdout=stdout,
+            stderr=stderr,
+        )
+
+    def _not_found_result(self, rpt_file: Path, start_time: float) -> ExtractionResult:
+        """Build the result of an RptToXml run whose executable is missing."""
+        return ExtractionResult(
+            rpt_path=rpt_file,
+            success=False,
+            error=ConversionError(
+                category=ErrorCategory.EXTRACTION_FAILED,
+                message=f"RptToXml executable not found: {self.rpttoxml_path}",
+                error_code=ErrorCode.RPTTOXML_NOT_FOUND,
+                is_fatal=True,
+                is_recoverable=False,
+                suggested_fix="Check rpttoxml_path in configuration",
+            ),
+            duration_seconds=time.perf_counter() - start_time,
+        )
+
+    def _error_result(
+        self, rpt_file: Path, error: Exception, start_time: float
+    ) -> ExtractionResult:
+        """Build the result of an RptToXml run that raised an unexpected error."""
+        return ExtractionResult(
+            rpt_path=rpt_file,
+            success=False,
+            error=ConversionError(
+                category=ErrorCategory.EXTRACTION_FAILED,
+                message=f"Extraction error: {str(error)}",
+                is_fatal=True,
+            ),
+            duration_seconds=time.perf_counter() - start_time,
+        )
+
+    def _run_rpttoxml_daemon(self, rpt_file: Path, xml_path: Path) -> ExtractionResult:
+        """Extract a file using this thread's persistent RptToXml process.
+
+        Args:
+            rpt_file: Path to input RPT file.
+            xml_path: Path for output XML file.
+
+        Returns:
+            ExtractionResult with outcome.
+        """
+        start_time = time.perf_counter()
+
+        try:
+            daemon = _get_daemon(self.rpttoxml_path)
+            ok, message, output = daemon.request(
+                rpt_file.resolve(), xml_path.resolve(), self.timeout_seconds
+            )
+        except subprocess.TimeoutExpired:
+            _discard_daemon(self.rpttoxml_path)
+            return self._timeout_result(rpt_file)
+        except FileNotFoundError:
+            return self._not_found_result(rpt_file, start_time)
+        except Exception as e:
+            _discard_daemon(self.rpttoxml_path)
+            return self._error_result(rpt_file, e, start_time)
+
+        duration = time.perf_counter() - start_time
+        if ok:
+            return self._completed_result(rpt_file, xml_path, 0, output, "", duration)
+
+        error_msg = message or output or "No output produced"
+        return ExtractionResult(
+            rpt_path=rpt_file,
+            success=False,
+            error=ConversionError(
+                category=ErrorCategory.EXTRACTION_FAILED,
+                message=f"RptToXml failed: {error_msg[:500]}",
+                is_fatal=True,
+            ),
+            duration_seconds=duration,
+            stdout=output,
+        )
+
     def batch_extract(
         self,
         rpt_files: list[Path],
         workers: int = 4,
         progress_callback: Optional[Callable[[ExtractionResult], None]] = None,
+        progress_batch_callback: Optional[Callable[[list[ExtractionResult]], None]] = None,
+        progress_batch_size: int = 16,
     ) -> list[ExtractionResult]:
         """Extract multiple RPT files in parallel.
 
+        With more than one worker, files are extracted in separate processes
+        so result handling in one worker never contends for the GIL with the
+        others. The extractor itself is pickled into each worker.
+
+        The worker pool is kept for later calls with the same number of
+        workers; call close() (or use the extractor as a context manager)
+        to shut it down.
+
         Args:
             rpt_files: List of RPT file paths.
             workers: Number of parallel workers.
             progress_callback: Optional callback for progress updates.
+            progress_batch_callback: Optional callback receiving completed results
+                in groups, for progress displays where per-file updates are costly.
+            progress_batch_size: Results per progress_batch_callback call. A
+                smaller group is delivered once it has waited
+                _PROGRESS_FLUSH_SECONDS, even while no further result arrives,
+                and at the end of the batch.
 
         Returns:
             List of ExtractionResults.
@@ -334,22 +1095,128 @@ class RptExtractor:
         self.logger.info(
             f"Starting batch extraction of {len(rpt_files)} files with {workers} workers"
         )
-        results: list[ExtractionResult] = []
+        # Slots are filled by input index so no reordering pass is needed
+        results: list[Optional[ExtractionResult]] = [None] * len(rpt_files)
+        pending: list[ExtractionResult] = []
+        last_flush = time.perf_counter()
+
+        def flush_pending() -> None:
+            nonlocal pending, last_flush
+            if progress_batch_callback and pending:
+                progress_batch_callback(pending)
+                pending = []
+            last_flush = time.perf_counter()
+
+        def flush_if_due() -> None:
+            if time.perf_counter() - last_flush >= _PROGRESS_FLUSH_SECONDS:
+                flush_pending()
+
+        # Also flush while waiting, so a slow report does not hold back finished ones
+        on_idle = flush_if_due if progress_batch_callback else None
+        for index, result in self._iter_extract_indexed(rpt_files, workers, on_idle):
+            results[index] = result
+
+            if progress_callback:
+                progress_callback(result)
+
+            if progress_batch_callback:
+                pending.append(result)
+                if len(pending) >= progress_batch_size:
+                    flush_pending()
+                else:
+                    flush_if_due()
+
+        flush_pending()
+
+        successful = sum(1 for r in results if r is not None and r.success)
+        self.logger.info(f"Batch extraction complete: {successful}/{len(rpt_files)} successful")
 
-        with ThreadPoolExecutor(max_workers=workers) as executor:
-            # Submit all extraction tasks
-            future_to_file = {
-                executor.submit(self.extract, rpt_file): rpt_file for rpt_file in rpt_files
-            }
+        return results  # type: ignore[return-value]
 
+    def iter_extract(self, rpt_files: list[Path], workers: int = 4) -> Iterator[ExtractionResult]:
+        """Extract multiple RPT files in parallel, yielding results as they complete.
+
+        Lets the caller start on the first XML while the rest are still being
+        extracted. Results arrive in completion order; use ``rpt_path`` to
+        match them to inputs. Uses the same worker pool as batch_extract.
+
+        Args:
+            rpt_files: List of RPT file paths.
+            workers: Number of parallel workers.
+
+        Yields:
+            ExtractionResult for each input file.
+        """
+        for _, result in self._iter_extract_indexed(rpt_files, workers):
+            yield result
+
+    def _iter_extract_indexed(
+        self,
+        rpt_files: list[Path],
+        workers: int,
+        on_idle: Optional[Callable[[], None]] = None,
+    ) -> Iterator[tuple[int, ExtractionResult]]:
+        """Submit every file to the worker pool and yield (input index, result) pairs.
+
+        Paths that resolve to the same file (duplicates, symlinked copies) are
+        extracted once; each input still gets a result carrying its own path.
+        With link_identical_reports, byte-identical files are also extracted
+        once and the copies get a hard link to the XML.
+
+        Args:
+            rpt_files: List of RPT file paths.
+            workers: Number of parallel workers.
+            on_idle: Optional function called every _PROGRESS_FLUSH_SECONDS
+                while waiting for the next result.
+
+        Yields:
+            Tuples of input index and result, in completion order.
+        """
+        executor = self._get_executor(workers)
+        pool_broken = False
+
+        # Group input indexes by the file they resolve to
+        indexes_by_file: dict[Path, list[int]] = {}
+        for index, rpt_file in enumerate(rpt_files):
+            indexes_by_file.setdefault(rpt_file.resolve(), []).append(index)
+
+        # Copies of a file's content are served from that file's extraction
+        copies_of: dict[Path, list[Path]] = {}
+        if self.link_identical_reports:
+            copies_of = _group_identical_files(list(indexes_by_file))
+        copies = {copy for group in copies_of.values() for copy in group}
+
+        # Submit one extraction task per distinct file
+        future_to_file = {
+            executor.submit(self.extract, rpt_files[indexes[0]]): key
+            for key, indexes in indexes_by_file.items()
+            if key not in copies
+        }
+
+        # Futures are queued as they finish, so waiting for one can time out
+        completed: "queue.Queue[Future[ExtractionResult]]" = queue.Queue()
+        for future in future_to_file:
+            future.add_done_callback(completed.put)
+        idle_timeout = _PROGRESS_FLUSH_SECONDS if on_idle else None
+
+        try:
             # Collect results as they complete
-            for future in as_completed(future_to_file):
-                rpt_file = future_to_file[future]
+            for _ in range(len(future_to_file)):
+                while True:
+                    try:
+                        future = completed.get(timeout=idle_timeout)
+                        break
+                    except queue.Empty:
+                        if on_idle:
+                            on_idle()
+                key = future_to_file[future]
+                indexes = indexes_by_file[key]
                 try:
                     result = future.result()
                 except Exception as e:
+                    pool_broken = pool_broken or isinstance(e, BrokenExecutor)
                     result = ExtractionResult(
-                        rpt_path=rpt_file,
+                        rpt_path=rpt_files[indexes[0]],
                         success=False,
                         error=ConversionError(
                             category=ErrorCategory.EXTRACTION_FAILED,
@@ -358,19 +1225,147 @@ class RptExtractor:
                         ),
                     )
 
-                results.append(result)
+                for index in indexes:
+                    yield index, _with_rpt_path(result, rpt_files[index])
+
+                for copy in copies_of.get(key, ()):
+                    copy_indexes = indexes_by_file[copy]
+                    copy_result = self._link_copy_result(result, rpt_files[copy_indexes[0]])
+                    for index in copy_indexes:
+                        yield index, _with_rpt_path(copy_result, rpt_files[index])
+        finally:
+            # If the caller stopped early, drop work that has not started yet
+            for future in future_to_file:
+                future.cancel()
 
-                if progress_callback:
-                    progress_callback(result)
+            # A broken pool rejects all further work; start a fresh one next time
+            if pool_broken:
+                self.close()
 
-        # Sort results to match input order
-        path_to_result = {str(r.rpt_path): r for r in results}
-        ordered_results = [path_to_result[str(f)] for f in rpt_files]
+    def _link_copy_result(self, result: ExtractionResult, rpt_file: Path) -> ExtractionResult:
+        """Build the result for an RPT file identical to the one behind result.
 
-        successful = sum(1 for r in ordered_results if r.success)
+        Args:
+            result: Result of extracting the identical file.
+            rpt_file: Path to the copy.
+
+        Returns:
+            ExtractionResult pointing at a hard link (or copy) of the XML.
+        """
+        source_xml = result.xml_path
+        if not result.success or source_xml is None:
+            return replace(result, rpt_path=rpt_file)
+
+        xml_path = self.temp_dir / f"{rpt_file.stem}.xml"
+        if xml_path != source_xml:
+            try:
+                _remove_file(_source_path(xml_path))
+                _link_or_copy(source_xml, xml_path)
+            except OSError as e:
+                return ExtractionResult(
+                    rpt_path=rpt_file,
+                    success=False,
+                    error=ConversionError(
+                        category=ErrorCategory.EXTRACTION_FAILED,
+                        message=f"Could not link XML of identical report: {e}",
+                        is_fatal=True,
+                    ),
+                )
+
+        self.logger.info(f"Linked XML for {rpt_file.name} (identical to {result.rpt_path.name})")
+        return ExtractionResult(rpt_path=rpt_file, success=True, xml_path=xml_path)
+
+    async def batch_extract_async(
+        self,
+        rpt_files: list[Path],
+        workers: int = 4,
+        progress_callback: Optional[Callable[[ExtractionResult], None]] = None,
+    ) -> list[ExtractionResult]:
+        """Extract multiple RPT files concurrently on the running event loop.
+
+        Unlike batch_extract, no thread or process is tied up per running
+        extraction; at most ``workers`` RptToXml subprocesses run at once.
+
+        Args:
+            rpt_files: List of RPT file paths.
+            workers: Maximum number of concurrent extractions.
+            progress_callback: Optional callback for progress updates.
+
+        Returns:
+            List of ExtractionResults in input order.
+        """
+        self.logger.info(
+            f"Starting async batch extraction of {len(rpt_files)} files with {workers} workers"
+        )
+        semaphore = asyncio.Semaphore(max(1, workers))
+
+        async def extract_one(rpt_file: Path) -> ExtractionResult:
+            async with semaphore:
+                result = await self.extract_async(rpt_file)
+            if progress_callback:
+                progress_callback(result)
+            return result
+
+        results = await asyncio.gather(*(extract_one(rpt_file) for rpt_file in rpt_files))
+
+        successful = sum(1 for r in results if r.success)
         self.logger.info(f"Batch extraction complete: {successful}/{len(rpt_files)} successful")
 
-        return ordered_results
+        return list(results)
+
+    def _get_executor(self, workers: int) -> Executor:
+        """Return the batch executor for this worker count, creating it if needed.
+
+        Args:
+            workers: Number of parallel workers.
+
+        Returns:
+            Executor instance.
+        """
+        if self._executor is None or self._executor_workers != workers:
+            self.close()
+            self._executor = self._create_executor(workers)
+            self._executor_workers = workers
+        return self._executor
+
+    def _create_executor(self, workers: int) -> Executor:
+        """Create the executor used by batch_extract.
+
+        A single worker runs in a thread to avoid process start-up cost.
+
+        Args:
+            workers: Number of parallel workers.
+
+        Returns:
+            Executor instance.
+        """
+        if workers <= 1:
+            return ThreadPoolExecutor(max_workers=1, thread_name_prefix="rpt-extract")
+
+        return ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+
+    def close(self) -> None:
+        """Shut down the worker pool kept by batch_extract."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+            self._executor_workers = 0
+
+    def __enter__(self) -> "RptExtractor":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    def __getstate__(self) -> dict:
+        # Pool workers receive a pickled copy of the extractor; the pool stays here
+        state = self.__dict__.copy()
+        state["_executor"] = None
+        state["_executor_workers"] = 0
+        return state
 
     def cleanup_temp_files(self, keep_xml: bool = False) -> int:
         """Clean up temporary files.
@@ -381,19 +1376,21 @@ class RptExtractor:
         Returns:
             Number of files removed.
         """
-        if not self.temp_dir.exists():
-            return 0
-
         count = 0
-        patterns = ["*.tmp", "*.log"] if keep_xml else ["*.xml", "*.tmp", "*.log"]
+        suffixes = (".tmp", ".log") if keep_xml else (".xml", _SOURCE_SUFFIX, ".tmp", ".log")
 
-        for pattern in patterns:
-            for file_path in self.temp_dir.glob(pattern):
-                try:
-                    file_path.unlink()
-                    count += 1
-                except OSError:
-                    pass
+        # Single directory pass; no Path object per entry
+        try:
+            with os.scandir(self.temp_dir) as entries:
+                for entry in entries:
+                    if entry.name.endswith(suffixes):
+                        try:
+                            os.unlink(entry.path)
+                            count += 1
+                        except OSError:
+                            pass
+        except FileNotFoundError:
+            return 0
 
         return count
 
@@ -412,6 +1409,9 @@ class DockerRptExtractor(RptExtractor):
         timeout_seconds: int = 120,
         retry_attempts: int = 2,
         docker_image: str = "rpttoxml:latest",
+        base_delay: float = 1.0,
+        max_backoff: float = 30.0,
+        reuse_existing_xml: bool = False,
     ):
         """Initialize the Docker RPT extractor.
 
@@ -420,16 +1420,28 @@ class DockerRptExtractor(RptExtractor):
             timeout_seconds: Timeout for extraction process.
             retry_attempts: Number of retry attempts on failure.
             docker_image: Docker image name for rpttoxml.
+            base_delay: Initial retry backoff in seconds (doubles per attempt).
+            max_backoff: Upper bound on the retry backoff in seconds.
+            reuse_existing_xml: Skip extraction when a previous run completely
+                extracted the same RPT file (same resolved path, size and
+                modification time) to the XML still in temp_dir.
         """
         self.temp_dir = Path(temp_dir)
         self.timeout_seconds = timeout_seconds
         self.retry_attempts = retry_attempts
+        self.base_delay = base_delay
+        self.max_backoff = max_backoff
+        self.reuse_existing_xml = reuse_existing_xml
+        self.persistent_process = False
+        self.link_identical_reports = False
+        self._executor: Optional[Executor] = None
+        self._executor_workers = 0
         self.docker_image = docker_image
         self.logger = get_logger("docker_rpt_extractor")
         self.extractor_type = "docker"
 
         # Ensure temp directory exists
-        self.temp_dir.mkdir(parents=True, exist_ok=True)
+        _ensure_dir(self.temp_dir)
 
         self.logger.info(f"Using Docker RptToXml extractor: {docker_image}")
 
@@ -482,7 +1494,7 @@ class DockerRptExtractor(RptExtractor):
         directory as the JAR files. We mount the single RPT file to /app/
         and use just the filename when opening.
         """
-        start_time = time.time()
+        start_time = time.perf_counter()
 
         # Get absolute paths
         rpt_file = rpt_file.resolve()
@@ -517,10 +1529,10 @@ class DockerRptExtractor(RptExtractor):
                 timeout=self.timeout_seconds,
             )
 
-            duration = time.time() - start_time
+            duration = time.perf_counter() - start_time
 
             # Check if XML was created
-            if xml_path.exists() and xml_path.stat().st_size > 0:
+            if _has_xml_output(xml_path):
                 return ExtractionResult(
                     rpt_path=rpt_file,
                     success=True,
@@ -559,6 +1571,21 @@ class DockerRptExtractor(RptExtractor):
                 duration_seconds=self.timeout_seconds,
             )
 
+        except FileNotFoundError:
+            return ExtractionResult(
+                rpt_path=rpt_file,
+                success=False,
+                error=ConversionError(
+                    category=ErrorCategory.EXTRACTION_FAILED,
+                    message="Docker executable not found",
+                    error_code=ErrorCode.RPTTOXML_NOT_FOUND,
+                    is_fatal=True,
+                    is_recoverable=False,
+                    suggested_fix="Install Docker or use extraction.mode java",
+                ),
+                duration_seconds=time.perf_counter() - start_time,
+            )
+
         except Exception as e:
             return ExtractionResult(
                 rpt_path=rpt_file,
@@ -568,23 +1595,13 @@ class DockerRptExtractor(RptExtractor):
                     message=f"Docker extraction error: {str(e)}",
                     is_fatal=True,
                 ),
-                duration_seconds=time.time() - start_time,
+                duration_seconds=time.perf_counter() - start_time,
             )
 
 
-class MockRptExtractor(RptExtractor):
-    """Mock extractor for testing without Crystal Reports runtime.
-
-    Creates sample XML output for testing the rest of the pipeline.
-    """
-
-    def _run_rpttoxml(self, rpt_file: Path, xml_path: Path) -> ExtractionResult:
-        """Generate mock XML output."""
-        start_time = time.time()
-
-        # Generate sample Crystal Reports XML
-        sample_xml = f"""<?xml version="1.0" encoding="UTF-8"?>
-<CrystalReport Name="{rpt_file.stem}">
+# Sample Crystal Reports XML written by MockRptExtractor; $stem is the report name
+_MOCK_XML_TEMPLATE = string.Template("""<?xml version="1.0" encoding="UTF-8"?>
+<CrystalReport Name="$stem">
     <DatabaseInfo>
         <Table Name="Sample_Table">
             <Field Name="ID" Type="Number"/>
@@ -594,7 +1611,7 @@ class MockRptExtractor(RptExtractor):
     </DatabaseInfo>
     <Formulas>
         <Formula Name="SampleFormula">
-            <Text>{{Sample_Table.Name}} &amp; " - " &amp; ToText({{Sample_Table.ID}})</Text>
+            <Text>{Sample_Table.Name} &amp; " - " &amp; ToText({Sample_Table.ID})</Text>
         </Formula>
     </Formulas>
     <Parameters>
@@ -610,17 +1627,39 @@ class MockRptExtractor(RptExtractor):
         </Section>
     </Sections>
 </CrystalReport>
-"""
+""")
+_MOCK_XML_OPEN_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+
+
+@functools.lru_cache(maxsize=1024)
+def _mock_xml_for(stem: str) -> bytes:
+    """Build (once per report name) the encoded mock XML document."""
+    name = escape(stem, {'"': "&quot;"})
+    return _MOCK_XML_TEMPLATE.substitute(stem=name).encode("utf-8")
+
+
+class MockRptExtractor(RptExtractor):
+    """Mock extractor for testing without Crystal Reports runtime.
+
+    Creates sample XML output for testing the rest of the pipeline.
+    """
+
+    def _run_rpttoxml(self, rpt_file: Path, xml_path: Path) -> ExtractionResult:
+        """Generate mock XML output."""
+        start_time = time.perf_counter()
 
         try:
-            with open(xml_path, "w", encoding="utf-8") as f:
-                f.write(sample_xml)
+            fd = os.open(xml_path, _MOCK_XML_OPEN_FLAGS, 0o666)
+            try:
+                os.write(fd, _mock_xml_for(rpt_file.stem))
+            finally:
+                os.close(fd)
 
             return ExtractionResult(
                 rpt_path=rpt_file,
                 success=True,
                 xml_path=xml_path,
-                duration_seconds=time.time() - start_time,
+                duration_seconds=time.perf_counter() - start_time,
             )
 
         except Exception as e:
@@ -632,5 +1671,5 @@ class MockRptExtractor(RptExtractor):
                     message=f"Mock extraction failed: {str(e)}",
                     is_fatal=True,
                 ),
-                duration_seconds=time.time() - start_time,
+                duration_seconds=time.perf_counter() - start_time,
             )
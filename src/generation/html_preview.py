@@ -4,9 +4,14 @@ HTML Preview Generator for RPT to RDF Converter.
 Generates HTML preview of converted reports for visual verification.
 """
 
-from html import escape
+import multiprocessing
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import lru_cache
+from io import StringIO
 from pathlib import Path
-from typing import Optional
+from typing import IO, Callable, Iterable, Optional
 
 from ..parsing.report_model import (
     Field,
@@ -16,6 +21,360 @@ from ..parsing.report_model import (
 )
 from ..utils.logger import get_logger
 
+# Finds a character _escape would replace
+_needs_escape = re.compile("[&<\"']").search
+
+
+def _escape(s: str) -> str:
+    """HTML-escape s for element text or a quoted attribute value.
+
+    Unlike html.escape, ">" is left alone: it cannot end a tag or an attribute
+    value in either context.
+    """
+    return (
+        s.replace("&", "&amp;").replace("<", "&lt;").replace('"', "&quot;").replace("'", "&#x27;")
+    )
+
+
+def _esc_fast(s: str) -> str:
+    """HTML-escape s, returning it unchanged when there is nothing to escape."""
+    return _escape(s) if _needs_escape(s) else s
+
+
+# Field sources, names and XML element names repeat a lot within and across
+# reports, so their escaped form is cached
+_esc = lru_cache(maxsize=4096)(_esc_fast)
+
+# CSS align-items value for each field vertical alignment
+_VERTICAL_ALIGNMENT = {
+    "top": "flex-start",
+    "middle": "center",
+    "bottom": "flex-end",
+}
+
+# Font weight, style and decoration for each (bold, italic, underline) combination
+_FONT_STYLES = {
+    (bold, italic, underline): (
+        f"font-weight: {'bold' if bold else 'normal'}; "
+        f"font-style: {'italic' if italic else 'normal'}"
+        + ("; text-decoration: underline" if underline else "")
+    )
+    for bold in (False, True)
+    for italic in (False, True)
+    for underline in (False, True)
+}
+
+# Prefix and suffix shown around the source of each kind of data field:
+# {column}, @formula, ?parameter and the bare special field name
+_DISPLAY_AFFIXES = {
+    "database": ("{", "}"),
+    "formula": ("@", ""),
+    "parameter": ("?", ""),
+    "special": ("", ""),
+}
+
+# Escaped label and CSS classes for each section type
+_SECTION_LABELS = {st: _escape(st.value.replace("_", " ").title()) for st in SectionType}
+_SECTION_CLASSES = {st: f"section section-{st.value.lower()}" for st in SectionType}
+
+# Oracle XML elements listed as frames in XML previews
+_FRAME_TAGS = frozenset({"frame", "repeatingFrame"})
+
+# Report styling; page dimensions come from custom properties set per report
+_CSS_STATIC = """* {
+    margin: 0;
+    padding: 0;
+    box-sizing: border-box;
+}
+
+body {
+    font-family: Arial, sans-serif;
+    background-color: #f5f5f5;
+    padding: 20px;
+}
+
+.preview-container {
+    max-width: calc(var(--page-width) + 100px);
+    margin: 0 auto;
+    background-color: white;
+    padding: 20px;
+    border-radius: 8px;
+    box-shadow: 0 2px 8px rgba(0,0,0,0.1);
+}
+
+.preview-header {
+    margin-bottom: 20px;
+    padding-bottom: 15px;
+    border-bottom: 2px solid #333;
+}
+
+.preview-header h1 {
+    font-size: 24px;
+    color: #333;
+    margin-bottom: 10px;
+}
+
+.metadata {
+    font-size: 12px;
+    color: #666;
+    line-height: 1.6;
+}
+
+.warnings {
+    background-color: #fff3cd;
+    border: 1px solid #ffc107;
+    border-radius: 4px;
+    padding: 15px;
+    margin-bottom: 20px;
+}
+
+.warnings h3 {
+    font-size: 14px;
+    color: #856404;
+    margin-bottom: 8px;
+}
+
+.warnings ul {
+    margin-left: 20px;
+    font-size: 12px;
+    color: #856404;
+}
+
+.warnings li {
+    margin-bottom: 4px;
+}
+
+.warning-section {
+    margin-bottom: 15px;
+}
+
+.notes-section {
+    margin-bottom: 15px;
+}
+
+.report-page {
+    margin: 20px auto;
+    background-color: white;
+    box-shadow: 0 0 10px rgba(0,0,0,0.1);
+    position: relative;
+    border: 1px solid #ccc;
+}
+
+.report-content {
+    margin: 0 auto;
+    position: relative;
+    background-color: white;
+}
+
+.section {
+    position: relative;
+    border-bottom: 1px dashed #ccc;
+    overflow: visible;
+}
+
+.section-label {
+    position: absolute;
+    left: -120px;
+    top: 5px;
+    width: 110px;
+    font-size: 11px;
+    color: #999;
+    text-align: right;
+    font-weight: bold;
+}
+
+.section-content {
+    position: relative;
+    width: 100%;
+    height: 100%;
+}
+
+.section-reportheader {
+    background-color: #f8f9fa;
+}
+
+.section-pageheader {
+    background-color: #e9ecef;
+    font-weight: bold;
+}
+
+.section-groupheader {
+    background-color: #dee2e6;
+}
+
+.section-detail {
+    background-color: white;
+}
+
+.section-groupfooter {
+    background-color: #dee2e6;
+}
+
+.section-pagefooter {
+    background-color: #e9ecef;
+}
+
+.section-reportfooter {
+    background-color: #f8f9fa;
+}
+
+.field {
+    position: absolute;
+    display: flex;
+    overflow: hidden;
+    white-space: nowrap;
+    padding: 2px 4px;
+    border: 1px solid transparent;
+    transition: all 0.2s;
+}
+
+.field:hover {
+    border: 1px solid #007bff;
+    background-color: rgba(0, 123, 255, 0.1);
+    z-index: 10;
+}
+
+.field-database {
+    color: #0066cc;
+}
+
+.field-formula {
+    color: #cc6600;
+}
+
+.field-parameter {
+    color: #009900;
+}
+
+.field-special {
+    color: #666666;
+    font-style: italic;
+}
+
+.preview-footer {
+    margin-top: 20px;
+    padding-top: 15px;
+    border-top: 1px solid #dee2e6;
+    font-size: 12px;
+    color: #6c757d;
+    text-align: center;
+}
+
+.preview-footer p {
+    margin-bottom: 5px;
+}
+
+@media print {
+    body {
+        background-color: white;
+        padding: 0;
+    }
+
+    .preview-container {
+        box-shadow: none;
+        border-radius: 0;
+    }
+
+    .preview-header,
+    .preview-footer,
+    .warnings {
+        display: none;
+    }
+
+    .section-label {
+        display: none;
+    }
+
+    .report-page {
+        box-shadow: none;
+        border: none;
+        margin: 0;
+    }
+}
+"""
+
+# Preview document, split where the stylesheet, metadata, warnings and
+# sections are inserted
+_DOC_HEAD = """<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>{title} - Preview</title>
+    <style>
+        """
+_DOC_HEADER = """
+    </style>
+</head>
+<body>
+    <div class="preview-container">
+        <div class="preview-header">
+            <h1>Report Preview: {title}</h1>
+            """
+_DOC_HEADER_END = """
+        </div>
+
+        """
+_DOC_PAGE = """
+
+        <div class="report-page" style="width: {page_width}px; height: {page_height}px;">
+            <div class="report-content" style="width: {content_width}px; height: {content_height}px;">
+                """
+_DOC_FOOTER = """
+            </div>
+        </div>
+
+        <div class="preview-footer">
+            <p>This is a preview of the converted report layout. Actual data values are not shown.</p>
+            <p>Field positions, fonts, and styling are approximate.</p>
+        </div>
+    </div>
+</body>
+</html>
+"""
+
+# Output directories already created by this process
+_ensured_dirs: set[Path] = set()
+
+
+# Text buffer for previews streamed to disk
+_WRITE_BUFFER_SIZE = 1 << 20
+
+
+def _open_output(output_path: Path, mode: str, **kwargs) -> IO:
+    """Open a preview file for writing, creating its directory the first time it is used.
+
+    Args:
+        output_path: Path to open.
+        mode: Mode passed to open().
+        **kwargs: Other arguments passed to open().
+
+    Returns:
+        Open file object.
+    """
+    parent = output_path.parent
+    if parent not in _ensured_dirs:
+        parent.mkdir(parents=True, exist_ok=True)
+        _ensured_dirs.add(parent)
+
+    try:
+        return open(output_path, mode, **kwargs)
+    except FileNotFoundError:
+        # The directory was removed after it was first created
+        parent.mkdir(parents=True, exist_ok=True)
+        return open(output_path, mode, **kwargs)
+
+
+def _write_output(output_path: Path, data: bytes) -> None:
+    """Write a preview file, creating its directory the first time it is used.
+
+    Args:
+        output_path: Path to write.
+        data: File contents.
+    """
+    with _open_output(output_path, "wb") as f:
+        f.write(data)
+
 
 class HTMLPreviewGenerator:
     """Generates HTML preview of converted reports."""
@@ -33,13 +392,70 @@ class HTMLPreviewGenerator:
         """
         self.logger.info(f"Generating HTML preview for: {report.name}")
 
-        html_content = self._generate_html(report)
-
-        output_path.parent.mkdir(parents=True, exist_ok=True)
-        output_path.write_text(html_content, encoding="utf-8")
+        # Stream the document to disk instead of building it in memory first
+        f = _open_output(
+            output_path, "w", encoding="utf-8", newline="", buffering=_WRITE_BUFFER_SIZE
+        )
+        try:
+            with f:
+                self._write_html(report, f.write)
+        except BaseException:
+            # Do not leave a truncated preview behind
+            output_path.unlink(missing_ok=True)
+            raise
 
         self.logger.info(f"Preview written to: {output_path}")
 
+    def generate_many(self, jobs: Iterable[tuple[ReportModel, Path]], workers: int = 4) -> None:
+        """Generate HTML preview files for several reports.
+
+        Rendering runs on the calling thread while a small thread pool writes
+        the finished files, so disk I/O overlaps with rendering the next
+        report.
+
+        Args:
+            jobs: (report, output_path) pairs.
+            workers: Number of writer threads.
+        """
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="html-preview") as executor:
+            writes = []
+            for report, output_path in jobs:
+                self.logger.info(f"Generating HTML preview for: {report.name}")
+                html_bytes = self._generate_html(report).encode("utf-8")
+                writes.append(
+                    (output_path, executor.submit(_write_output, output_path, html_bytes))
+                )
+
+            for output_path, write in writes:
+                write.result()
+                self.logger.info(f"Preview written to: {output_path}")
+
+    def generate_parallel(
+        self, jobs: Iterable[tuple[ReportModel, Path]], workers: Optional[int] = None
+    ) -> None:
+        """Generate HTML preview files for several reports in worker processes.
+
+        Rendering is CPU-bound, so spreading reports over processes uses every
+        core. Reports are pickled to the workers; for a few small reports
+        generate_many is cheaper.
+
+        Args:
+            jobs: (report, output_path) pairs.
+            workers: Number of worker processes. Defaults to the CPU count.
+        """
+        jobs = list(jobs)
+        workers = min(workers or os.cpu_count() or 1, len(jobs))
+        if workers <= 1:
+            self.generate_many(jobs)
+            return
+
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=multiprocessing.get_context("spawn"),
+        ) as executor:
+            for output_path in executor.map(_generate_preview, jobs):
+                self.logger.info(f"Preview written to: {output_path}")
+
     def _generate_html(self, report: ReportModel) -> str:
         """Generate complete HTML document.
 
@@ -49,6 +465,17 @@ class HTMLPreviewGenerator:
         Returns:
             HTML string.
         """
+        out: list[str] = []
+        self._write_html(report, out.append)
+        return "".join(out)
+
+    def _write_html(self, report: ReportModel, write: Callable[[str], object]) -> None:
+        """Render the complete HTML document piece by piece.
+
+        Args:
+            report: Report model to preview.
+            write: Called with each successive piece of the document.
+        """
         # Calculate page dimensions
         page_width = 612.0  # 8.5 inches in points (72 points/inch)
         page_height = 792.0  # 11 inches in points
@@ -64,111 +491,87 @@ class HTMLPreviewGenerator:
             page_height - (report.metadata.top_margin + report.metadata.bottom_margin) * 72
         )
 
-        # Build HTML sections
-        sections_html = []
+        ns = {
+            "title": _esc_fast(report.name),
+            "page_width": page_width,
+            "page_height": page_height,
+            "content_width": content_width,
+            "content_height": content_height,
+        }
 
-        # Render each section
-        for section in report.sections:
-            section_html = self._render_section(section, content_width)
-            if section_html:
-                sections_html.append(section_html)
+        write(_DOC_HEAD.format_map(ns))
+        self._generate_css(page_width, page_height, content_width, write)
+        write(_DOC_HEADER.format_map(ns))
 
-        # Generate metadata info
-        metadata_html = self._render_metadata(report)
+        # Metadata info; the header comes before the sections, so count fields
+        # from the section lists rather than while rendering them
+        field_count = sum(len(section.fields) for section in report.sections)
+        self._render_metadata(report, len(report.sections), field_count, write)
+        write(_DOC_HEADER_END)
 
-        # Generate warnings if any
-        warnings_html = ""
+        # Warnings if any
         if report.conversion_notes or report.unsupported_features:
-            warnings_html = self._render_warnings(report)
-
-        # Build complete document
-        html = f"""<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>{escape(report.name)} - Preview</title>
-    <style>
-        {self._generate_css(page_width, page_height, content_width)}
-    </style>
-</head>
-<body>
-    <div class="preview-container">
-        <div class="preview-header">
-            <h1>Report Preview: {escape(report.name)}</h1>
-            {metadata_html}
-        </div>
+            self._render_warnings(report, write)
 
-        {warnings_html}
+        write(_DOC_PAGE.format_map(ns))
 
-        <div class="report-page" style="width: {page_width}px; height: {page_height}px;">
-            <div class="report-content" style="width: {content_width}px; height: {content_height}px;">
-                {''.join(sections_html)}
-            </div>
-        </div>
+        # Render each section
+        for section in report.sections:
+            self._render_section(section, content_width, write)
 
-        <div class="preview-footer">
-            <p>This is a preview of the converted report layout. Actual data values are not shown.</p>
-            <p>Field positions, fonts, and styling are approximate.</p>
-        </div>
-    </div>
-</body>
-</html>
-"""
-        return html
+        write(_DOC_FOOTER)
 
-    def _render_section(self, section: Section, content_width: float) -> str:
+    def _render_section(
+        self, section: Section, content_width: float, write: Callable[[str], object]
+    ) -> None:
         """Render a report section as HTML.
 
+        The section is assembled in a StringIO and passed to write in one piece.
+
         Args:
             section: Section to render.
             content_width: Width of content area.
-
-        Returns:
-            HTML string for the section.
+            write: Called with each piece of HTML.
         """
         if section.suppress:
-            return ""
+            return
 
         # Determine section class and label
-        section_classes = ["section", f"section-{section.section_type.value.lower()}"]
-        section_label = section.section_type.value.replace("_", " ").title()
+        section_class = _SECTION_CLASSES[section.section_type]
+        section_label = _SECTION_LABELS[section.section_type]
 
         if section.group_number is not None:
             section_label += f" {section.group_number}"
 
-        # Render fields
-        fields_html = []
-        for field in section.fields:
-            field_html = self._render_field(field)
-            if field_html:
-                fields_html.append(field_html)
-
         # Background color
         bg_style = ""
         if section.background_color:
             bg_style = f"background-color: {section.background_color};"
 
-        section_html = f"""
-        <div class="{' '.join(section_classes)}"
+        buf = StringIO()
+        buf.write(f"""
+        <div class="{section_class}"
              style="height: {section.height}px; width: {content_width}px; {bg_style}">
-            <div class="section-label">{escape(section_label)}</div>
+            <div class="section-label">{section_label}</div>
             <div class="section-content">
-                {''.join(fields_html)}
+                """)
+
+        # Render fields
+        for field in section.fields:
+            self._render_field(field, buf.write)
+
+        buf.write("""
             </div>
         </div>
-        """
-
-        return section_html
+        """)
+        write(buf.getvalue())
 
-    def _render_field(self, field: Field) -> str:
+    def _render_field(self, field: Field, write: Callable[[str], object]) -> None:
         """Render a field as HTML element.
 
         Args:
             field: Field to render.
-
-        Returns:
-            HTML string for the field.
+            write: Called with each piece of HTML.
         """
         # Build style attributes
         styles = [
@@ -183,13 +586,7 @@ class HTMLPreviewGenerator:
         ]
 
         # Font styles
-        font_weight = "bold" if field.font.bold else "normal"
-        font_style = "italic" if field.font.italic else "normal"
-        styles.append(f"font-weight: {font_weight}")
-        styles.append(f"font-style: {font_style}")
-
-        if field.font.underline:
-            styles.append("text-decoration: underline")
+        styles.append(_FONT_STYLES[field.font.bold, field.font.italic, field.font.underline])
 
         # Background color
         if field.background_color:
@@ -200,26 +597,24 @@ class HTMLPreviewGenerator:
             styles.append(f"border: 1px solid #000")
 
         # Vertical alignment
-        v_align_map = {
-            "top": "flex-start",
-            "middle": "center",
-            "bottom": "flex-end",
-        }
-        v_align = v_align_map.get(field.format.vertical_alignment, "flex-start")
+        v_align = _VERTICAL_ALIGNMENT.get(field.format.vertical_alignment, "flex-start")
         styles.append(f"align-items: {v_align}")
 
         # Display value based on source type
         display_value = self._get_field_display_value(field)
 
-        field_html = f"""
-        <div class="field field-{field.source_type}"
-             style="{'; '.join(styles)}"
-             title="{escape(field.source)}">
-            {escape(display_value)}
-        </div>
-        """
-
-        return field_html
+        for piece in (
+            '<div class="field field-',
+            field.source_type,
+            '" style="',
+            "; ".join(styles),
+            '" title="',
+            _esc(field.source),
+            '">',
+            _esc(display_value),
+            "</div>",
+        ):
+            write(piece)
 
     def _get_field_display_value(self, field: Field) -> str:
         """Get display value for a field.
@@ -230,333 +625,112 @@ class HTMLPreviewGenerator:
         Returns:
             Display string.
         """
-        if field.source_type == "database":
-            # Show column name in curly braces
-            return f"{{{field.source}}}"
-        elif field.source_type == "formula":
-            # Show formula name
-            return f"@{field.source}"
-        elif field.source_type == "parameter":
-            # Show parameter name
-            return f"?{field.source}"
-        elif field.source_type == "special":
-            # Show special field type
-            return f"{field.source}"
-        else:
+        affixes = _DISPLAY_AFFIXES.get(field.source_type)
+        if affixes is None:
             # Text field or unknown
             return field.name if field.name else field.source
 
-    def _render_metadata(self, report: ReportModel) -> str:
+        prefix, suffix = affixes
+        return f"{prefix}{field.source}{suffix}"
+
+    def _render_metadata(
+        self,
+        report: ReportModel,
+        section_count: int,
+        field_count: int,
+        write: Callable[[str], object],
+    ) -> None:
         """Render report metadata section.
 
         Args:
             report: Report model.
-
-        Returns:
-            HTML string.
+            section_count: Number of sections in the report.
+            field_count: Number of fields across all sections.
+            write: Called with each piece of HTML.
         """
         metadata = report.metadata
 
+        # Optional items, placed before and after the page settings
+        title_items = (
+            [f"<strong>Title:</strong> {_esc_fast(metadata.title)}"] if metadata.title else []
+        )
+        author_items = (
+            [f"<strong>Author:</strong> {_esc_fast(metadata.author)}"] if metadata.author else []
+        )
+
+        # Complexity score
+        complexity = report.get_complexity_score()
+        complexity_color = "green" if complexity <= 3 else "orange" if complexity <= 6 else "red"
+
         metadata_items = [
+            *title_items,
             f"<strong>Paper Size:</strong> {metadata.paper_size}",
             f"<strong>Orientation:</strong> {metadata.page_orientation}",
             f'<strong>Margins:</strong> L:{metadata.left_margin}" R:{metadata.right_margin}" '
             f'T:{metadata.top_margin}" B:{metadata.bottom_margin}"',
-        ]
-
-        if metadata.title:
-            metadata_items.insert(0, f"<strong>Title:</strong> {escape(metadata.title)}")
-
-        if metadata.author:
-            metadata_items.append(f"<strong>Author:</strong> {escape(metadata.author)}")
-
-        # Add complexity score
-        complexity = report.get_complexity_score()
-        complexity_color = "green" if complexity <= 3 else "orange" if complexity <= 6 else "red"
-        metadata_items.append(
+            *author_items,
             f"<strong>Complexity Score:</strong> "
-            f"<span style='color: {complexity_color}'>{complexity}/10</span>"
-        )
-
-        # Add counts
-        metadata_items.append(f"<strong>Sections:</strong> {len(report.sections)}")
-        metadata_items.append(f"<strong>Fields:</strong> {len(report.get_all_fields())}")
-        metadata_items.append(f"<strong>Formulas:</strong> {len(report.formulas)}")
-        metadata_items.append(f"<strong>Parameters:</strong> {len(report.parameters)}")
-        metadata_items.append(f"<strong>Groups:</strong> {len(report.groups)}")
+            f"<span style='color: {complexity_color}'>{complexity}/10</span>",
+            f"<strong>Sections:</strong> {section_count}",
+            f"<strong>Fields:</strong> {field_count}",
+            f"<strong>Formulas:</strong> {len(report.formulas)}",
+            f"<strong>Parameters:</strong> {len(report.parameters)}",
+            f"<strong>Groups:</strong> {len(report.groups)}",
+        ]
 
-        return f"""
+        write(f"""
         <div class="metadata">
             {' | '.join(metadata_items)}
         </div>
-        """
+        """)
 
-    def _render_warnings(self, report: ReportModel) -> str:
+    def _render_warnings(self, report: ReportModel, write: Callable[[str], object]) -> None:
         """Render warnings and conversion notes.
 
         Args:
             report: Report model.
-
-        Returns:
-            HTML string.
+            write: Called with each piece of HTML.
         """
-        items = []
-
+        warnings_html = ""
         if report.unsupported_features:
-            items.append("<div class='warning-section'>")
-            items.append("<h3>Unsupported Features</h3>")
-            items.append("<ul>")
-            for feature in report.unsupported_features:
-                items.append(f"<li>{escape(feature)}</li>")
-            items.append("</ul>")
-            items.append("</div>")
+            warn_items = "".join([f"<li>{_esc_fast(f)}</li>" for f in report.unsupported_features])
+            warnings_html = (
+                "<div class='warning-section'><h3>Unsupported Features</h3>"
+                f"<ul>{warn_items}</ul></div>"
+            )
 
+        notes_html = ""
         if report.conversion_notes:
-            items.append("<div class='notes-section'>")
-            items.append("<h3>Conversion Notes</h3>")
-            items.append("<ul>")
-            for note in report.conversion_notes:
-                items.append(f"<li>{escape(note)}</li>")
-            items.append("</ul>")
-            items.append("</div>")
-
-        if items:
-            return f"""
+            note_items = "".join([f"<li>{_esc_fast(n)}</li>" for n in report.conversion_notes])
+            notes_html = (
+                "<div class='notes-section'><h3>Conversion Notes</h3>"
+                f"<ul>{note_items}</ul></div>"
+            )
+
+        if warnings_html or notes_html:
+            write(f"""
             <div class="warnings">
-                {''.join(items)}
+                {warnings_html}{notes_html}
             </div>
-            """
-        return ""
+            """)
 
     def _generate_css(
         self,
         page_width: float,
         page_height: float,
         content_width: float,
-    ) -> str:
+        write: Callable[[str], object],
+    ) -> None:
         """Generate CSS for report styling.
 
         Args:
             page_width: Width of page in pixels.
             page_height: Height of page in pixels.
             content_width: Width of content area in pixels.
-
-        Returns:
-            CSS string.
-        """
-        css = f"""
-        * {{
-            margin: 0;
-            padding: 0;
-            box-sizing: border-box;
-        }}
-
-        body {{
-            font-family: Arial, sans-serif;
-            background-color: #f5f5f5;
-            padding: 20px;
-        }}
-
-        .preview-container {{
-            max-width: {page_width + 100}px;
-            margin: 0 auto;
-            background-color: white;
-            padding: 20px;
-            border-radius: 8px;
-            box-shadow: 0 2px 8px rgba(0,0,0,0.1);
-        }}
-
-        .preview-header {{
-            margin-bottom: 20px;
-            padding-bottom: 15px;
-            border-bottom: 2px solid #333;
-        }}
-
-        .preview-header h1 {{
-            font-size: 24px;
-            color: #333;
-            margin-bottom: 10px;
-        }}
-
-        .metadata {{
-            font-size: 12px;
-            color: #666;
-            line-height: 1.6;
-        }}
-
-        .warnings {{
-            background-color: #fff3cd;
-            border: 1px solid #ffc107;
-            border-radius: 4px;
-            padding: 15px;
-            margin-bottom: 20px;
-        }}
-
-        .warnings h3 {{
-            font-size: 14px;
-            color: #856404;
-            margin-bottom: 8px;
-        }}
-
-        .warnings ul {{
-            margin-left: 20px;
-            font-size: 12px;
-            color: #856404;
-        }}
-
-        .warnings li {{
-            margin-bottom: 4px;
-        }}
-
-        .warning-section {{
-            margin-bottom: 15px;
-        }}
-
-        .notes-section {{
-            margin-bottom: 15px;
-        }}
-
-        .report-page {{
-            margin: 20px auto;
-            background-color: white;
-            box-shadow: 0 0 10px rgba(0,0,0,0.1);
-            position: relative;
-            border: 1px solid #ccc;
-        }}
-
-        .report-content {{
-            margin: 0 auto;
-            position: relative;
-            background-color: white;
-        }}
-
-        .section {{
-            position: relative;
-            border-bottom: 1px dashed #ccc;
-            overflow: visible;
-        }}
-
-        .section-label {{
-            position: absolute;
-            left: -120px;
-            top: 5px;
-            width: 110px;
-            font-size: 11px;
-            color: #999;
-            text-align: right;
-            font-weight: bold;
-        }}
-
-        .section-content {{
-            position: relative;
-            width: 100%;
-            height: 100%;
-        }}
-
-        .section-reportheader {{
-            background-color: #f8f9fa;
-        }}
-
-        .section-pageheader {{
-            background-color: #e9ecef;
-            font-weight: bold;
-        }}
-
-        .section-groupheader {{
-            background-color: #dee2e6;
-        }}
-
-        .section-detail {{
-            background-color: white;
-        }}
-
-        .section-groupfooter {{
-            background-color: #dee2e6;
-        }}
-
-        .section-pagefooter {{
-            background-color: #e9ecef;
-        }}
-
-        .section-reportfooter {{
-            background-color: #f8f9fa;
-        }}
-
-        .field {{
-            position: absolute;
-            display: flex;
-            overflow: hidden;
-            white-space: nowrap;
-            padding: 2px 4px;
-            border: 1px solid transparent;
-            transition: all 0.2s;
-        }}
-
-        .field:hover {{
-            border: 1px solid #007bff;
-            background-color: rgba(0, 123, 255, 0.1);
-            z-index: 10;
-        }}
-
-        .field-database {{
-            color: #0066cc;
-        }}
-
-        .field-formula {{
-            color: #cc6600;
-        }}
-
-        .field-parameter {{
-            color: #009900;
-        }}
-
-        .field-special {{
-            color: #666666;
-            font-style: italic;
-        }}
-
-        .preview-footer {{
-            margin-top: 20px;
-            padding-top: 15px;
-            border-top: 1px solid #dee2e6;
-            font-size: 12px;
-            color: #6c757d;
-            text-align: center;
-        }}
-
-        .preview-footer p {{
-            margin-bottom: 5px;
-        }}
-
-        @media print {{
-            body {{
-                background-color: white;
-                padding: 0;
-            }}
-
-            .preview-container {{
-                box-shadow: none;
-                border-radius: 0;
-            }}
-
-            .preview-header,
-            .preview-footer,
-            .warnings {{
-                display: none;
-            }}
-
-            .section-label {{
-                display: none;
-            }}
-
-            .report-page {{
-                box-shadow: none;
-                border: none;
-                margin: 0;
-            }}
-        }}
+            write: Called with each piece of CSS.
         """
-        return css
+        write(f":root {{ --page-width: {page_width}px; }}\n")
+        write(_CSS_STATIC)
 
     def generate_from_xml(self, xml_path: Path, output_path: Path) -> None:
         """Generate HTML preview from Oracle XML file.
@@ -588,8 +762,7 @@ class HTMLPreviewGenerator:
             else:
                 html_content = self._generate_xml_preview_html(report_name, layout_elem)
 
-            output_path.parent.mkdir(parents=True, exist_ok=True)
-            output_path.write_text(html_content, encoding="utf-8")
+            _write_output(output_path, html_content.encode("utf-8"))
 
             self.logger.info(f"Preview written to: {output_path}")
 
@@ -611,7 +784,7 @@ class HTMLPreviewGenerator:
 <html lang="en">
 <head>
     <meta charset="UTF-8">
-    <title>{escape(report_name)} - Preview</title>
+    <title>{_esc_fast(report_name)} - Preview</title>
     <style>
         body {{ font-family: Arial, sans-serif; padding: 40px; background-color: #f5f5f5; }}
         .container {{ max-width: 800px; margin: 0 auto; background: white; padding: 30px; border-radius: 8px; }}
@@ -621,8 +794,8 @@ class HTMLPreviewGenerator:
 </head>
 <body>
     <div class="container">
-        <h1>{escape(report_name)}</h1>
-        <p>{escape(message)}</p>
+        <h1>{_esc_fast(report_name)}</h1>
+        <p>{_esc_fast(message)}</p>
     </div>
 </body>
 </html>
@@ -643,10 +816,12 @@ class HTMLPreviewGenerator:
 
         for section in layout_elem.findall(".//section"):
             section_name = section.get("name", "unknown")
-            sections_html.append(f"<h3>Section: {escape(section_name)}</h3>")
+            sections_html.append(f"<h3>Section: {_esc(section_name)}</h3>")
 
-            # Show frames
-            for frame in section.findall(".//frame") + section.findall(".//repeatingFrame"):
+            # Show frames, in document order, from a single walk of the section
+            for frame in section.iter():
+                if frame.tag not in _FRAME_TAGS:
+                    continue
                 frame_name = frame.get("name", "unknown")
                 frame_type = frame.tag
                 width = frame.get("width", "?")
@@ -654,7 +829,7 @@ class HTMLPreviewGenerator:
 
                 sections_html.append(
                     f"<div class='frame-info'>"
-                    f"<strong>{escape(frame_type)}:</strong> {escape(frame_name)} "
+                    f"<strong>{_esc(frame_type)}:</strong> {_esc(frame_name)} "
                     f"({width}x{height})"
                     f"</div>"
                 )
@@ -664,15 +839,15 @@ class HTMLPreviewGenerator:
                     field_name = field.get("name", "unknown")
                     field_source = field.get("source", "")
                     sections_html.append(
-                        f"<div class='field-info'>Field: {escape(field_name)} "
-                        f"({escape(field_source)})</div>"
+                        f"<div class='field-info'>Field: {_esc(field_name)} "
+                        f"({_esc(field_source)})</div>"
                     )
 
         html = f"""<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
-    <title>{escape(report_name)} - XML Preview</title>
+    <title>{_esc_fast(report_name)} - XML Preview</title>
     <style>
         body {{ font-family: Arial, sans-serif; padding: 20px; background-color: #f5f5f5; }}
         .container {{ max-width: 900px; margin: 0 auto; background: white; padding: 30px; border-radius: 8px; }}
@@ -684,7 +859,7 @@ class HTMLPreviewGenerator:
 </head>
 <body>
     <div class="container">
-        <h1>Oracle XML Preview: {escape(report_name)}</h1>
+        <h1>Oracle XML Preview: {_esc_fast(report_name)}</h1>
         <p style="color: #666; margin-bottom: 20px;">
             This is a structural preview of the Oracle Reports XML layout.
         </p>
@@ -694,3 +869,17 @@ class HTMLPreviewGenerator:
 </html>
 """
         return html
+
+
+def _generate_preview(job: tuple[ReportModel, Path]) -> Path:
+    """Worker entry point for HTMLPreviewGenerator.generate_parallel.
+
+    Args:
+        job: (report, output_path) pair.
+
+    Returns:
+        Path of the written preview.
+    """
+    report, output_path = job
+    HTMLPreviewGenerator().generate(report, output_path)
+    return output_path
@@ -4,9 +4,10 @@ Oracle Reports XML Generator for RPT to RDF Converter.
 Generates Oracle Reports 12c XML format from transformed report data.
 """
 
-import xml.etree.ElementTree as ET
-from typing import Optional
-from xml.dom import minidom
+import re
+from functools import lru_cache
+from pathlib import Path
+from typing import Callable, Optional, Union
 
 from ..transformation.condition_mapper import FormatTrigger
 from ..transformation.formula_translator import TranslatedFormula
@@ -20,6 +21,492 @@ from ..transformation.transformer import (
 )
 from ..utils.logger import get_logger
 
+try:
+    # lxml builds and serializes trees considerably faster than the stdlib
+    from lxml import etree as ET
+except ImportError:  # pragma: no cover - lxml is a declared dependency
+    import xml.etree.ElementTree as ET
+
+# Buffer size for writing XML files
+_WRITE_BUFFER_SIZE = 1 << 20
+
+# Declaration written at the top of every generated file
+_XML_DECLARATION = "<?xml version='1.0' encoding='UTF-8'?>\n"
+
+# Indentation per nesting level
+_INDENT = "  "
+
+# Oracle Reports datatype for common Oracle base type names
+_DATATYPES = {
+    "number": "number",
+    "date": "date",
+    "timestamp": "date",
+    "clob": "long",
+    "nclob": "long",
+    "blob": "long",
+    "long": "long",
+    "varchar2": "character",
+    "varchar": "character",
+    "nvarchar2": "character",
+    "char": "character",
+    "nchar": "character",
+}
+
+# PL/SQL stub for running a subreport through SRW.RUN_REPORT
+_SUBREPORT_PROCEDURE = """procedure RUN_{oracle_name}({params}) is
+  v_report_id   VARCHAR2(100);
+  v_report_name VARCHAR2(100) := '{name}';
+begin
+  -- TODO: Update report path to point to converted RDF file
+  -- This is a template for calling a subreport using SRW.RUN_REPORT
+  /*
+  v_report_id := SRW.RUN_REPORT(
+    'report=' || v_report_name ||
+    {report_params} ||
+    ' destype=cache'
+  );
+  */
+  NULL; -- Placeholder: implement subreport call
+end RUN_{oracle_name};"""
+
+# PL/SQL stub for initializing a chart through the OG package
+_CHART_PROCEDURE = """procedure INIT_{oracle_name} is
+  -- Initialize chart: {name}
+  -- Chart Type: {chart_type}
+begin
+  -- TODO: Implement using Oracle BI Graph API
+  -- Example using OG package:
+  /*
+  OG.SetChartType('{oracle_name}', '{chart_type}');
+  OG.SetDataQuery('{oracle_name}',
+    'SELECT {category_column} category, '
+    || '{value_columns} value '
+    || 'FROM your_data_source');
+  {set_3d}
+  {set_title}
+  OG.SetLegendPosition('{oracle_name}', '{legend_position}');
+  */
+  NULL; -- Placeholder: implement chart initialization
+end INIT_{oracle_name};"""
+
+# PL/SQL stub outlining the query behind a cross-tab
+_CROSSTAB_PROCEDURE = """procedure QUERY_{oracle_name} is
+  -- Cross-tab query for: {name}
+  -- Row dimensions: {row_cols}
+  -- Column dimensions: {col_cols}
+begin
+  -- TODO: Implement cross-tab query using one of these approaches:
+  --
+  -- Option 1: Oracle PIVOT (11g+)
+  /*
+  SELECT *
+  FROM (
+    SELECT {row_cols}, {col_cols}, {agg_list}
+    FROM your_source_table
+    GROUP BY {row_cols}, {col_cols}
+  )
+  PIVOT (
+    {agg_list}
+    FOR {col_cols} IN (/* distinct column values */)
+  );
+  */
+  --
+  -- Option 2: DECODE method (pre-11g)
+  /*
+  SELECT {row_cols},
+         SUM(DECODE({col_cols}, 'value1', measure, 0)) AS col_value1,
+         SUM(DECODE({col_cols}, 'value2', measure, 0)) AS col_value2
+  FROM your_source_table
+  GROUP BY {row_cols};
+  */
+  NULL; -- Placeholder: implement cross-tab query
+end QUERY_{oracle_name};"""
+
+# Start of a layout field element, up to the optional attributes
+_FIELD_START = (
+    '<field name="%s" source="%s" x="%s" y="%s" width="%s" height="%s" fontName="%s"'
+    ' fontSize="%s" fontStyle="%s" horizontalAlignment="%s" verticalAlignment="%s"'
+)
+
+# "--" may not appear inside an XML comment
+_COMMENT_DASHES = re.compile("-(?=-)")
+
+# Control characters and noncharacters XML 1.0 does not allow, escaped or not
+_XML_INVALID_CHARS = r"\x00-\x08\x0b\x0c\x0e-\x1f\ufffe\uffff"
+_has_invalid_char = re.compile(f"[{_XML_INVALID_CHARS}]").search
+
+# Same message lxml raises when given such a character
+_INVALID_CHAR_MESSAGE = (
+    "All strings must be XML compatible: Unicode or ASCII, no NULL bytes or control characters"
+)
+
+# Characters that need escaping (or rejecting) in text and in attribute values
+_needs_text_escape = re.compile(f"[&<>\r{_XML_INVALID_CHARS}]").search
+_needs_attr_escape = re.compile(f'[&<>"\n\r\t{_XML_INVALID_CHARS}]').search
+
+
+@lru_cache(maxsize=4096)
+def _int_str(value: float) -> str:
+    """Format a coordinate as an integer string.
+
+    Aligned layouts repeat the same coordinates many times, so the strings
+    are cached and shared.
+    """
+    return str(int(value))
+
+
+def _escape_text(s: str) -> str:
+    """Escape element text the way lxml serializes it.
+
+    Raises:
+        ValueError: If the text holds a character XML does not allow.
+    """
+    if not _needs_text_escape(s):
+        return s
+    if _has_invalid_char(s):
+        raise ValueError(_INVALID_CHAR_MESSAGE)
+    return s.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;").replace("\r", "&#13;")
+
+
+def _escape_attr(s: str) -> str:
+    """Escape an attribute value the way lxml serializes it.
+
+    Chained str.replace is used rather than str.translate: translate takes a
+    slow per-character path when the table maps to multi-character strings.
+
+    Raises:
+        ValueError: If the value holds a character XML does not allow.
+    """
+    if not _needs_attr_escape(s):
+        return s
+    if _has_invalid_char(s):
+        raise ValueError(_INVALID_CHAR_MESSAGE)
+    return (
+        s.replace("&", "&amp;")
+        .replace("<", "&lt;")
+        .replace(">", "&gt;")
+        .replace('"', "&quot;")
+        .replace("\n", "&#10;")
+        .replace("\r", "&#13;")
+        .replace("\t", "&#9;")
+    )
+
+
+def _frame_start(frame: OracleFrame) -> tuple[str, dict[str, str]]:
+    """Build the tag and attributes of a layout frame element."""
+    # Determine element type
+    if frame.frame_type == "repeating":
+        return "repeatingFrame", {
+            "name": frame.name,
+            "source": frame.source_group or "",
+            "x": _int_str(frame.x),
+            "y": _int_str(frame.y),
+            "width": _int_str(frame.width),
+            "height": _int_str(frame.height),
+            "verticalElasticity": frame.vertical_elasticity,
+            "horizontalElasticity": frame.horizontal_elasticity,
+            "printDirection": frame.print_direction,
+        }
+
+    return "frame", {
+        "name": frame.name,
+        "x": _int_str(frame.x),
+        "y": _int_str(frame.y),
+        "width": _int_str(frame.width),
+        "height": _int_str(frame.height),
+        "verticalElasticity": frame.vertical_elasticity,
+        "horizontalElasticity": frame.horizontal_elasticity,
+    }
+
+
+def _field_attrs(field: OracleField) -> dict[str, str]:
+    """Build the attributes of a layout field element."""
+    attrs = {
+        "name": field.name,
+        "source": field.source,
+        "x": _int_str(field.x),
+        "y": _int_str(field.y),
+        "width": _int_str(field.width),
+        "height": _int_str(field.height),
+        "fontName": field.font_name,
+        "fontSize": str(field.font_size),
+        "fontStyle": field.font_style,
+        "horizontalAlignment": field.horizontal_alignment,
+        "verticalAlignment": field.vertical_alignment,
+    }
+
+    if field.format_mask:
+        attrs["formatMask"] = field.format_mask
+
+    if not field.visible:
+        attrs["visible"] = "no"
+
+    # Add format trigger reference if present
+    if field.format_trigger:
+        attrs["formatTrigger"] = field.format_trigger
+
+    return attrs
+
+
+def _comment_text(text: str) -> str:
+    """Break up any "--" in comment text.
+
+    Raises:
+        ValueError: If the text holds a character XML does not allow.
+    """
+    if _has_invalid_char(text):
+        raise ValueError(_INVALID_CHAR_MESSAGE)
+    return _COMMENT_DASHES.sub("- ", text)
+
+
+# Batch conversions of similar reports produce the same procedures many
+# times over, so the PL/SQL builders below cache their results.
+
+
+@lru_cache(maxsize=256)
+def _subreport_plsql(oracle_name: str, name: str, links: tuple[tuple[str, str], ...]) -> str:
+    """Build the helper procedure that runs a subreport.
+
+    Args:
+        oracle_name: Oracle name of the subreport.
+        name: Original subreport name.
+        links: (parent column, subreport parameter) pairs.
+
+    Returns:
+        PL/SQL procedure source.
+    """
+    # Build the parameter list and the SRW.RUN_REPORT arguments together
+    params = []
+    param_assignments = []
+    for parent_col, sr_param in links:
+        arg = f"p_{parent_col.lower()}"
+        params.append(f"{arg} IN VARCHAR2")
+        param_assignments.append(f"'{sr_param}='||{arg}")
+
+    if param_assignments:
+        report_params = "'&' || " + " || '&' || ".join(param_assignments)
+    else:
+        report_params = "''"
+
+    return _SUBREPORT_PROCEDURE.format(
+        oracle_name=oracle_name,
+        name=name,
+        params=", ".join(params),
+        report_params=report_params,
+    )
+
+
+@lru_cache(maxsize=256)
+def _chart_plsql(
+    oracle_name: str,
+    name: str,
+    chart_type: str,
+    category_column: Optional[str],
+    value_columns: tuple[str, ...],
+    is_3d: bool,
+    title: Optional[str],
+    legend_position: str,
+) -> str:
+    """Build the procedure that initializes a chart.
+
+    Args:
+        oracle_name: Oracle name of the chart.
+        name: Original chart name.
+        chart_type: Oracle chart type.
+        category_column: Column for the category axis.
+        value_columns: Columns plotted as values.
+        is_3d: Whether the chart is drawn in 3D.
+        title: Chart title.
+        legend_position: Where the legend is placed.
+
+    Returns:
+        PL/SQL procedure source.
+    """
+    return _CHART_PROCEDURE.format(
+        oracle_name=oracle_name,
+        name=name,
+        chart_type=chart_type,
+        category_column=category_column or "CATEGORY",
+        value_columns=", ".join(value_columns) or "VALUE",
+        set_3d=f"OG.Set3D('{oracle_name}', TRUE);" if is_3d else "",
+        set_title=f"OG.SetTitle('{oracle_name}', '{title}');" if title else "",
+        legend_position=legend_position.upper(),
+    )
+
+
+@lru_cache(maxsize=256)
+def _crosstab_plsql(
+    oracle_name: str,
+    name: str,
+    row_columns: tuple[str, ...],
+    column_columns: tuple[str, ...],
+    summaries: tuple[tuple[str, str], ...],
+) -> str:
+    """Build the procedure holding a cross-tab's PIVOT query.
+
+    Args:
+        oracle_name: Oracle name of the cross-tab.
+        name: Original cross-tab name.
+        row_columns: Row dimension columns.
+        column_columns: Column dimension columns.
+        summaries: (aggregate function, column) pairs.
+
+    Returns:
+        PL/SQL procedure source.
+    """
+    # Build column lists
+    row_cols = ", ".join(row_columns) if row_columns else "ROW_DIM"
+    col_cols = ", ".join(column_columns) if column_columns else "COL_DIM"
+
+    # Build aggregation expressions
+    agg_exprs = [f"{func}({col}) AS {col}_AGG" for func, col in summaries]
+    agg_list = ", ".join(agg_exprs) if agg_exprs else "SUM(VALUE) AS VALUE_AGG"
+
+    return _CROSSTAB_PROCEDURE.format(
+        oracle_name=oracle_name,
+        name=name,
+        row_cols=row_cols,
+        col_cols=col_cols,
+        agg_list=agg_list,
+    )
+
+
+class _TreeBuilder(ET.TreeBuilder):
+    """TreeBuilder that builds the generated document as an element tree."""
+
+    def __init__(self):
+        """Initialize the builder, keeping comments in the tree."""
+        super().__init__(insert_comments=True)
+
+    def comment(self, text: str):
+        """Add a comment, breaking up any "--" in the text."""
+        return super().comment(_comment_text(text))
+
+    def leaf(self, tag: str, attrs: dict[str, str], text: Optional[str] = None) -> None:
+        """Add an element without child elements.
+
+        Args:
+            tag: Element tag.
+            attrs: Element attributes.
+            text: Optional element text.
+        """
+        self.start(tag, attrs)
+        if text:
+            self.data(text)
+        self.end(tag)
+
+    def field(self, field: OracleField) -> None:
+        """Add a layout field element."""
+        self.leaf("field", _field_attrs(field))
+
+
+class _XMLWriter:
+    """Writes the generated document as XML text.
+
+    Accepts the same calls as _TreeBuilder and writes the same document that
+    building the tree, optionally indenting it and serializing it with lxml
+    would, but passes each piece straight to the write function.
+    """
+
+    def __init__(self, write: Callable[[str], object], pretty: bool = True):
+        """Initialize the writer.
+
+        Args:
+            write: Function the XML text is passed to.
+            pretty: Whether to put child nodes on their own indented lines.
+        """
+        self._write = write
+        self._pretty = pretty
+        # Whether each open element has child elements so far
+        self._has_children: list[bool] = []
+        # Whether the last start tag still lacks its closing ">"
+        self._pending = False
+
+    def _open_child(self) -> None:
+        """Finish the parent's start tag and indent for a new child node."""
+        if self._pending:
+            self._write(">")
+            self._pending = False
+        if self._has_children:
+            self._has_children[-1] = True
+            if self._pretty:
+                self._write("\n" + _INDENT * len(self._has_children))
+
+    def start(self, tag: str, attrs: dict[str, str]) -> None:
+        """Open an element."""
+        self._open_child()
+        self._write(f"<{tag}" + "".join(f' {k}="{_escape_attr(v)}"' for k, v in attrs.items()))
+        self._pending = True
+        self._has_children.append(False)
+
+    def data(self, text: str) -> None:
+        """Add text to the open element."""
+        if self._pending:
+            self._write(">")
+            self._pending = False
+        self._write(_escape_text(text))
+
+    def end(self, tag: str) -> None:
+        """Close the open element."""
+        has_children = self._has_children.pop()
+        if self._pending:
+            self._write("/>")
+            self._pending = False
+        elif has_children and self._pretty:
+            self._write(f"\n{_INDENT * len(self._has_children)}</{tag}>")
+        else:
+            self._write(f"</{tag}>")
+
+    def comment(self, text: str) -> None:
+        """Add a comment, breaking up any "--" in the text."""
+        self._open_child()
+        self._write(f"<!--{_comment_text(text)}-->")
+
+    def leaf(self, tag: str, attrs: dict[str, str], text: Optional[str] = None) -> None:
+        """Add an element without child elements.
+
+        Args:
+            tag: Element tag.
+            attrs: Element attributes.
+            text: Optional element text.
+        """
+        self.start(tag, attrs)
+        if text:
+            self.data(text)
+        self.end(tag)
+
+    def field(self, field: OracleField) -> None:
+        """Add a layout field element.
+
+        Fields are by far the most numerous elements, so the start tag is
+        filled in from _FIELD_START rather than built from a dict.
+        """
+        self._open_child()
+        tag = _FIELD_START % (
+            _escape_attr(field.name),
+            _escape_attr(field.source),
+            _int_str(field.x),
+            _int_str(field.y),
+            _int_str(field.width),
+            _int_str(field.height),
+            _escape_attr(field.font_name),
+            field.font_size,
+            _escape_attr(field.font_style),
+            _escape_attr(field.horizontal_alignment),
+            _escape_attr(field.vertical_alignment),
+        )
+        if field.format_mask:
+            tag += f' formatMask="{_escape_attr(field.format_mask)}"'
+        if not field.visible:
+            tag += ' visible="no"'
+        if field.format_trigger:
+            tag += f' formatTrigger="{_escape_attr(field.format_trigger)}"'
+        self._write(tag + "/>")
+
+
+# Receives the generated document
+_Builder = Union[_TreeBuilder, _XMLWriter]
+
 
 class OracleXMLGenerator:
     """Generates Oracle Reports 12c XML format."""
@@ -31,19 +518,51 @@ class OracleXMLGenerator:
         """Initialize the XML generator."""
         self.logger = get_logger("oracle_xml_generator")
 
-    def generate(self, report: TransformedReport) -> str:
+    def generate(self, report: TransformedReport, pretty: bool = True) -> str:
         """Generate Oracle Reports XML from transformed report.
 
         Args:
             report: Transformed report data.
+            pretty: Whether to indent the XML. Oracle Reports reads compact
+                XML as well, which is smaller and quicker to produce.
 
         Returns:
             XML string for Oracle Reports.
         """
+        root = self._build_tree(report)
+
+        if pretty:
+            xml_string = self._prettify(root)
+        else:
+            xml_string = self._serialize(root)
+
+        self.logger.info(f"Generated XML: {len(xml_string)} bytes")
+        return xml_string
+
+    def _build_tree(self, report: TransformedReport) -> ET.Element:
+        """Build the Oracle Reports element tree for a transformed report.
+
+        Args:
+            report: Transformed report data.
+
+        Returns:
+            Root report element.
+        """
+        builder = _TreeBuilder()
+        self._generate_report(builder, report)
+        return builder.close()
+
+    def _generate_report(self, b: _Builder, report: TransformedReport) -> None:
+        """Generate the report element and everything in it.
+
+        Args:
+            b: Builder or writer receiving the document.
+            report: Transformed report data.
+        """
         self.logger.info(f"Generating Oracle XML for: {report.name}")
 
         # Create root report element
-        root = ET.Element(
+        b.start(
             "report",
             {
                 "name": report.name,
@@ -52,46 +571,51 @@ class OracleXMLGenerator:
         )
 
         # Generate data model
-        self._generate_data_model(root, report)
+        self._generate_data_model(b, report)
 
         # Generate layout
         if report.layout:
-            self._generate_layout(root, report.layout)
-
-        # Generate program units (formulas and format triggers)
-        if report.formulas or report.format_triggers:
-            self._generate_program_units(root, report.formulas, report.format_triggers)
+            self._generate_layout(b, report.layout)
+
+        # Generate program units (formulas, format triggers and helper procedures)
+        if (
+            report.formulas
+            or report.format_triggers
+            or report.subreports
+            or report.charts
+            or report.crosstabs
+        ):
+            self._generate_program_units(b, report)
 
         # Generate parameter form
         if report.parameters:
-            self._generate_parameter_form(root, report.parameters)
+            self._generate_parameter_form(b, report.parameters)
 
         # Generate subreports section
         if report.subreports:
-            self._generate_subreports(root, report.subreports)
+            self._generate_subreports(b, report.subreports)
 
         # Generate charts section
         if report.charts:
-            self._generate_charts(root, report.charts)
+            self._generate_charts(b, report.charts)
 
         # Generate cross-tabs section
         if report.crosstabs:
-            self._generate_crosstabs(root, report.crosstabs)
-
-        # Convert to string with pretty printing
-        xml_string = self._prettify(root)
+            self._generate_crosstabs(b, report.crosstabs)
 
-        self.logger.info(f"Generated XML: {len(xml_string)} bytes")
-        return xml_string
+        b.end("report")
 
-    def _generate_data_model(self, root: ET.Element, report: TransformedReport) -> None:
+    def _generate_data_model(self, b: _Builder, report: TransformedReport) -> None:
         """Generate the data model section."""
-        data = ET.SubElement(root, "data")
+        # Bound once for the per-column and per-formula loops
+        leaf = b.leaf
+        map_datatype = self._map_datatype
+
+        b.start("data", {})
 
         # Generate data sources/queries
         for query in report.queries:
-            ds = ET.SubElement(
-                data,
+            b.start(
                 "dataSource",
                 {
                     "name": query["name"],
@@ -99,8 +623,8 @@ class OracleXMLGenerator:
             )
 
             # Add SQL
-            select = ET.SubElement(ds, "select")
-            select.text = query.get("sql", "")
+            b.leaf("select", {}, query.get("sql", ""))
+            b.end("dataSource")
 
         # Generate a main detail group if there are queries
         if report.queries:
@@ -108,8 +632,7 @@ class OracleXMLGenerator:
             main_query = report.queries[0]
 
             # Create the detail group
-            detail_group = ET.SubElement(
-                data,
+            b.start(
                 "group",
                 {
                     "name": "G_DETAIL",
@@ -119,47 +642,48 @@ class OracleXMLGenerator:
 
             # Add columns as data items
             for col in main_query.get("columns", []):
-                ET.SubElement(
-                    detail_group,
+                leaf(
                     "dataItem",
                     {
                         "name": col["name"],
-                        "datatype": self._map_datatype(col["data_type"]),
+                        "datatype": map_datatype(col["data_type"]),
                     },
                 )
 
+            b.end("group")
+
         # Generate parameters
         for param in report.parameters:
-            p = ET.SubElement(
-                data,
+            b.start(
                 "parameter",
                 {
                     "name": param.oracle_name,
-                    "datatype": self._map_datatype(param.data_type),
+                    "datatype": map_datatype(param.data_type),
                 },
             )
 
             if param.initial_value:
-                init = ET.SubElement(p, "initialValue")
-                init.text = param.initial_value
+                b.leaf("initialValue", {}, param.initial_value)
+
+            b.end("parameter")
 
         # Generate formula placeholders as data items
         for formula in report.formulas:
             if formula.success:
-                ET.SubElement(
-                    data,
+                leaf(
                     "formula",
                     {
                         "name": formula.oracle_name,
-                        "source": f"{formula.oracle_name}formula",
-                        "datatype": self._map_datatype(formula.return_type),
+                        "source": formula.function_name,
+                        "datatype": map_datatype(formula.return_type),
                     },
                 )
 
-    def _generate_layout(self, root: ET.Element, layout: OracleLayout) -> None:
+        b.end("data")
+
+    def _generate_layout(self, b: _Builder, layout: OracleLayout) -> None:
         """Generate the layout section."""
-        layout_elem = ET.SubElement(
-            root,
+        b.start(
             "layout",
             {
                 "panelPrintOrder": "acrossDown",
@@ -168,133 +692,111 @@ class OracleXMLGenerator:
         )
 
         # Add main section
-        section = ET.SubElement(layout_elem, "section", {"name": "main"})
+        b.start("section", {"name": "main"})
 
         # Generate frame hierarchy
         if layout.margin_frame:
-            self._generate_frame(section, layout.margin_frame)
+            self._generate_frame(b, layout.margin_frame)
 
         if layout.header_frame:
-            self._generate_frame(section, layout.header_frame)
+            self._generate_frame(b, layout.header_frame)
 
         if layout.body_frame:
-            self._generate_frame(section, layout.body_frame)
+            self._generate_frame(b, layout.body_frame)
 
         if layout.trailer_frame:
-            self._generate_frame(section, layout.trailer_frame)
-
-    def _generate_frame(self, parent: ET.Element, frame: OracleFrame) -> None:
-        """Generate a frame element with its children."""
-        # Determine element type
-        if frame.frame_type == "repeating":
-            frame_elem = ET.SubElement(
-                parent,
-                "repeatingFrame",
-                {
-                    "name": frame.name,
-                    "source": frame.source_group or "",
-                    "x": str(int(frame.x)),
-                    "y": str(int(frame.y)),
-                    "width": str(int(frame.width)),
-                    "height": str(int(frame.height)),
-                    "verticalElasticity": frame.vertical_elasticity,
-                    "horizontalElasticity": frame.horizontal_elasticity,
-                    "printDirection": frame.print_direction,
-                },
-            )
-        else:
-            frame_elem = ET.SubElement(
-                parent,
-                "frame",
-                {
-                    "name": frame.name,
-                    "x": str(int(frame.x)),
-                    "y": str(int(frame.y)),
-                    "width": str(int(frame.width)),
-                    "height": str(int(frame.height)),
-                    "verticalElasticity": frame.vertical_elasticity,
-                    "horizontalElasticity": frame.horizontal_elasticity,
-                },
-            )
+            self._generate_frame(b, layout.trailer_frame)
 
-        # Generate fields in frame
-        for field in frame.fields:
-            self._generate_field(frame_elem, field)
-
-        # Generate child frames
-        for child in frame.children:
-            self._generate_frame(frame_elem, child)
-
-    def _generate_field(self, parent: ET.Element, field: OracleField) -> None:
-        """Generate a field element."""
-        attrs = {
-            "name": field.name,
-            "source": field.source,
-            "x": str(int(field.x)),
-            "y": str(int(field.y)),
-            "width": str(int(field.width)),
-            "height": str(int(field.height)),
-            "fontName": field.font_name,
-            "fontSize": str(field.font_size),
-            "fontStyle": field.font_style,
-            "horizontalAlignment": field.horizontal_alignment,
-            "verticalAlignment": field.vertical_alignment,
-        }
+        b.end("section")
+        b.end("layout")
 
-        if field.format_mask:
-            attrs["formatMask"] = field.format_mask
+    def _generate_frame(self, b: _Builder, frame: OracleFrame) -> None:
+        """Generate a frame element with its fields and child frames.
 
-        if not field.visible:
-            attrs["visible"] = "no"
+        The frame tree is walked with an explicit stack rather than by
+        recursion, so deeply nested layouts cost no Python call per frame.
+        """
+        # Bound once, as fields are by far the most numerous elements
+        start, end, add_field = b.start, b.end, b.field
+        # Frames still to generate, and tags of open frames still to close
+        stack: list[Union[OracleFrame, str]] = [frame]
+        while stack:
+            item = stack.pop()
+            if isinstance(item, str):
+                end(item)
+                continue
 
-        # Add format trigger reference if present
-        if field.format_trigger:
-            attrs["formatTrigger"] = field.format_trigger
+            tag, attrs = _frame_start(item)
+            start(tag, attrs)
+
+            # Generate fields in frame
+            for field in item.fields:
+                add_field(field)
 
-        field_elem = ET.SubElement(parent, "field", attrs)
+            # Close the frame after its children, which are popped in order
+            stack.append(tag)
+            stack.extend(reversed(item.children))
+
+    def _generate_program_units(self, b: _Builder, report: TransformedReport) -> None:
+        """Generate program units (PL/SQL functions and procedures).
+
+        All program units share one programUnits element: formula functions,
+        format triggers, then the subreport, chart and cross-tab helpers.
+        """
+        b.start("programUnits", {})
 
-    def _generate_program_units(
+        self._generate_formula_functions(b, report.formulas, report.format_triggers)
+
+        if report.subreports:
+            self._generate_subreport_helper(b, report.subreports)
+
+        if report.charts:
+            self._generate_chart_procedures(b, report.charts)
+
+        if report.crosstabs:
+            self._generate_crosstab_queries(b, report.crosstabs)
+
+        b.end("programUnits")
+
+    def _generate_formula_functions(
         self,
-        root: ET.Element,
+        b: _Builder,
         formulas: list[TranslatedFormula],
-        format_triggers: list[FormatTrigger] = None,
+        format_triggers: Optional[list[FormatTrigger]] = None,
     ) -> None:
-        """Generate program units (PL/SQL functions and format triggers)."""
-        if not formulas and not format_triggers:
-            return
-
-        program_units = ET.SubElement(root, "programUnits")
-
+        """Generate PL/SQL functions for formulas and format triggers."""
         # Generate formula functions
         for formula in formulas:
             if not formula.success:
                 continue
 
             # Create function element
-            func = ET.SubElement(
-                program_units,
+            b.start(
                 "function",
                 {
-                    "name": f"{formula.oracle_name}formula",
+                    "name": formula.function_name,
                     "returnType": formula.return_type,
                 },
             )
 
             # Add source code
-            source = ET.SubElement(func, "textSource")
-            source.text = formula.plsql_code
+            b.leaf("textSource", {}, formula.plsql_code)
 
             # Add comments for placeholders
             if formula.is_placeholder:
-                comment = ET.SubElement(func, "comment")
-                comment.text = f"TODO: Manual conversion required for {formula.original_name}"
+                b.leaf(
+                    "comment",
+                    {},
+                    f"TODO: Manual conversion required for {formula.original_name}",
+                )
+
+            b.end("function")
 
         # Generate format trigger functions
         if format_triggers:
             for trigger in format_triggers:
                 # Create function element for format trigger
-                func = ET.SubElement(
-                    program_units,
+                b.start(
                     "function",
                     {
                         "name": trigger.name,
@@ -303,34 +805,32 @@ class OracleXMLGenerator:
                 )
 
                 # Add source code
-                source = ET.SubElement(func, "textSource")
-                source.text = trigger.plsql_code
+                b.leaf("textSource", {}, trigger.plsql_code)
 
                 # Add comment with original condition
                 if trigger.original_condition:
-                    comment = ET.SubElement(func, "comment")
-                    comment.text = f"Crystal condition: {trigger.original_condition}"
+                    b.leaf("comment", {}, f"Crystal condition: {trigger.original_condition}")
 
                 # Add warnings as comments
                 if trigger.warnings:
                     for warning in trigger.warnings:
-                        warn_comment = ET.SubElement(func, "comment")
-                        warn_comment.text = f"WARNING: {warning}"
+                        b.leaf("comment", {}, f"WARNING: {warning}")
+
+                b.end("function")
 
     def _generate_parameter_form(
         self,
-        root: ET.Element,
+        b: _Builder,
         parameters: list[OracleParameter],
     ) -> None:
         """Generate parameter form section."""
         if not parameters:
             return
 
-        param_form = ET.SubElement(root, "parameterForm")
+        b.start("parameterForm", {})
 
         for param in parameters:
-            field = ET.SubElement(
-                param_form,
+            b.start(
                 "parameterField",
                 {
                     "name": f"PF_{param.oracle_name}",
@@ -341,19 +841,22 @@ class OracleXMLGenerator:
             )
 
             if param.list_of_values:
-                lov = ET.SubElement(
-                    field,
+                b.start(
                     "listOfValues",
                     {
                         "restrictToList": "no",
                     },
                 )
-                lov_query = ET.SubElement(lov, "selectStatement")
-                lov_query.text = param.list_of_values
+                b.leaf("selectStatement", {}, param.list_of_values)
+                b.end("listOfValues")
+
+            b.end("parameterField")
+
+        b.end("parameterForm")
 
     def _generate_subreports(
         self,
-        root: ET.Element,
+        b: _Builder,
         subreports: list[TransformedSubreport],
     ) -> None:
         """Generate subreport references.
@@ -373,131 +876,95 @@ class OracleXMLGenerator:
             return
 
         # Add comments documenting subreport structure
-        comment = ET.Comment(f" SUBREPORTS: {len(subreports)} subreport reference(s) ")
-        root.append(comment)
+        b.comment(f" SUBREPORTS: {len(subreports)} subreport reference(s) ")
 
         # Create a subreports section with documentation
-        sr_section = ET.SubElement(root, "subreports")
+        b.start("subreports", {})
 
         for sr in subreports:
             # Add subreport reference element
-            sr_elem = ET.SubElement(
-                sr_section,
-                "subreport",
-                {
-                    "name": sr.oracle_name,
-                    "originalName": sr.name,
-                },
-            )
+            sr_attrs = {
+                "name": sr.oracle_name,
+                "originalName": sr.name,
+            }
+
+            # Add on-demand flag
+            if sr.on_demand:
+                sr_attrs["onDemand"] = "yes"
+
+            b.start("subreport", sr_attrs)
 
             # Add position info
-            ET.SubElement(
-                sr_elem,
+            b.leaf(
                 "position",
                 {
-                    "x": str(int(sr.x)),
-                    "y": str(int(sr.y)),
-                    "width": str(int(sr.width)),
-                    "height": str(int(sr.height)),
+                    "x": _int_str(sr.x),
+                    "y": _int_str(sr.y),
+                    "width": _int_str(sr.width),
+                    "height": _int_str(sr.height),
                 },
             )
 
             # Add parameter links
             if sr.parameter_links:
-                links = ET.SubElement(sr_elem, "parameterLinks")
+                b.start("parameterLinks", {})
                 for parent_col, sr_param in sr.parameter_links:
-                    ET.SubElement(
-                        links,
+                    b.leaf(
                         "link",
                         {
                             "parentColumn": parent_col,
                             "subreportParameter": sr_param,
                         },
                     )
+                b.end("parameterLinks")
 
             # Add suppress trigger reference
             if sr.suppress_trigger:
-                ET.SubElement(
-                    sr_elem,
+                b.leaf(
                     "suppressTrigger",
                     {
                         "function": sr.suppress_trigger,
                     },
                 )
 
-            # Add on-demand flag
-            if sr.on_demand:
-                sr_elem.set("onDemand", "yes")
-
             # Add warnings as comments
             for warning in sr.warnings:
-                warn_comment = ET.Comment(f" WARNING: {warning} ")
-                sr_elem.append(warn_comment)
+                b.comment(f" WARNING: {warning} ")
 
-        # Generate a helper procedure for running subreports
-        self._generate_subreport_helper(root, subreports)
+            b.end("subreport")
+
+        b.end("subreports")
 
     def _generate_subreport_helper(
         self,
-        root: ET.Element,
+        b: _Builder,
         subreports: list[TransformedSubreport],
     ) -> None:
         """Generate PL/SQL helper procedure for subreport calls."""
-        # Find or create program units section
-        program_units = root.find("programUnits")
-        if program_units is None:
-            program_units = ET.SubElement(root, "programUnits")
-
         # Generate a helper procedure for each subreport
         for sr in subreports:
-            proc = ET.SubElement(
-                program_units,
+            b.start(
                 "procedure",
                 {
                     "name": f"RUN_{sr.oracle_name}",
                 },
             )
 
-            # Build parameter list
-            params = []
-            for parent_col, sr_param in sr.parameter_links:
-                params.append(f"p_{parent_col.lower()} IN VARCHAR2")
-
-            # Build SRW.RUN_REPORT call
-            param_string = ""
-            if sr.parameter_links:
-                param_assignments = []
-                for parent_col, sr_param in sr.parameter_links:
-                    param_assignments.append(f"'{sr_param}='||p_{parent_col.lower()}")
-                param_string = " || '&' || ".join(param_assignments)
-
             # Generate the procedure code
-            plsql_code = f"""procedure RUN_{sr.oracle_name}({', '.join(params) if params else ''}) is
-  v_report_id   VARCHAR2(100);
-  v_report_name VARCHAR2(100) := '{sr.name}';
-begin
-  -- TODO: Update report path to point to converted RDF file
-  -- This is a template for calling a subreport using SRW.RUN_REPORT
-  /*
-  v_report_id := SRW.RUN_REPORT(
-    'report=' || v_report_name ||
-    {f"'&' || {param_string}" if param_string else "''"} ||
-    ' destype=cache'
-  );
-  */
-  NULL; -- Placeholder: implement subreport call
-end RUN_{sr.oracle_name};"""
+            plsql_code = _subreport_plsql(
+                sr.oracle_name, sr.name, tuple(map(tuple, sr.parameter_links))
+            )
 
-            source = ET.SubElement(proc, "textSource")
-            source.text = plsql_code
+            b.leaf("textSource", {}, plsql_code)
 
             # Add comment about original subreport
-            comment = ET.SubElement(proc, "comment")
-            comment.text = f"Helper procedure for subreport: {sr.name}"
+            b.leaf("comment", {}, f"Helper procedure for subreport: {sr.name}")
+
+            b.end("procedure")
 
     def _generate_charts(
         self,
-        root: ET.Element,
+        b: _Builder,
         charts: list[TransformedChart],
     ) -> None:
         """Generate chart object definitions.
@@ -510,16 +977,14 @@ end RUN_{sr.oracle_name};"""
             return
 
         # Add comment for charts section
-        comment = ET.Comment(f" CHARTS: {len(charts)} chart object(s) ")
-        root.append(comment)
+        b.comment(f" CHARTS: {len(charts)} chart object(s) ")
 
         # Create charts section
-        charts_section = ET.SubElement(root, "charts")
+        b.start("charts", {})
 
         for chart in charts:
             # Create chart element
-            chart_elem = ET.SubElement(
-                charts_section,
+            b.start(
                 "chart",
                 {
                     "name": chart.oracle_name,
@@ -529,22 +994,20 @@ end RUN_{sr.oracle_name};"""
             )
 
             # Position and size
-            ET.SubElement(
-                chart_elem,
+            b.leaf(
                 "position",
                 {
-                    "x": str(int(chart.x)),
-                    "y": str(int(chart.y)),
-                    "width": str(int(chart.width)),
-                    "height": str(int(chart.height)),
+                    "x": _int_str(chart.x),
+                    "y": _int_str(chart.y),
+                    "width": _int_str(chart.width),
+                    "height": _int_str(chart.height),
                 },
             )
 
             # Data configuration
-            data_config = ET.SubElement(chart_elem, "dataConfig")
+            b.start("dataConfig", {})
             if chart.category_column:
-                ET.SubElement(
-                    data_config,
+                b.leaf(
                     "categoryColumn",
                     {
                         "name": chart.category_column,
@@ -552,47 +1015,44 @@ end RUN_{sr.oracle_name};"""
                 )
             if chart.value_columns:
                 for col in chart.value_columns:
-                    ET.SubElement(
-                        data_config,
+                    b.leaf(
                         "valueColumn",
                         {
                             "name": col,
                         },
                     )
             if chart.group_column:
-                ET.SubElement(
-                    data_config,
+                b.leaf(
                     "groupColumn",
                     {
                         "name": chart.group_column,
                     },
                 )
+            b.end("dataConfig")
 
             # Appearance
-            appearance = ET.SubElement(chart_elem, "appearance")
+            b.start("appearance", {"is3D": "yes"} if chart.is_3d else {})
             if chart.title:
-                ET.SubElement(appearance, "title", {"text": chart.title})
-            ET.SubElement(
-                appearance,
+                b.leaf("title", {"text": chart.title})
+            b.leaf(
                 "legend",
                 {
                     "position": chart.legend_position,
                 },
             )
-            if chart.is_3d:
-                appearance.set("is3D", "yes")
+            b.end("appearance")
 
             # Add warnings as comments
             for warning in chart.warnings:
-                warn_comment = ET.Comment(f" WARNING: {warning} ")
-                chart_elem.append(warn_comment)
+                b.comment(f" WARNING: {warning} ")
 
-        # Generate PL/SQL code for chart initialization
-        self._generate_chart_procedures(root, charts)
+            b.end("chart")
+
+        b.end("charts")
 
     def _generate_chart_procedures(
         self,
-        root: ET.Element,
+        b: _Builder,
         charts: list[TransformedChart],
     ) -> None:
         """Generate PL/SQL procedures for initializing charts.
@@ -600,54 +1060,36 @@ end RUN_{sr.oracle_name};"""
         These procedures use the OG (Oracle Graphics) package to
         configure chart properties at runtime.
         """
-        # Find or create program units section
-        program_units = root.find("programUnits")
-        if program_units is None:
-            program_units = ET.SubElement(root, "programUnits")
-
         for chart in charts:
-            proc = ET.SubElement(
-                program_units,
+            b.start(
                 "procedure",
                 {
                     "name": f"INIT_{chart.oracle_name}",
                 },
             )
 
-            # Build column list for OG.SetData
-            value_cols = ", ".join(f"'{col}'" for col in chart.value_columns) or "'VALUE'"
-            category_col = f"'{chart.category_column}'" if chart.category_column else "'CATEGORY'"
-
             # Generate the procedure code
-            plsql_code = f"""procedure INIT_{chart.oracle_name} is
-  -- Initialize chart: {chart.name}
-  -- Chart Type: {chart.chart_type}
-begin
-  -- TODO: Implement using Oracle BI Graph API
-  -- Example using OG package:
-  /*
-  OG.SetChartType('{chart.oracle_name}', '{chart.chart_type}');
-  OG.SetDataQuery('{chart.oracle_name}',
-    'SELECT {chart.category_column or 'CATEGORY'} category, '
-    || '{', '.join(chart.value_columns) or 'VALUE'} value '
-    || 'FROM your_data_source');
-  {"OG.Set3D('" + chart.oracle_name + "', TRUE);" if chart.is_3d else ""}
-  {"OG.SetTitle('" + chart.oracle_name + "', '" + (chart.title or '') + "');" if chart.title else ""}
-  OG.SetLegendPosition('{chart.oracle_name}', '{chart.legend_position.upper()}');
-  */
-  NULL; -- Placeholder: implement chart initialization
-end INIT_{chart.oracle_name};"""
+            plsql_code = _chart_plsql(
+                chart.oracle_name,
+                chart.name,
+                chart.chart_type,
+                chart.category_column,
+                tuple(chart.value_columns),
+                chart.is_3d,
+                chart.title,
+                chart.legend_position,
+            )
 
-            source = ET.SubElement(proc, "textSource")
-            source.text = plsql_code
+            b.leaf("textSource", {}, plsql_code)
 
             # Add comment about original chart
-            comment = ET.SubElement(proc, "comment")
-            comment.text = f"Initialization procedure for chart: {chart.name}"
+            b.leaf("comment", {}, f"Initialization procedure for chart: {chart.name}")
+
+            b.end("procedure")
 
     def _generate_crosstabs(
         self,
-        root: ET.Element,
+        b: _Builder,
         crosstabs: list[TransformedCrossTab],
     ) -> None:
         """Generate cross-tab (matrix) definitions.
@@ -660,16 +1102,14 @@ end INIT_{chart.oracle_name};"""
             return
 
         # Add comment for cross-tabs section
-        comment = ET.Comment(f" CROSS-TABS: {len(crosstabs)} matrix object(s) ")
-        root.append(comment)
+        b.comment(f" CROSS-TABS: {len(crosstabs)} matrix object(s) ")
 
         # Create cross-tabs section
-        crosstabs_section = ET.SubElement(root, "crosstabs")
+        b.start("crosstabs", {})
 
         for ct in crosstabs:
             # Create cross-tab element
-            ct_elem = ET.SubElement(
-                crosstabs_section,
+            b.start(
                 "crosstab",
                 {
                     "name": ct.oracle_name,
@@ -678,35 +1118,35 @@ end INIT_{chart.oracle_name};"""
             )
 
             # Position and size
-            ET.SubElement(
-                ct_elem,
+            b.leaf(
                 "position",
                 {
-                    "x": str(int(ct.x)),
-                    "y": str(int(ct.y)),
-                    "width": str(int(ct.width)),
-                    "height": str(int(ct.height)),
+                    "x": _int_str(ct.x),
+                    "y": _int_str(ct.y),
+                    "width": _int_str(ct.width),
+                    "height": _int_str(ct.height),
                 },
             )
 
             # Row dimensions
             if ct.row_columns:
-                rows_elem = ET.SubElement(ct_elem, "rowDimensions")
+                b.start("rowDimensions", {})
                 for col in ct.row_columns:
-                    ET.SubElement(rows_elem, "dimension", {"column": col})
+                    b.leaf("dimension", {"column": col})
+                b.end("rowDimensions")
 
             # Column dimensions
             if ct.column_columns:
-                cols_elem = ET.SubElement(ct_elem, "columnDimensions")
+                b.start("columnDimensions", {})
                 for col in ct.column_columns:
-                    ET.SubElement(cols_elem, "dimension", {"column": col})
+                    b.leaf("dimension", {"column": col})
+                b.end("columnDimensions")
 
             # Summary measures
             if ct.summary_columns:
-                measures_elem = ET.SubElement(ct_elem, "measures")
+                b.start("measures", {})
                 for summary in ct.summary_columns:
-                    ET.SubElement(
-                        measures_elem,
+                    b.leaf(
                         "measure",
                         {
                             "name": summary.get("name", ""),
@@ -714,10 +1154,10 @@ end INIT_{chart.oracle_name};"""
                             "function": summary.get("function", "SUM"),
                         },
                     )
+                b.end("measures")
 
             # Totals configuration
-            ET.SubElement(
-                ct_elem,
+            b.leaf(
                 "totals",
                 {
                     "showRowTotals": "yes" if ct.show_row_totals else "no",
@@ -728,15 +1168,15 @@ end INIT_{chart.oracle_name};"""
 
             # Add warnings as comments
             for warning in ct.warnings:
-                warn_comment = ET.Comment(f" WARNING: {warning} ")
-                ct_elem.append(warn_comment)
+                b.comment(f" WARNING: {warning} ")
+
+            b.end("crosstab")
 
-        # Generate matrix query helper
-        self._generate_crosstab_queries(root, crosstabs)
+        b.end("crosstabs")
 
     def _generate_crosstab_queries(
         self,
-        root: ET.Element,
+        b: _Builder,
         crosstabs: list[TransformedCrossTab],
     ) -> None:
         """Generate SQL queries for cross-tab data.
@@ -744,73 +1184,36 @@ end INIT_{chart.oracle_name};"""
         These queries use PIVOT syntax (Oracle 11g+) or DECODE for
         cross-tab matrix data.
         """
-        # Find or create program units section
-        program_units = root.find("programUnits")
-        if program_units is None:
-            program_units = ET.SubElement(root, "programUnits")
-
         for ct in crosstabs:
-            proc = ET.SubElement(
-                program_units,
+            b.start(
                 "procedure",
                 {
                     "name": f"QUERY_{ct.oracle_name}",
                 },
             )
 
-            # Build column lists
-            row_cols = ", ".join(ct.row_columns) if ct.row_columns else "ROW_DIM"
-            col_cols = ", ".join(ct.column_columns) if ct.column_columns else "COL_DIM"
-
-            # Build aggregation expressions
-            agg_exprs = []
-            for summary in ct.summary_columns:
-                func = summary.get("function", "SUM")
-                col = summary.get("column", "VALUE")
-                agg_exprs.append(f"{func}({col}) AS {col}_AGG")
-            agg_list = ", ".join(agg_exprs) if agg_exprs else "SUM(VALUE) AS VALUE_AGG"
-
             # Generate the procedure code with sample PIVOT query
-            plsql_code = f"""procedure QUERY_{ct.oracle_name} is
-  -- Cross-tab query for: {ct.name}
-  -- Row dimensions: {row_cols}
-  -- Column dimensions: {col_cols}
-begin
-  -- TODO: Implement cross-tab query using one of these approaches:
-  --
-  -- Option 1: Oracle PIVOT (11g+)
-  /*
-  SELECT *
-  FROM (
-    SELECT {row_cols}, {col_cols}, {agg_list}
-    FROM your_source_table
-    GROUP BY {row_cols}, {col_cols}
-  )
-  PIVOT (
-    {agg_list}
-    FOR {col_cols} IN (/* distinct column values */)
-  );
-  */
-  --
-  -- Option 2: DECODE method (pre-11g)
-  /*
-  SELECT {row_cols},
-         SUM(DECODE({col_cols}, 'value1', measure, 0)) AS col_value1,
-         SUM(DECODE({col_cols}, 'value2', measure, 0)) AS col_value2
-  FROM your_source_table
-  GROUP BY {row_cols};
-  */
-  NULL; -- Placeholder: implement cross-tab query
-end QUERY_{ct.oracle_name};"""
+            plsql_code = _crosstab_plsql(
+                ct.oracle_name,
+                ct.name,
+                tuple(ct.row_columns),
+                tuple(ct.column_columns),
+                tuple(
+                    (summary.get("function", "SUM"), summary.get("column", "VALUE"))
+                    for summary in ct.summary_columns
+                ),
+            )
 
-            source = ET.SubElement(proc, "textSource")
-            source.text = plsql_code
+            b.leaf("textSource", {}, plsql_code)
 
             # Add comment about original cross-tab
-            comment = ET.SubElement(proc, "comment")
-            comment.text = f"Query procedure for cross-tab: {ct.name}"
+            b.leaf("comment", {}, f"Query procedure for cross-tab: {ct.name}")
 
-    def _map_datatype(self, oracle_type: str) -> str:
+            b.end("procedure")
+
+    @staticmethod
+    @lru_cache(maxsize=128)
+    def _map_datatype(oracle_type: str) -> str:
         """Map Oracle type to Oracle Reports datatype attribute.
 
         Oracle Reports supports these datatypes:
@@ -818,9 +1221,16 @@ end QUERY_{ct.oracle_name};"""
         - number (for NUMBER)
         - date (for DATE, TIMESTAMP)
         - long (for CLOB, BLOB, LONG)
+
+        Reports use a handful of distinct type names, so results are cached.
         """
         type_lower = oracle_type.lower()
 
+        # Known base types, e.g. "varchar2" in "VARCHAR2(100)"
+        datatype = _DATATYPES.get(type_lower.split("(", 1)[0].strip())
+        if datatype is not None:
+            return datatype
+
         if "number" in type_lower:
             return "number"
         elif "date" in type_lower or "timestamp" in type_lower:
@@ -834,21 +1244,44 @@ end QUERY_{ct.oracle_name};"""
             return "character"
 
     def _prettify(self, element: ET.Element) -> str:
-        """Return a pretty-printed XML string."""
-        rough_string = ET.tostring(element, encoding="unicode")
-        reparsed = minidom.parseString(rough_string)
-        return reparsed.toprettyxml(indent="  ")
+        """Return a pretty-printed XML string.
 
-    def generate_to_file(self, report: TransformedReport, output_path: str) -> None:
+        The tree is indented in place and serialized once.
+        """
+        ET.indent(element, space=_INDENT)
+        return self._serialize(element)
+
+    @staticmethod
+    def _serialize(element: ET.Element) -> str:
+        """Serialize an element tree with an XML declaration."""
+        data: bytes = ET.tostring(element, encoding="UTF-8", xml_declaration=True)
+        return data.decode("utf-8")
+
+    def generate_to_file(
+        self,
+        report: TransformedReport,
+        output_path: Union[str, Path],
+        pretty: bool = True,
+    ) -> None:
         """Generate Oracle XML and write to file.
 
+        The document is written to a buffered file as it is generated,
+        without building an element tree. The file holds the same document
+        that generate() returns.
+
         Args:
             report: Transformed report data.
             output_path: Path to write XML file.
+            pretty: Whether to indent the XML.
         """
-        xml_content = self.generate(report)
-
-        with open(output_path, "w", encoding="utf-8") as f:
-            f.write(xml_content)
+        f = open(output_path, "w", encoding="utf-8", newline="", buffering=_WRITE_BUFFER_SIZE)
+        try:
+            with f:
+                f.write(_XML_DECLARATION)
+                self._generate_report(_XMLWriter(f.write, pretty), report)
+        except BaseException:
+            # Do not leave a truncated XML file behind
+            Path(output_path).unlink(missing_ok=True)
+            raise
 
         self.logger.info(f"Wrote XML to: {output_path}")
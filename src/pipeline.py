@@ -105,6 +105,7 @@ class Pipeline:
                     temp_dir=self.config.extraction.temp_directory,
                     timeout_seconds=self.config.extraction.timeout_seconds,
                     retry_attempts=self.config.extraction.retry_attempts,
+                    persistent_process=self.config.extraction.persistent_process,
                 )
 
             self.rdf_converter = RDFConverter(
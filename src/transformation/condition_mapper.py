@@ -73,6 +73,8 @@ class ConditionMapper:
         self.trigger_prefix = trigger_prefix
         self.logger = get_logger("condition_mapper")
         self._trigger_counter = 0
+        # Crystal expression -> (PL/SQL expression, warnings)
+        self._expression_cache: dict[str, tuple[str, tuple[str, ...]]] = {}
 
     def convert_suppress_condition(
         self,
@@ -174,6 +176,33 @@ end;"""
     ) -> str:
         """Convert a Crystal condition expression to PL/SQL.
 
+        Identical expressions recur across fields, so translations are cached
+        per mapper along with any warnings they produced.
+
+        Args:
+            crystal_expr: Crystal Reports condition expression.
+            warnings: List to accumulate warnings.
+
+        Returns:
+            PL/SQL boolean expression.
+        """
+        cached = self._expression_cache.get(crystal_expr)
+        if cached is None:
+            expr_warnings: list[str] = []
+            plsql_expr = self._translate_expression(crystal_expr, expr_warnings)
+            cached = (plsql_expr, tuple(expr_warnings))
+            self._expression_cache[crystal_expr] = cached
+
+        warnings.extend(cached[1])
+        return cached[0]
+
+    def _translate_expression(
+        self,
+        crystal_expr: str,
+        warnings: list[str],
+    ) -> str:
+        """Translate a Crystal condition expression to PL/SQL (uncached).
+
         Args:
             crystal_expr: Crystal Reports condition expression.
             warnings: List to accumulate warnings.
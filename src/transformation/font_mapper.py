@@ -85,6 +85,19 @@ class FontMapper:
         if explicit_size:
             self.default_size = default_size
 
+        self._rebuild_lower_map()
+
+    def _rebuild_lower_map(self) -> None:
+        """Rebuild the lowercase lookup index from font_map.
+
+        The first key (in insertion order) wins when names differ only by case,
+        matching the order a linear case-insensitive scan would find them.
+        """
+        lower_map: dict[str, str] = {}
+        for key, value in self.font_map.items():
+            lower_map.setdefault(key.lower(), value)
+        self._font_map_lower = lower_map
+
     def _load_config(self, config_path: str) -> None:
         """Load font mappings from YAML configuration file.
 
@@ -143,14 +156,14 @@ class FontMapper:
 
         # Try case-insensitive match
         crystal_lower = crystal_font.lower()
-        for key, value in self.font_map.items():
-            if key.lower() == crystal_lower:
-                self.logger.debug(f"Mapped font (case-insensitive): {crystal_font} -> {value}")
-                return value
+        mapped_lower: Optional[str] = self._font_map_lower.get(crystal_lower)
+        if mapped_lower is not None:
+            self.logger.debug(f"Mapped font (case-insensitive): {crystal_font} -> {mapped_lower}")
+            return mapped_lower
 
         # Try partial match (e.g., "Arial Unicode MS" -> "Arial")
-        for key, value in self.font_map.items():
-            if key.lower() in crystal_lower or crystal_lower.startswith(key.lower()):
+        for key, value in self._font_map_lower.items():
+            if key in crystal_lower:
                 self.logger.debug(f"Mapped font (partial match): {crystal_font} -> {value}")
                 return value
 
@@ -251,6 +264,7 @@ class FontMapper:
             oracle_font: Oracle Reports font name.
         """
         self.font_map[crystal_font] = oracle_font
+        self._rebuild_lower_map()
         self.logger.info(f"Added custom font mapping: {crystal_font} -> {oracle_font}")
 
     def get_all_mappings(self) -> dict[str, str]:
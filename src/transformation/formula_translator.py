@@ -39,6 +39,11 @@ class TranslatedFormula:
             "referenced_columns": self.referenced_columns,
         }
 
+    @property
+    def function_name(self) -> str:
+        """Name of the PL/SQL function that computes the formula."""
+        return f"{self.oracle_name}formula"
+
 
 class FormulaTranslator:
     """Translates Crystal Reports formulas to Oracle PL/SQL."""
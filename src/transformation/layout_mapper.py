@@ -15,6 +15,7 @@ from ..parsing.report_model import (
     Section,
     SectionType,
 )
+from ..utils.compat import DATACLASS_OPTIONS
 from ..utils.logger import get_logger
 from .font_mapper import FontMapper
 
@@ -157,7 +158,7 @@ class CoordinateConverter:
             raise ValueError(f"Unknown target unit: {to_unit}")
 
 
-@dataclass
+@dataclass(**DATACLASS_OPTIONS)
 class OracleFrame:
     """Oracle Reports frame definition."""
 
@@ -193,7 +194,7 @@ class OracleFrame:
         }
 
 
-@dataclass
+@dataclass(**DATACLASS_OPTIONS)
 class OracleField:
     """Oracle Reports field definition."""
 
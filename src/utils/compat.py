@@ -0,0 +1,9 @@
+"""
+Python version compatibility helpers for RPT to RDF Converter.
+"""
+
+import sys
+from typing import Any, Dict
+
+# dataclass(slots=True) requires Python 3.10+; fall back to __dict__ on 3.9
+DATACLASS_OPTIONS: Dict[str, Any] = {"slots": True} if sys.version_info >= (3, 10) else {}
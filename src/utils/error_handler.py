@@ -382,6 +382,7 @@ class ConversionError:
         original_value: Original value that triggered the error.
         suggested_fix: Suggested action to resolve the error.
         is_fatal: Whether this error should halt processing.
+        is_recoverable: Whether retrying the failed operation could succeed.
         timestamp: When the error occurred.
         context: Additional context information.
     """
@@ -394,6 +395,7 @@ class ConversionError:
     original_value: Optional[str] = None
     suggested_fix: Optional[str] = None
     is_fatal: bool = False
+    is_recoverable: bool = True
     timestamp: datetime = field(default_factory=datetime.now)
     context: dict[str, Any] = field(default_factory=dict)
 
@@ -434,6 +436,7 @@ class ConversionError:
             "original_value": self.original_value,
             "suggested_fix": self.suggested_fix,
             "is_fatal": self.is_fatal,
+            "is_recoverable": self.is_recoverable,
             "timestamp": self.timestamp.isoformat(),
             "context": self.context,
         }
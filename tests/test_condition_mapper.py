@@ -184,6 +184,25 @@ class TestConditionMapper:
 
         assert "FALSE" in trigger.plsql_code
 
+    def test_repeated_condition_translated_once(self, mapper, monkeypatch):
+        """Test that identical conditions reuse the cached translation."""
+        calls = []
+        original = mapper._translate_expression
+
+        def counting_translate(expr, warnings):
+            calls.append(expr)
+            return original(expr, warnings)
+
+        monkeypatch.setattr(mapper, "_translate_expression", counting_translate)
+
+        first = mapper.convert_suppress_condition("{amount} > 1000", "AMOUNT")
+        second = mapper.convert_suppress_condition("{amount} > 1000", "TOTAL")
+
+        assert len(calls) == 1
+        assert first.name == "FT_SUPPRESS_AMOUNT"
+        assert second.name == "FT_SUPPRESS_TOTAL"
+        assert "return :AMOUNT > 1000;" in second.plsql_code
+
     def test_null_comparison_conversion(self, mapper):
         """Test that null comparisons are converted properly."""
         condition = "{FIELD} = null"
@@ -0,0 +1,193 @@
+"""
+Unit tests for configuration loading.
+
+Tests YAML loading, caching, and environment variable merging.
+"""
+
+import dataclasses
+import os
+
+import pytest
+
+from src import config as config_module
+from src.config import Config
+
+
+@pytest.fixture
+def settings_file(tmp_path):
+    """Write a minimal settings file and return its path."""
+    path = tmp_path / "settings.yaml"
+    path.write_text("extraction:\n  parallel_workers: 2\n", encoding="utf-8")
+    return path
+
+
+class TestConfigFromYaml:
+    """Test suite for Config.from_yaml."""
+
+    def setup_method(self):
+        """Start each test with an empty YAML cache."""
+        config_module._YAML_CACHE.clear()
+
+    def test_missing_file_raises(self, tmp_path):
+        """Test that a missing file raises FileNotFoundError."""
+        with pytest.raises(FileNotFoundError):
+            Config.from_yaml(str(tmp_path / "missing.yaml"))
+
+    def test_loads_values(self, settings_file):
+        """Test that values from the file are applied."""
+        cfg = Config.from_yaml(str(settings_file))
+        assert cfg.extraction.parallel_workers == 2
+
+    def test_unchanged_file_is_cached(self, settings_file, monkeypatch):
+        """Test that an unchanged file is not parsed a second time."""
+        Config.from_yaml(str(settings_file))
+
+        def fail_load(*args, **kwargs):
+            raise AssertionError("YAML should not be re-parsed")
+
+        monkeypatch.setattr(config_module.yaml, "load", fail_load)
+        cfg = Config.from_yaml(str(settings_file))
+        assert cfg.extraction.parallel_workers == 2
+
+    def test_modified_file_is_reloaded(self, settings_file):
+        """Test that a modified file invalidates the cache."""
+        Config.from_yaml(str(settings_file))
+
+        settings_file.write_text("extraction:\n  parallel_workers: 16\n", encoding="utf-8")
+        stat = settings_file.stat()
+        os.utime(settings_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+        cfg = Config.from_yaml(str(settings_file))
+        assert cfg.extraction.parallel_workers == 16
+
+    def test_cached_data_is_not_shared(self, settings_file):
+        """Test that callers get independent copies of cached data."""
+        first = config_module._load_yaml_cached(settings_file)
+        first["extraction"]["parallel_workers"] = 99
+
+        cfg = Config.from_yaml(str(settings_file))
+        assert cfg.extraction.parallel_workers == 2
+
+
+class TestMergeEnvVars:
+    """Test suite for Config.merge_env_vars."""
+
+    def test_env_values_override_defaults(self, monkeypatch):
+        """Test that environment variables are applied to nested settings."""
+        monkeypatch.setenv("ORACLE_HOME", "/opt/oracle")
+        monkeypatch.setenv("EXTRACTION_WORKERS", "8")
+        monkeypatch.setenv("OUTPUT_DIRECTORY", "/tmp/out")
+
+        cfg = Config()
+        cfg.merge_env_vars()
+
+        assert cfg.oracle.home == "/opt/oracle"
+        assert cfg.extraction.parallel_workers == 8
+        assert cfg.paths.output_directory == "/tmp/out"
+
+    def test_empty_env_value_is_ignored(self, monkeypatch):
+        """Test that empty environment variables keep the configured value."""
+        monkeypatch.setenv("ORACLE_REPORTS_SERVER", "")
+
+        cfg = Config()
+        cfg.merge_env_vars()
+
+        assert cfg.oracle.reports_server == "localhost:9002"
+
+    def test_dotenv_loaded_once(self, monkeypatch):
+        """Test that the .env file is only read on the first merge."""
+        calls = []
+        monkeypatch.setattr(config_module, "load_dotenv", lambda: calls.append(1))
+        config_module.reset_env_cache()
+
+        Config().merge_env_vars()
+        Config().merge_env_vars()
+        assert len(calls) == 1
+
+        config_module.reset_env_cache()
+        Config().merge_env_vars()
+        assert len(calls) == 2
+
+
+class TestFrozenSubConfigs:
+    """Test suite for the immutable leaf configuration objects."""
+
+    def test_leaf_configs_are_immutable(self):
+        """Test that leaf configs reject attribute assignment."""
+        cfg = Config()
+
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            cfg.paths.output_directory = "/tmp/out"
+
+    def test_leaf_configs_are_hashable(self):
+        """Test that equal leaf configs hash equally."""
+        assert hash(Config().logging) == hash(Config().logging)
+
+
+class TestConfigFromDict:
+    """Test suite for Config.from_dict."""
+
+    def test_nested_docker_sections(self):
+        """Test that nested docker sections are built into their own configs."""
+        data = {
+            "extraction": {"mode": "java", "docker": {"image": "custom:1"}},
+            "oracle": {"mode": "native", "home": "/opt/oracle", "docker": {"db_port": 1522}},
+        }
+
+        cfg = Config.from_dict(data)
+
+        assert cfg.extraction.mode == "java"
+        assert cfg.extraction.docker.image == "custom:1"
+        assert cfg.oracle.home == "/opt/oracle"
+        assert cfg.oracle.docker.db_port == 1522
+
+    def test_input_is_not_mutated(self):
+        """Test that from_dict leaves the input dictionary untouched."""
+        data = {"extraction": {"docker": {"image": "custom:1"}}}
+
+        Config.from_dict(data)
+
+        assert data == {"extraction": {"docker": {"image": "custom:1"}}}
+
+
+class TestConfigValidate:
+    """Test suite for Config.validate."""
+
+    def setup_method(self):
+        """Clear cached path checks."""
+        config_module.reset_env_cache()
+
+    def test_missing_rpttoxml_reported(self, tmp_path):
+        """Test that a missing RptToXml path is reported."""
+        cfg = Config()
+        cfg.extraction.mode = "java"
+        cfg.extraction.rpttoxml_path = str(tmp_path / "missing.sh")
+
+        errors = cfg.validate()
+
+        assert any("RptToXml executable not found" in e for e in errors)
+
+    def test_path_checks_are_cached(self, tmp_path, monkeypatch):
+        """Test that repeated validation does not stat the same path again."""
+        tool = tmp_path / "rpttoxml.sh"
+        tool.write_text("", encoding="utf-8")
+        cfg = Config()
+        cfg.extraction.mode = "java"
+        cfg.extraction.rpttoxml_path = str(tool)
+
+        assert cfg.validate() == []
+
+        monkeypatch.setattr(config_module.Path, "exists", lambda self: False)
+        assert cfg.validate() == []
+
+    def test_missing_path_checked_again(self, tmp_path):
+        """Test that a path missing at one validation is found once it is created."""
+        tool = tmp_path / "rpttoxml.sh"
+        cfg = Config()
+        cfg.extraction.mode = "java"
+        cfg.extraction.rpttoxml_path = str(tool)
+
+        assert cfg.validate() != []
+
+        tool.write_text("", encoding="utf-8")
+        assert cfg.validate() == []
@@ -261,6 +261,16 @@ class TestFontMapperCustomMappings:
 
         assert mapper.map_font("Arial") == "Helvetica"
 
+    def test_custom_mapping_case_insensitive(self):
+        """Test that runtime mappings are matched case-insensitively."""
+        mapper = FontMapper()
+
+        mapper.add_custom_mapping("MyFont", "Courier")
+        mapper.add_custom_mapping("Arial", "Helvetica")
+
+        assert mapper.map_font("MYFONT") == "Courier"
+        assert mapper.map_font("arial") == "Helvetica"
+
     def test_get_all_mappings(self):
         """Test retrieving all current mappings."""
         mapper = FontMapper()
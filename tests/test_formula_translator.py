@@ -831,3 +831,13 @@ class TestTranslatedFormula:
         )
         assert tf.is_placeholder is True
         assert tf.to_dict()["is_placeholder"] is True
+
+    def test_function_name(self):
+        """Test that the PL/SQL function name is the Oracle name plus "formula"."""
+        tf = TranslatedFormula(
+            original_name="Test",
+            oracle_name="CF_TEST",
+            plsql_code="return 1;",
+            return_type="NUMBER",
+        )
+        assert tf.function_name == "CF_TESTformula"
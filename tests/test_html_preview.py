@@ -0,0 +1,389 @@
+"""
+Unit tests for the HTML Preview Generator.
+
+Tests rendering of report models and Oracle XML files as HTML previews.
+"""
+
+from html import escape
+
+import pytest
+
+from src.generation.html_preview import HTMLPreviewGenerator, _esc_fast
+from src.parsing.report_model import (
+    Field,
+    FontSpec,
+    FormatSpec,
+    ReportMetadata,
+    ReportModel,
+    Section,
+    SectionType,
+)
+
+
+def render(renderer, *args):
+    """Call a renderer with a collecting write function and join what it wrote."""
+    out = []
+    renderer(*args, out.append)
+    return "".join(out)
+
+
+@pytest.fixture
+def generator():
+    """Create an HTMLPreviewGenerator instance."""
+    return HTMLPreviewGenerator()
+
+
+@pytest.fixture
+def sample_report():
+    """Create a small report with a header and a detail section."""
+    return ReportModel(
+        name="Sales <Summary>",
+        metadata=ReportMetadata(title="Q1 Sales", author="R&D"),
+        sections=[
+            Section(
+                name="PageHeader",
+                section_type=SectionType.PAGE_HEADER,
+                height=30.0,
+                fields=[Field(name="Title", source="Sales Report", source_type="text")],
+            ),
+            Section(
+                name="Details",
+                section_type=SectionType.DETAIL,
+                height=20.0,
+                fields=[
+                    Field(name="F_NAME", source="CUSTOMER_NAME", source_type="database"),
+                    Field(name="F_TOTAL", source="Total", source_type="formula"),
+                ],
+            ),
+        ],
+        unsupported_features=["Cross-tab <pivot>"],
+        conversion_notes=["Formula Total simplified"],
+    )
+
+
+class TestEscape:
+    """Test suite for the escaping fast path."""
+
+    def test_clean_string_returned_unchanged(self):
+        """Test that a string with nothing to escape is returned as is."""
+        value = "CUSTOMER_NAME"
+
+        assert _esc_fast(value) is value
+
+    @pytest.mark.parametrize("value", ["a & b", "<tag", 'say "hi"', "it's", "&amp;"])
+    def test_matches_html_escape(self, value):
+        """Test that strings with special characters are escaped like html.escape."""
+        assert _esc_fast(value) == escape(value)
+
+    def test_greater_than_not_escaped(self):
+        """Test that ">" is left alone since it is safe in text and attribute values."""
+        assert _esc_fast("<a> & b > c") == "&lt;a> &amp; b > c"
+        assert _esc_fast("x > y") == "x > y"
+
+
+class TestRenderField:
+    """Test suite for field rendering."""
+
+    def test_database_field(self, generator):
+        """Test that a database field shows its column in braces."""
+        field = Field(name="F_NAME", source="CUSTOMER_NAME", source_type="database")
+
+        html = render(generator._render_field, field)
+
+        assert 'class="field field-database"' in html
+        assert 'title="CUSTOMER_NAME"' in html
+        assert ">{CUSTOMER_NAME}</div>" in html
+
+    @pytest.mark.parametrize(
+        "source_type,expected",
+        [
+            ("database", "{CUSTOMER_NAME}"),
+            ("formula", "@CUSTOMER_NAME"),
+            ("parameter", "?CUSTOMER_NAME"),
+            ("special", "CUSTOMER_NAME"),
+            ("text", "F_NAME"),
+            ("unknown", "F_NAME"),
+        ],
+    )
+    def test_display_value(self, generator, source_type, expected):
+        """Test that each source type is shown with its marker."""
+        field = Field(name="F_NAME", source="CUSTOMER_NAME", source_type=source_type)
+
+        assert generator._get_field_display_value(field) == expected
+
+    def test_text_field_without_name(self, generator):
+        """Test that a text field without a name shows its source."""
+        field = Field(name="", source="Sales Report", source_type="text")
+
+        assert generator._get_field_display_value(field) == "Sales Report"
+
+    def test_field_styles(self, generator):
+        """Test that position, font and alignment end up in the style attribute."""
+        field = Field(
+            name="F_TOTAL",
+            source="Total",
+            source_type="formula",
+            x=10.0,
+            y=5.0,
+            font=FontSpec(name="Courier", size=9, bold=True, underline=True),
+            format=FormatSpec(horizontal_alignment="right", vertical_alignment="bottom"),
+            background_color="#eeeeee",
+            border_style="single",
+        )
+
+        html = render(generator._render_field, field)
+
+        for style in (
+            "left: 10.0px",
+            "top: 5.0px",
+            "font-family: Courier",
+            "font-size: 9px",
+            "text-align: right",
+            "font-weight: bold",
+            "font-style: normal",
+            "text-decoration: underline",
+            "background-color: #eeeeee",
+            "border: 1px solid #000",
+            "align-items: flex-end",
+        ):
+            assert style in html
+
+    def test_italic_font_style(self, generator):
+        """Test that an italic field without underline gets no text decoration."""
+        field = Field(name="F", source="X", font=FontSpec(italic=True))
+
+        html = render(generator._render_field, field)
+
+        assert "font-weight: normal; font-style: italic;" in html
+        assert "text-decoration" not in html
+
+    def test_unknown_vertical_alignment(self, generator):
+        """Test that an unknown vertical alignment falls back to the top."""
+        field = Field(name="F", source="X", format=FormatSpec(vertical_alignment="baseline"))
+
+        assert "align-items: flex-start" in render(generator._render_field, field)
+
+    def test_field_escaping(self, generator):
+        """Test that field sources and display values are HTML-escaped."""
+        field = Field(name="<b>", source='A "quoted" & <tagged> value', source_type="text")
+
+        html = render(generator._render_field, field)
+
+        assert "<b>" not in html
+        assert 'title="A &quot;quoted&quot; &amp; &lt;tagged> value"' in html
+        assert ">&lt;b></div>" in html
+
+
+class TestRenderSection:
+    """Test suite for section rendering."""
+
+    def test_group_section_label(self, generator):
+        """Test that group sections are labelled with their group number."""
+        section = Section(
+            name="GH1", section_type=SectionType.GROUP_HEADER, height=25.0, group_number=2
+        )
+
+        html = render(generator._render_section, section, 540.0)
+
+        assert 'class="section section-groupheader"' in html
+        assert '<div class="section-label">Groupheader 2</div>' in html
+
+    def test_changed_section_rendered_again(self, generator):
+        """Test that a field changed after rendering is reflected when rendered again."""
+        section = Section(
+            name="D",
+            section_type=SectionType.DETAIL,
+            fields=[Field(name="F_NAME", source="CUSTOMER_NAME")],
+        )
+        render(generator._render_section, section, 540.0)
+
+        section.fields[0].font.bold = True
+        html = render(generator._render_section, section, 540.0)
+
+        assert "font-weight: bold" in html
+
+    def test_suppressed_section(self, generator):
+        """Test that a suppressed section renders nothing."""
+        section = Section(name="D", section_type=SectionType.DETAIL, suppress=True)
+
+        assert render(generator._render_section, section, 540.0) == ""
+
+
+class TestGenerateCss:
+    """Test suite for stylesheet generation."""
+
+    def test_page_width_as_custom_property(self, generator):
+        """Test that the page width is passed to the stylesheet as a custom property."""
+        css = render(generator._generate_css, 792.0, 612.0, 720.0)
+
+        assert css.startswith(":root { --page-width: 792.0px; }\n")
+        assert "max-width: calc(var(--page-width) + 100px);" in css
+        assert "{{" not in css
+
+    def test_static_rules_shared(self, generator):
+        """Test that only the custom properties differ between page sizes."""
+        portrait = render(generator._generate_css, 612.0, 792.0, 540.0)
+        landscape = render(generator._generate_css, 792.0, 612.0, 720.0)
+
+        assert portrait.partition("\n")[2] == landscape.partition("\n")[2]
+
+
+class TestGenerate:
+    """Test suite for full preview generation."""
+
+    def test_generate_html_document(self, generator, sample_report):
+        """Test that the document contains every section, field and note."""
+        html = generator._generate_html(sample_report)
+
+        assert html.startswith("<!DOCTYPE html>")
+        assert "<title>Sales &lt;Summary> - Preview</title>" in html
+        assert "section section-pageheader" in html
+        assert "section section-detail" in html
+        assert "{CUSTOMER_NAME}" in html
+        assert "@Total" in html
+        assert "<strong>Title:</strong> Q1 Sales" in html
+        assert "<strong>Author:</strong> R&amp;D" in html
+        assert "<strong>Fields:</strong> 3" in html
+        assert "<li>Cross-tab &lt;pivot></li>" in html
+        assert "<li>Formula Total simplified</li>" in html
+
+    def test_suppressed_section_skipped(self, generator, sample_report):
+        """Test that suppressed sections are not rendered."""
+        sample_report.sections[1].suppress = True
+
+        html = generator._generate_html(sample_report)
+
+        assert "section section-detail" not in html
+        assert "{CUSTOMER_NAME}" not in html
+
+    def test_generate_writes_file(self, generator, sample_report, tmp_path):
+        """Test that generate writes the preview, creating parent directories."""
+        output_path = tmp_path / "previews" / "sales.html"
+
+        generator.generate(sample_report, output_path)
+
+        assert output_path.read_text(encoding="utf-8") == generator._generate_html(sample_report)
+
+    def test_generate_failure_removes_partial_file(
+        self, generator, sample_report, tmp_path, monkeypatch
+    ):
+        """Test that a preview that fails halfway through is not left on disk."""
+
+        def fail(*args):
+            raise ValueError("bad section")
+
+        monkeypatch.setattr(generator, "_render_section", fail)
+        output_path = tmp_path / "sales.html"
+
+        with pytest.raises(ValueError):
+            generator.generate(sample_report, output_path)
+
+        assert not output_path.exists()
+
+    def test_generate_after_directory_removed(self, generator, sample_report, tmp_path):
+        """Test that an output directory removed between runs is created again."""
+        output_path = tmp_path / "previews" / "sales.html"
+        generator.generate(sample_report, output_path)
+        output_path.unlink()
+        output_path.parent.rmdir()
+
+        generator.generate(sample_report, output_path)
+
+        assert output_path.exists()
+
+    def test_generate_many(self, generator, sample_report, tmp_path):
+        """Test that generate_many writes one preview per job."""
+        other_report = ReportModel(name="Inventory")
+        jobs = [
+            (sample_report, tmp_path / "a" / "sales.html"),
+            (other_report, tmp_path / "a" / "inventory.html"),
+            (sample_report, tmp_path / "b" / "sales.html"),
+        ]
+
+        generator.generate_many(jobs, workers=2)
+
+        for report, output_path in jobs:
+            assert output_path.read_text(encoding="utf-8") == generator._generate_html(report)
+
+    def test_generate_parallel(self, generator, sample_report, tmp_path):
+        """Test that generate_parallel writes one preview per job from worker processes."""
+        jobs = [
+            (sample_report, tmp_path / "sales.html"),
+            (ReportModel(name="Inventory"), tmp_path / "nested" / "inventory.html"),
+        ]
+
+        generator.generate_parallel(jobs, workers=2)
+
+        for report, output_path in jobs:
+            assert output_path.read_text(encoding="utf-8") == generator._generate_html(report)
+
+    def test_generate_parallel_single_job(self, generator, sample_report, tmp_path):
+        """Test that a single job is generated without starting worker processes."""
+        output_path = tmp_path / "sales.html"
+
+        generator.generate_parallel([(sample_report, output_path)])
+
+        assert output_path.exists()
+
+
+class TestGenerateFromXml:
+    """Test suite for previews generated from Oracle XML."""
+
+    def test_generate_from_xml(self, generator, tmp_path):
+        """Test that sections, frames and fields from the XML are listed."""
+        xml_path = tmp_path / "report.xml"
+        xml_path.write_text(
+            '<report name="Orders">'
+            "<layout>"
+            '<section name="main">'
+            '<frame name="M_HEADER" width="500" height="40">'
+            '<field name="F_TITLE" source="TITLE"/>'
+            "</frame>"
+            '<repeatingFrame name="R_ORDERS" width="500" height="20">'
+            '<field name="F_ID" source="ORDER_ID"/>'
+            "</repeatingFrame>"
+            "</section>"
+            "</layout>"
+            "</report>",
+            encoding="utf-8",
+        )
+        output_path = tmp_path / "report.html"
+
+        generator.generate_from_xml(xml_path, output_path)
+
+        html = output_path.read_text(encoding="utf-8")
+        assert "Oracle XML Preview: Orders" in html
+        assert "<h3>Section: main</h3>" in html
+        assert "<strong>frame:</strong> M_HEADER (500x40)" in html
+        assert "<strong>repeatingFrame:</strong> R_ORDERS (500x20)" in html
+        assert "Field: F_TITLE (TITLE)" in html
+        assert "Field: F_ID (ORDER_ID)" in html
+
+    def test_frames_in_document_order(self, generator, tmp_path):
+        """Test that frames and repeating frames are listed in document order."""
+        xml_path = tmp_path / "report.xml"
+        xml_path.write_text(
+            '<report name="Orders"><layout><section name="main">'
+            '<repeatingFrame name="R_FIRST"/>'
+            '<frame name="M_SECOND"><repeatingFrame name="R_THIRD"/></frame>'
+            "</section></layout></report>",
+            encoding="utf-8",
+        )
+        output_path = tmp_path / "report.html"
+
+        generator.generate_from_xml(xml_path, output_path)
+
+        html = output_path.read_text(encoding="utf-8")
+        positions = [html.index(name) for name in ("R_FIRST", "M_SECOND", "R_THIRD")]
+        assert positions == sorted(positions)
+
+    def test_generate_from_xml_without_layout(self, generator, tmp_path):
+        """Test that XML without a layout produces a minimal preview."""
+        xml_path = tmp_path / "empty.xml"
+        xml_path.write_text('<report name="Empty"/>', encoding="utf-8")
+        output_path = tmp_path / "empty.html"
+
+        generator.generate_from_xml(xml_path, output_path)
+
+        html = output_path.read_text(encoding="utf-8")
+        assert "No layout information found in XML" in html
@@ -4,6 +4,8 @@ Unit tests for Layout Mapper.
 Tests the conversion of Crystal Reports layout to Oracle Reports layout.
 """
 
+import sys
+
 import pytest
 
 from src.parsing.report_model import (
@@ -71,6 +73,13 @@ class TestOracleField:
         assert field.horizontal_alignment == "end"
         assert field.vertical_alignment == "center"
 
+    @pytest.mark.skipif(sys.version_info < (3, 10), reason="dataclass slots need Python 3.10+")
+    def test_uses_slots(self):
+        """Test that fields carry no per-instance __dict__."""
+        field = OracleField(name="F_NAME", source="NAME")
+
+        assert not hasattr(field, "__dict__")
+
 
 class TestOracleFrame:
     """Test suite for OracleFrame dataclass."""
@@ -113,6 +122,13 @@ class TestOracleFrame:
         assert result["frame_type"] == "repeating"
         assert result["source_group"] == "G_CUSTOMER"
 
+    @pytest.mark.skipif(sys.version_info < (3, 10), reason="dataclass slots need Python 3.10+")
+    def test_uses_slots(self):
+        """Test that frames carry no per-instance __dict__."""
+        frame = OracleFrame(name="M_BODY")
+
+        assert not hasattr(frame, "__dict__")
+
 
 class TestOracleLayout:
     """Test suite for OracleLayout dataclass."""
@@ -0,0 +1,670 @@
+"""
+Unit tests for the Oracle XML Generator.
+
+Tests generation of Oracle Reports XML from transformed reports.
+"""
+
+import sys
+import xml.etree.ElementTree as ET
+
+import pytest
+
+from src.generation.oracle_xml_generator import OracleXMLGenerator, _XMLWriter
+from src.transformation.condition_mapper import FormatTrigger
+from src.transformation.formula_translator import TranslatedFormula
+from src.transformation.layout_mapper import OracleField, OracleFrame, OracleLayout
+from src.transformation.parameter_mapper import OracleParameter
+from src.transformation.transformer import (
+    TransformedChart,
+    TransformedCrossTab,
+    TransformedReport,
+    TransformedSubreport,
+)
+
+
+@pytest.fixture
+def generator():
+    """Create an OracleXMLGenerator instance."""
+    return OracleXMLGenerator()
+
+
+@pytest.fixture
+def sample_report():
+    """Create a transformed report that uses every generated section."""
+    body = OracleFrame(
+        name="M_BODY",
+        frame_type="body",
+        x=0,
+        y=40.6,
+        width=540,
+        height=200,
+        children=[
+            OracleFrame(
+                name="R_DETAIL",
+                frame_type="repeating",
+                source_group="G_DETAIL",
+                width=540,
+                height=20,
+                fields=[
+                    OracleField(name="F_NAME", source="NAME", x=10.9, width=120),
+                    OracleField(
+                        name="F_AMOUNT",
+                        source="AMOUNT",
+                        x=140,
+                        format_mask="999G990D00",
+                        format_trigger="F_AMOUNT_FMT",
+                    ),
+                    OracleField(name="F_HIDDEN", source="ID", visible=False),
+                ],
+            )
+        ],
+    )
+    return TransformedReport(
+        name="SALES",
+        original_path="sales.rpt",
+        queries=[
+            {
+                "name": "Q_MAIN",
+                "sql": "SELECT name, amount, id FROM sales WHERE amount > 0 & 1 < 2",
+                "columns": [
+                    {"name": "NAME", "data_type": "VARCHAR2(50)"},
+                    {"name": "AMOUNT", "data_type": "NUMBER(10,2)"},
+                    {"name": "ID", "data_type": "NUMBER"},
+                ],
+            },
+            {"name": "Q_LOOKUP", "sql": "SELECT code FROM lookup", "columns": []},
+        ],
+        parameters=[
+            OracleParameter(
+                name="StartDate",
+                oracle_name="P_START_DATE",
+                data_type="DATE",
+                initial_value="01-JAN-2024",
+                prompt_text="Start date",
+            ),
+            OracleParameter(
+                name="Region",
+                oracle_name="P_REGION",
+                data_type="VARCHAR2",
+                width=10,
+                list_of_values="SELECT region FROM regions",
+            ),
+        ],
+        formulas=[
+            TranslatedFormula(
+                original_name="Total",
+                oracle_name="CF_TOTAL",
+                plsql_code="function CF_TOTALformula return number is begin return 1; end;",
+                return_type="NUMBER",
+            ),
+            TranslatedFormula(
+                original_name="Tricky",
+                oracle_name="CF_TRICKY",
+                plsql_code="return null;",
+                return_type="VARCHAR2",
+                is_placeholder=True,
+            ),
+            TranslatedFormula(
+                original_name="Broken",
+                oracle_name="CF_BROKEN",
+                plsql_code="",
+                return_type="NUMBER",
+                success=False,
+            ),
+        ],
+        format_triggers=[
+            FormatTrigger(
+                name="F_AMOUNT_FMT",
+                plsql_code="function F_AMOUNT_FMT return boolean is begin return true; end;",
+                original_condition="{AMOUNT} < 0",
+                warnings=["Color change approximated"],
+            )
+        ],
+        layout=OracleLayout(body_frame=body),
+        subreports=[
+            TransformedSubreport(
+                name="Orders",
+                oracle_name="SR_ORDERS",
+                x=5,
+                y=6,
+                width=300,
+                height=50,
+                parameter_links=[("CUSTOMER_ID", "P_CUST")],
+                suppress_trigger="SR_ORDERS_SUPPRESS",
+                on_demand=True,
+                warnings=["Shared variables not supported"],
+            )
+        ],
+        charts=[
+            TransformedChart(
+                name="Sales Chart",
+                oracle_name="CH_SALES",
+                chart_type="bar",
+                category_column="REGION",
+                value_columns=["AMOUNT"],
+                group_column="YEAR",
+                title="Sales",
+                is_3d=True,
+            )
+        ],
+        crosstabs=[
+            TransformedCrossTab(
+                name="Matrix",
+                oracle_name="CT_MATRIX",
+                row_columns=["REGION"],
+                column_columns=["YEAR"],
+                summary_columns=[{"name": "S1", "column": "AMOUNT", "function": "SUM"}],
+                show_grand_total=False,
+            )
+        ],
+    )
+
+
+def parse(xml_string):
+    """Parse generated XML into an element tree."""
+    return ET.fromstring(xml_string.encode("utf-8"))
+
+
+def write_xml(tmp_path, generator, report, pretty=True):
+    """Write a report with generate_to_file and return the file contents."""
+    output = tmp_path / "report.xml"
+    generator.generate_to_file(report, str(output), pretty=pretty)
+    return output.read_bytes().decode("utf-8")
+
+
+def assert_same_document(written, generated):
+    """Assert that two serializations hold the same document, whitespace included."""
+    assert written.partition("\n")[0] == generated.partition("\n")[0]
+    assert ET.canonicalize(written) == ET.canonicalize(generated)
+
+
+class TestGenerate:
+    """Tests for the generated document as a whole."""
+
+    def test_root_element(self, generator, sample_report):
+        """Test that the root element carries the report name and DTD version."""
+        root = parse(generator.generate(sample_report))
+
+        assert root.tag == "report"
+        assert root.get("name") == "SALES"
+        assert root.get("DTDVersion") == OracleXMLGenerator.DTD_VERSION
+
+    def test_declaration_and_indentation(self, generator, sample_report):
+        """Test that the output starts with an XML declaration and is indented."""
+        xml = generator.generate(sample_report)
+
+        assert xml.startswith("<?xml version=")
+        assert "\n  <data>" in xml
+        assert "\n    <dataSource" in xml
+
+    def test_compact(self, generator, sample_report):
+        """Test that pretty=False keeps the document on one line after the declaration."""
+        compact = generator.generate(sample_report, pretty=False)
+
+        declaration, _, body = compact.partition("\n")
+        assert declaration.startswith("<?xml version=")
+        assert ">\n" not in body
+        assert "\n  <" not in body
+        assert ET.canonicalize(body, strip_text=True) == ET.canonicalize(
+            generator.generate(sample_report).partition("\n")[2], strip_text=True
+        )
+
+    def test_section_order(self, generator, sample_report):
+        """Test that top-level sections appear in the expected order."""
+        root = parse(generator.generate(sample_report))
+
+        tags = [child.tag for child in root]
+        assert tags == [
+            "data",
+            "layout",
+            "programUnits",
+            "parameterForm",
+            "subreports",
+            "charts",
+            "crosstabs",
+        ]
+
+    def test_minimal_report(self, generator):
+        """Test that a report with no content produces only the data element."""
+        root = parse(generator.generate(TransformedReport(name="EMPTY", original_path="")))
+
+        assert [child.tag for child in root] == ["data"]
+        assert len(root.find("data")) == 0
+
+    def test_text_is_escaped(self, generator, sample_report):
+        """Test that SQL text with markup characters survives a round trip."""
+        root = parse(generator.generate(sample_report))
+
+        select = root.find("data/dataSource/select")
+        assert select.text == sample_report.queries[0]["sql"]
+
+    def test_multiline_source_preserved(self, generator, sample_report):
+        """Test that multi-line PL/SQL is written without added indentation."""
+        root = parse(generator.generate(sample_report))
+
+        proc = root.find("programUnits/procedure[@name='RUN_SR_ORDERS']")
+        assert proc.find("textSource").text.startswith("procedure RUN_SR_ORDERS(")
+        assert "\n  v_report_id   VARCHAR2(100);\n" in proc.find("textSource").text
+
+
+class TestDataModel:
+    """Tests for the data section."""
+
+    def test_data_sources(self, generator, sample_report):
+        """Test that each query becomes a data source."""
+        root = parse(generator.generate(sample_report))
+
+        sources = root.findall("data/dataSource")
+        assert [ds.get("name") for ds in sources] == ["Q_MAIN", "Q_LOOKUP"]
+        assert sources[1].find("select").text == "SELECT code FROM lookup"
+
+    def test_detail_group_columns(self, generator, sample_report):
+        """Test that the first query's columns become data items with mapped types."""
+        root = parse(generator.generate(sample_report))
+
+        group = root.find("data/group")
+        assert group.get("name") == "G_DETAIL"
+        assert group.get("source") == "Q_MAIN"
+        assert [(item.get("name"), item.get("datatype")) for item in group] == [
+            ("NAME", "character"),
+            ("AMOUNT", "number"),
+            ("ID", "number"),
+        ]
+
+    def test_parameters(self, generator, sample_report):
+        """Test that parameters are declared with their initial values."""
+        root = parse(generator.generate(sample_report))
+
+        params = root.findall("data/parameter")
+        assert [(p.get("name"), p.get("datatype")) for p in params] == [
+            ("P_START_DATE", "date"),
+            ("P_REGION", "character"),
+        ]
+        assert params[0].find("initialValue").text == "01-JAN-2024"
+        assert params[1].find("initialValue") is None
+
+    def test_formulas_skip_failed(self, generator, sample_report):
+        """Test that only successfully translated formulas are declared."""
+        root = parse(generator.generate(sample_report))
+
+        formulas = root.findall("data/formula")
+        assert [f.get("name") for f in formulas] == ["CF_TOTAL", "CF_TRICKY"]
+        assert formulas[0].get("source") == "CF_TOTALformula"
+        assert formulas[0].get("datatype") == "number"
+
+
+class TestLayout:
+    """Tests for the layout section."""
+
+    def test_frame_hierarchy(self, generator, sample_report):
+        """Test that frames nest and coordinates are truncated to integers."""
+        root = parse(generator.generate(sample_report))
+
+        body = root.find("layout/section/frame")
+        assert body.get("name") == "M_BODY"
+        assert body.get("y") == "40"
+        repeating = body.find("repeatingFrame")
+        assert repeating.get("source") == "G_DETAIL"
+        assert repeating.get("printDirection") == "down"
+
+    def test_field_attributes(self, generator, sample_report):
+        """Test that optional field attributes are only written when set."""
+        root = parse(generator.generate(sample_report))
+
+        fields = {f.get("name"): f for f in root.iter("field")}
+        assert fields["F_NAME"].get("x") == "10"
+        assert fields["F_NAME"].get("fontSize") == "10"
+        assert fields["F_NAME"].get("formatMask") is None
+        assert fields["F_AMOUNT"].get("formatMask") == "999G990D00"
+        assert fields["F_AMOUNT"].get("formatTrigger") == "F_AMOUNT_FMT"
+        assert fields["F_HIDDEN"].get("visible") == "no"
+
+    def test_sibling_frame_order(self, generator, sample_report):
+        """Test that sibling frames keep their order, each closed before the next opens."""
+        body = sample_report.layout.body_frame
+        body.children = [
+            OracleFrame(name="M_A", children=[OracleFrame(name="M_A1")]),
+            OracleFrame(name="M_B"),
+        ]
+
+        root = parse(generator.generate(sample_report))
+
+        frame = root.find("layout/section/frame")
+        assert [f.get("name") for f in frame] == ["M_A", "M_B"]
+        assert [f.get("name") for f in frame[0]] == ["M_A1"]
+
+    def test_deeply_nested_frames(self, generator, sample_report, tmp_path):
+        """Test that frames nested deeper than the recursion limit are written."""
+        depth = sys.getrecursionlimit() + 100
+        frame = sample_report.layout.body_frame
+        for i in range(depth):
+            child = OracleFrame(name=f"M_{i}")
+            frame.children = [child]
+            frame = child
+        output = tmp_path / "deep.xml"
+
+        generator.generate_to_file(sample_report, str(output))
+
+        names = [f.get("name") for f in ET.parse(output).iter("frame")]
+        assert names[-1] == f"M_{depth - 1}"
+
+
+class TestProgramUnits:
+    """Tests for generated PL/SQL program units."""
+
+    def test_single_program_units_element(self, generator, sample_report):
+        """Test that all functions and procedures share one programUnits element."""
+        root = parse(generator.generate(sample_report))
+
+        units = root.findall("programUnits")
+        assert len(units) == 1
+        assert [(u.tag, u.get("name")) for u in units[0]] == [
+            ("function", "CF_TOTALformula"),
+            ("function", "CF_TRICKYformula"),
+            ("function", "F_AMOUNT_FMT"),
+            ("procedure", "RUN_SR_ORDERS"),
+            ("procedure", "INIT_CH_SALES"),
+            ("procedure", "QUERY_CT_MATRIX"),
+        ]
+
+    def test_formula_comments(self, generator, sample_report):
+        """Test that placeholder formulas and trigger warnings get comments."""
+        root = parse(generator.generate(sample_report))
+
+        units = root.find("programUnits")
+        tricky = units.find("function[@name='CF_TRICKYformula']")
+        assert tricky.find("comment").text == "TODO: Manual conversion required for Tricky"
+        trigger = units.find("function[@name='F_AMOUNT_FMT']")
+        assert trigger.get("returnType") == "BOOLEAN"
+        assert [c.text for c in trigger.findall("comment")] == [
+            "Crystal condition: {AMOUNT} < 0",
+            "WARNING: Color change approximated",
+        ]
+
+    def test_procedures_without_formulas(self, generator, sample_report):
+        """Test that helper procedures alone still get a programUnits element after layout."""
+        sample_report.formulas = []
+        sample_report.format_triggers = []
+
+        root = parse(generator.generate(sample_report))
+
+        assert [child.tag for child in root][1:3] == ["layout", "programUnits"]
+        units = root.findall("programUnits")
+        assert len(units) == 1
+        assert [u.get("name") for u in units[0]] == [
+            "RUN_SR_ORDERS",
+            "INIT_CH_SALES",
+            "QUERY_CT_MATRIX",
+        ]
+
+    def test_generator_reuse(self, generator, sample_report):
+        """Test that a generator reused across reports keeps no program units between them."""
+        generator.generate(sample_report)
+        empty = TransformedReport(name="EMPTY", original_path="")
+
+        assert parse(generator.generate(empty)).find("programUnits") is None
+        root = parse(generator.generate(sample_report))
+        assert len(root.findall("programUnits")) == 1
+        assert len(root.find("programUnits")) == 6
+
+
+class TestParameterForm:
+    """Tests for the parameter form section."""
+
+    def test_parameter_fields(self, generator, sample_report):
+        """Test that each parameter gets a form field sized from its width."""
+        root = parse(generator.generate(sample_report))
+
+        fields = root.findall("parameterForm/parameterField")
+        assert [f.get("name") for f in fields] == ["PF_P_START_DATE", "PF_P_REGION"]
+        assert fields[0].get("width") == "180"
+        assert fields[0].get("label") == "Start date"
+        assert fields[0].find("listOfValues") is None
+        lov = fields[1].find("listOfValues")
+        assert lov.get("restrictToList") == "no"
+        assert lov.find("selectStatement").text == "SELECT region FROM regions"
+
+
+class TestObjects:
+    """Tests for subreport, chart and cross-tab sections."""
+
+    def test_subreport(self, generator, sample_report):
+        """Test that subreports carry position, links and flags."""
+        root = parse(generator.generate(sample_report))
+
+        sr = root.find("subreports/subreport")
+        assert sr.get("name") == "SR_ORDERS"
+        assert sr.get("originalName") == "Orders"
+        assert sr.get("onDemand") == "yes"
+        assert sr.find("position").attrib == {"x": "5", "y": "6", "width": "300", "height": "50"}
+        link = sr.find("parameterLinks/link")
+        assert link.get("parentColumn") == "CUSTOMER_ID"
+        assert link.get("subreportParameter") == "P_CUST"
+        assert sr.find("suppressTrigger").get("function") == "SR_ORDERS_SUPPRESS"
+
+    def test_subreport_procedure(self, generator, sample_report):
+        """Test that the subreport helper passes linked columns to the child report."""
+        root = parse(generator.generate(sample_report))
+
+        source = root.find("programUnits/procedure[@name='RUN_SR_ORDERS']/textSource").text
+        assert "procedure RUN_SR_ORDERS(p_customer_id IN VARCHAR2) is" in source
+        assert "'&' || 'P_CUST='||p_customer_id" in source
+
+    def test_chart(self, generator, sample_report):
+        """Test that charts carry their data configuration and appearance."""
+        root = parse(generator.generate(sample_report))
+
+        chart = root.find("charts/chart")
+        assert chart.get("chartType") == "bar"
+        config = chart.find("dataConfig")
+        assert [(c.tag, c.get("name")) for c in config] == [
+            ("categoryColumn", "REGION"),
+            ("valueColumn", "AMOUNT"),
+            ("groupColumn", "YEAR"),
+        ]
+        appearance = chart.find("appearance")
+        assert appearance.get("is3D") == "yes"
+        assert appearance.find("title").get("text") == "Sales"
+        assert appearance.find("legend").get("position") == "right"
+
+    def test_crosstab(self, generator, sample_report):
+        """Test that cross-tabs carry dimensions, measures and totals."""
+        root = parse(generator.generate(sample_report))
+
+        ct = root.find("crosstabs/crosstab")
+        assert ct.find("rowDimensions/dimension").get("column") == "REGION"
+        assert ct.find("columnDimensions/dimension").get("column") == "YEAR"
+        assert ct.find("measures/measure").attrib == {
+            "name": "S1",
+            "column": "AMOUNT",
+            "function": "SUM",
+        }
+        assert ct.find("totals").attrib == {
+            "showRowTotals": "yes",
+            "showColumnTotals": "yes",
+            "showGrandTotal": "no",
+        }
+        source = root.find("programUnits/procedure[@name='QUERY_CT_MATRIX']/textSource").text
+        assert "SELECT REGION, YEAR, SUM(AMOUNT) AS AMOUNT_AGG" in source
+
+    def test_warning_comments(self, generator, sample_report):
+        """Test that object warnings are written as XML comments."""
+        xml = generator.generate(sample_report)
+
+        assert "<!-- SUBREPORTS: 1 subreport reference(s) -->" in xml
+        assert "<!-- WARNING: Shared variables not supported -->" in xml
+
+    def test_warning_with_double_dash(self, generator, sample_report):
+        """Test that a "--" in a warning does not produce a malformed comment."""
+        sample_report.charts[0].warnings = ["Series -- and --- removed"]
+
+        xml = generator.generate(sample_report)
+
+        parse(xml)
+        assert "<!-- WARNING: Series - - and - - - removed -->" in xml
+
+
+class TestMapDatatype:
+    """Tests for Oracle type to Oracle Reports datatype mapping."""
+
+    @pytest.mark.parametrize(
+        "oracle_type, expected",
+        [
+            ("NUMBER", "number"),
+            ("NUMBER(10,2)", "number"),
+            ("DATE", "date"),
+            ("TIMESTAMP(6)", "date"),
+            ("timestamp(6) with time zone", "date"),
+            ("CLOB", "long"),
+            ("BLOB", "long"),
+            ("LONG", "long"),
+            ("LONG RAW", "long"),
+            ("NCLOB", "long"),
+            ("VARCHAR2(100)", "character"),
+            ("CHAR", "character"),
+            ("NVARCHAR2(20 CHAR)", "character"),
+            ("BOOLEAN", "character"),
+            ("", "character"),
+        ],
+    )
+    def test_mapping(self, generator, oracle_type, expected):
+        """Test that Oracle types map to the Oracle Reports datatype."""
+        assert generator._map_datatype(oracle_type) == expected
+
+
+class TestGenerateToFile:
+    """Tests for writing the generated XML to disk."""
+
+    def test_writes_same_document(self, generator, sample_report, tmp_path):
+        """Test that the written file holds the same document as generate()."""
+        written = write_xml(tmp_path, generator, sample_report)
+
+        assert_same_document(written, generator.generate(sample_report))
+
+    def test_special_characters(self, generator, sample_report, tmp_path):
+        """Test that markup, whitespace and non-ASCII characters are written like generate()."""
+        text = "a&b<c>d\"e'f\ng\th -- \u00e9\u65e5"
+        sample_report.name = text + "\r"
+        sample_report.queries[0]["sql"] = text
+        sample_report.queries[1]["sql"] = ""
+        sample_report.parameters[0].prompt_text = text
+        sample_report.formulas[0].plsql_code = text
+        sample_report.charts[0].title = text
+        sample_report.subreports[0].warnings.append(text)
+
+        written = write_xml(tmp_path, generator, sample_report)
+
+        assert_same_document(written, generator.generate(sample_report))
+        root = parse(written)
+        assert root.get("name") == text + "\r"
+        assert root.find("data/dataSource/select").text == text
+
+    def test_empty_report(self, generator, tmp_path):
+        """Test that a report with no content is written like generate()."""
+        report = TransformedReport(name="EMPTY", original_path="")
+
+        written = write_xml(tmp_path, generator, report)
+
+        assert_same_document(written, generator.generate(report))
+
+    def test_compact(self, generator, sample_report, tmp_path):
+        """Test that pretty=False writes the same compact document as generate()."""
+        written = write_xml(tmp_path, generator, sample_report, pretty=False)
+
+        assert_same_document(written, generator.generate(sample_report, pretty=False))
+
+    def test_failed_write_removes_file(self, generator, sample_report, tmp_path):
+        """Test that a file is not left behind when serialization fails."""
+        output = tmp_path / "sales.xml"
+        sample_report.layout.body_frame.children[0].fields[0].font_style = None
+
+        with pytest.raises(TypeError):
+            generator.generate_to_file(sample_report, str(output))
+
+        assert not output.exists()
+
+    @pytest.mark.parametrize("location", ["formula", "field source", "warning"])
+    def test_invalid_xml_character(self, generator, sample_report, tmp_path, location):
+        """Test that both paths reject a control character XML does not allow."""
+        pytest.importorskip("lxml")
+        if location == "formula":
+            sample_report.formulas[0].plsql_code = "return 1;\x0c"
+        elif location == "field source":
+            sample_report.layout.body_frame.children[0].fields[0].source = "CUST\x0bNAME"
+        else:
+            sample_report.subreports[0].warnings.append("bad\x00byte")
+        output = tmp_path / "sales.xml"
+
+        with pytest.raises(ValueError, match="XML compatible"):
+            generator.generate(sample_report)
+        with pytest.raises(ValueError, match="XML compatible"):
+            generator.generate_to_file(sample_report, str(output))
+
+        assert not output.exists()
+
+
+class TestXMLWriter:
+    """Tests for the streaming XML writer."""
+
+    @pytest.fixture
+    def out(self):
+        """Collect what the writer writes."""
+        return []
+
+    @pytest.fixture
+    def writer(self, out):
+        """Create an _XMLWriter that appends to out."""
+        return _XMLWriter(out.append)
+
+    def test_empty_element(self, writer, out):
+        """Test that an element without content is self-closing."""
+        writer.leaf("a", {"x": "1"})
+
+        assert "".join(out) == '<a x="1"/>'
+
+    def test_text_element(self, writer, out):
+        """Test that text is escaped and kept on the element's line."""
+        writer.leaf("a", {}, "1 < 2 & 3 > 2")
+
+        assert "".join(out) == "<a>1 &lt; 2 &amp; 3 &gt; 2</a>"
+
+    def test_attribute_escaping(self, writer, out):
+        """Test that quotes and whitespace in attribute values are escaped."""
+        writer.leaf("a", {"v": 'say "hi"\n\tnow'})
+
+        assert "".join(out) == '<a v="say &quot;hi&quot;&#10;&#9;now"/>'
+
+    def test_nested_indentation(self, writer, out):
+        """Test that child nodes are indented two spaces per level."""
+        writer.start("a", {})
+        writer.start("b", {})
+        writer.leaf("c", {})
+        writer.end("b")
+        writer.comment(" note ")
+        writer.end("a")
+
+        assert "".join(out) == "<a>\n  <b>\n    <c/>\n  </b>\n  <!-- note -->\n</a>"
+
+    def test_field(self, writer, out):
+        """Test that a field is written with its optional attributes last."""
+        writer.field(OracleField(name="F_A", source="A&B", x=1.9, format_mask="990", visible=False))
+
+        assert "".join(out) == (
+            '<field name="F_A" source="A&amp;B" x="1" y="0" width="100" height="14"'
+            ' fontName="Arial" fontSize="10" fontStyle="plain" horizontalAlignment="start"'
+            ' verticalAlignment="top" formatMask="990" visible="no"/>'
+        )
+
+    def test_comment_dashes(self, writer, out):
+        """Test that "--" in a comment is broken up."""
+        writer.comment(" a -- b ")
+
+        assert "".join(out) == "<!-- a - - b -->"
+
+    @pytest.mark.parametrize("char", ["\x00", "\x08", "\x0b", "\x0c", "\x1f", "\uffff"])
+    def test_invalid_character_rejected(self, writer, char):
+        """Test that text and attribute values with a character XML forbids are rejected."""
+        with pytest.raises(ValueError, match="XML compatible"):
+            writer.leaf("a", {}, f"x{char}y")
+        with pytest.raises(ValueError, match="XML compatible"):
+            writer.leaf("a", {"v": f"x{char}y"})
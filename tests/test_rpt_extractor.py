@@ -0,0 +1,656 @@
+"""
+Unit tests for RPT extraction.
+
+Uses MockRptExtractor so no Crystal Reports runtime is required.
+"""
+
+import asyncio
+import os
+import sys
+import time
+import xml.etree.ElementTree as ET
+from pathlib import Path
+
+import pytest
+
+from src.extraction import rpt_extractor
+from src.extraction.rpt_extractor import ExtractionResult, MockRptExtractor, RptExtractor
+from src.utils.error_handler import ConversionError, ErrorCategory
+
+
+class FailingExtractor(MockRptExtractor):
+    """Mock extractor whose every attempt fails with a given category."""
+
+    def __init__(self, *args, category=ErrorCategory.EXTRACTION_FAILED, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.category = category
+        self.attempts = 0
+
+    def _run_rpttoxml(self, rpt_file, xml_path):
+        self.attempts += 1
+        return ExtractionResult(
+            rpt_path=rpt_file,
+            success=False,
+            error=ConversionError(category=self.category, message="failed"),
+        )
+
+
+class SlowExtractor(MockRptExtractor):
+    """Mock extractor that takes 1.5 seconds over reports named gamma."""
+
+    def _run_rpttoxml(self, rpt_file, xml_path):
+        if rpt_file.stem == "gamma":
+            time.sleep(1.5)
+        return super()._run_rpttoxml(rpt_file, xml_path)
+
+
+@pytest.fixture
+def extractor(tmp_path):
+    """Create a MockRptExtractor writing into a temp directory."""
+    with MockRptExtractor(
+        rpttoxml_path="mock",
+        temp_dir=str(tmp_path / "temp"),
+        retry_attempts=0,
+    ) as extractor:
+        yield extractor
+
+
+@pytest.fixture
+def reusing_extractor(tmp_path):
+    """Create a MockRptExtractor that reuses XML from previous runs."""
+    with MockRptExtractor(
+        rpttoxml_path="mock",
+        temp_dir=str(tmp_path / "temp"),
+        retry_attempts=0,
+        reuse_existing_xml=True,
+    ) as extractor:
+        yield extractor
+
+
+@pytest.fixture
+def rpt_files(tmp_path):
+    """Create a few placeholder RPT files."""
+    input_dir = tmp_path / "input"
+    input_dir.mkdir()
+    files = []
+    for name in ("alpha", "beta", "gamma"):
+        path = input_dir / f"{name}.rpt"
+        path.write_bytes(b"RPT")
+        files.append(path)
+    return files
+
+
+class TestMockExtraction:
+    """Test suite for single-file extraction."""
+
+    def test_extract_writes_xml(self, extractor, rpt_files):
+        """Test that extraction writes XML named after the report."""
+        result = extractor.extract(rpt_files[0])
+
+        assert result.success
+        assert result.xml_path == extractor.temp_dir / "alpha.xml"
+        assert 'Name="alpha"' in result.xml_path.read_text(encoding="utf-8")
+
+    def test_report_name_is_escaped(self, extractor, tmp_path):
+        """Test that XML-special characters in the report name stay well-formed."""
+        rpt = tmp_path / 'Sales & "Returns".rpt'
+        rpt.write_bytes(b"RPT")
+
+        result = extractor.extract(rpt)
+
+        assert ET.parse(result.xml_path).getroot().get("Name") == 'Sales & "Returns"'
+
+    def test_existing_xml_is_reused(self, reusing_extractor, rpt_files, monkeypatch):
+        """Test that an up-to-date XML from a previous run is not regenerated."""
+        first = reusing_extractor.extract(rpt_files[0])
+
+        def fail_run(*args):
+            raise AssertionError("extraction should have been skipped")
+
+        monkeypatch.setattr(reusing_extractor, "_run_rpttoxml", fail_run)
+        second = reusing_extractor.extract(rpt_files[0])
+
+        assert second.success
+        assert second.xml_path == first.xml_path
+
+    def test_existing_xml_not_reused_by_default(self, extractor, rpt_files):
+        """Test that XML from a previous run is regenerated unless reuse is enabled."""
+        result = extractor.extract(rpt_files[0])
+        result.xml_path.write_bytes(b"old")
+
+        result = extractor.extract(rpt_files[0])
+
+        assert 'Name="alpha"' in result.xml_path.read_text(encoding="utf-8")
+
+    def test_newer_rpt_is_reextracted(self, reusing_extractor, rpt_files, monkeypatch):
+        """Test that an RPT modified after its XML is extracted again."""
+        result = reusing_extractor.extract(rpt_files[0])
+        xml_stat = result.xml_path.stat()
+        os.utime(rpt_files[0], ns=(xml_stat.st_atime_ns, xml_stat.st_mtime_ns + 1_000_000_000))
+        runs = []
+        run = reusing_extractor._run_rpttoxml
+
+        def counting_run(*args):
+            runs.append(args)
+            return run(*args)
+
+        monkeypatch.setattr(reusing_extractor, "_run_rpttoxml", counting_run)
+        result = reusing_extractor.extract(rpt_files[0])
+
+        assert result.success
+        assert len(runs) == 1
+
+    def test_same_name_in_other_directory_is_reextracted(self, tmp_path):
+        """Test that XML of a same-named RPT from another directory is not reused."""
+        first_rpt = tmp_path / "a" / "report.rpt"
+        second_rpt = tmp_path / "b" / "report.rpt"
+        for rpt, content in ((first_rpt, b"AAAA"), (second_rpt, b"BBBBBB")):
+            rpt.parent.mkdir()
+            rpt.write_bytes(content)
+
+        class ContentExtractor(MockRptExtractor):
+            def _run_rpttoxml(self, rpt_file, xml_path):
+                xml_path.write_bytes(b"<r>" + rpt_file.read_bytes() + b"</r>")
+                return ExtractionResult(rpt_path=rpt_file, success=True, xml_path=xml_path)
+
+        with ContentExtractor(
+            rpttoxml_path="mock", temp_dir=str(tmp_path / "temp"), reuse_existing_xml=True
+        ) as extractor:
+            extractor.extract(first_rpt)
+            result = extractor.extract(second_rpt)
+
+        assert result.xml_path.read_bytes() == b"<r>BBBBBB</r>"
+
+    def test_xml_without_record_is_reextracted(self, reusing_extractor, rpt_files):
+        """Test that an XML not recorded as a completed extraction is not reused."""
+        partial = reusing_extractor.temp_dir / "alpha.xml"
+        partial.write_bytes(b"<CrystalReport")
+
+        result = reusing_extractor.extract(rpt_files[0])
+
+        assert 'Name="alpha"' in result.xml_path.read_text(encoding="utf-8")
+
+    def test_changed_xml_is_reextracted(self, reusing_extractor, rpt_files):
+        """Test that an XML rewritten after its extraction finished is not reused."""
+        result = reusing_extractor.extract(rpt_files[0])
+        result.xml_path.write_bytes(b"<CrystalReport")
+
+        result = reusing_extractor.extract(rpt_files[0])
+
+        assert 'Name="alpha"' in result.xml_path.read_text(encoding="utf-8")
+
+    def test_failed_extraction_removes_xml(self, tmp_path, rpt_files):
+        """Test that a failed run leaves no XML behind for a later run to pick up."""
+        with FailingExtractor(
+            rpttoxml_path="mock", temp_dir=str(tmp_path / "temp"), retry_attempts=0
+        ) as extractor:
+            partial = extractor.temp_dir / "alpha.xml"
+            partial.write_bytes(b"<CrystalReport")
+
+            result = extractor.extract(rpt_files[0])
+
+        assert not result.success
+        assert not partial.exists()
+
+    def test_missing_file_fails(self, extractor, tmp_path):
+        """Test that a missing RPT file fails without retrying."""
+        result = extractor.extract(tmp_path / "missing.rpt")
+
+        assert not result.success
+        assert "does not exist" in result.error.message
+
+
+class TestExtractionResult:
+    """Test suite for the ExtractionResult container."""
+
+    @pytest.mark.skipif(sys.version_info < (3, 10), reason="dataclass slots need Python 3.10+")
+    def test_uses_slots(self, tmp_path):
+        """Test that results carry no per-instance __dict__."""
+        result = ExtractionResult(rpt_path=tmp_path / "a.rpt", success=True)
+
+        assert not hasattr(result, "__dict__")
+
+
+class TestRetries:
+    """Test suite for the extraction retry loop."""
+
+    @pytest.fixture(autouse=True)
+    def no_sleep(self, monkeypatch):
+        """Record retry delays instead of sleeping."""
+        self.delays = []
+        monkeypatch.setattr(rpt_extractor.time, "sleep", self.delays.append)
+
+    def test_backoff_grows_and_is_capped(self, tmp_path, rpt_files, monkeypatch):
+        """Test that retry delays double per attempt up to max_backoff."""
+        monkeypatch.setattr(rpt_extractor.random, "uniform", lambda low, high: high)
+        extractor = FailingExtractor(
+            "mock", str(tmp_path / "temp"), retry_attempts=4, base_delay=1.0, max_backoff=5.0
+        )
+
+        result = extractor.extract(rpt_files[0])
+
+        assert not result.success
+        assert extractor.attempts == 5
+        assert self.delays == [1.0, 2.0, 4.0, 5.0]
+
+    def test_missing_executable_is_not_retried(self, tmp_path, rpt_files):
+        """Test that a missing RptToXml fails immediately without backoff."""
+        extractor = RptExtractor(
+            str(tmp_path / "RptToXmlJava" / "missing.sh"), str(tmp_path / "temp"), retry_attempts=3
+        )
+
+        result = extractor.extract(rpt_files[0])
+
+        assert not result.success
+        assert not result.error.is_recoverable
+        assert result.error.code == "RPT-1006"
+        assert self.delays == []
+
+    def test_timeout_is_not_retried(self, tmp_path, rpt_files):
+        """Test that a timed-out extraction fails without retrying."""
+        extractor = FailingExtractor(
+            "mock",
+            str(tmp_path / "temp"),
+            retry_attempts=3,
+            category=ErrorCategory.EXTRACTION_TIMEOUT,
+        )
+
+        result = extractor.extract(rpt_files[0])
+
+        assert not result.success
+        assert extractor.attempts == 1
+        assert self.delays == []
+
+
+class TestBatchExtract:
+    """Test suite for batch extraction."""
+
+    @pytest.mark.parametrize("workers", [1, 2])
+    def test_results_follow_input_order(self, extractor, rpt_files, workers):
+        """Test that batch results are returned in input order."""
+        results = extractor.batch_extract(rpt_files, workers=workers)
+
+        assert [r.rpt_path for r in results] == rpt_files
+        assert all(isinstance(r, ExtractionResult) and r.success for r in results)
+
+    def test_duplicate_paths_keep_their_slots(self, extractor, rpt_files):
+        """Test that a path listed twice yields a result in each position."""
+        files = [rpt_files[0], rpt_files[1], rpt_files[0]]
+
+        results = extractor.batch_extract(files, workers=1)
+
+        assert [r.rpt_path for r in results] == files
+
+    @pytest.mark.skipif(sys.platform == "win32", reason="symlinks need privileges on Windows")
+    def test_same_file_extracted_once(self, extractor, rpt_files, monkeypatch):
+        """Test that duplicate and symlinked paths share a single extraction."""
+        link = rpt_files[0].parent / "alias.rpt"
+        link.symlink_to(rpt_files[0])
+        files = [rpt_files[0], link, rpt_files[1], rpt_files[0]]
+        extracted = []
+        original_extract = extractor.extract
+
+        def counting_extract(rpt_file):
+            extracted.append(rpt_file)
+            return original_extract(rpt_file)
+
+        monkeypatch.setattr(extractor, "extract", counting_extract)
+        results = extractor.batch_extract(files, workers=1)
+
+        assert extracted == [rpt_files[0], rpt_files[1]]
+        assert [r.rpt_path for r in results] == files
+        assert results[1].xml_path == results[0].xml_path
+
+    def test_identical_content_is_linked(self, tmp_path, rpt_files):
+        """Test that byte-identical reports are extracted once and share the XML."""
+        rpt_files[2].write_bytes(b"different")
+        with MockRptExtractor(
+            "mock", str(tmp_path / "temp"), retry_attempts=0, link_identical_reports=True
+        ) as extractor:
+            results = extractor.batch_extract(rpt_files, workers=1)
+
+        alpha, beta, gamma = results
+        assert [r.rpt_path for r in results] == rpt_files
+        assert all(r.success for r in results)
+        assert beta.xml_path == extractor.temp_dir / "beta.xml"
+        assert os.path.samefile(alpha.xml_path, beta.xml_path)
+        assert not os.path.samefile(alpha.xml_path, gamma.xml_path)
+
+    def test_progress_callback_called_per_file(self, extractor, rpt_files):
+        """Test that the progress callback sees every result."""
+        seen: list[Path] = []
+
+        extractor.batch_extract(
+            rpt_files, workers=1, progress_callback=lambda r: seen.append(r.rpt_path)
+        )
+
+        assert sorted(seen) == sorted(rpt_files)
+
+    def test_iter_extract_yields_every_file(self, extractor, rpt_files):
+        """Test that iter_extract streams one result per input file."""
+        results = list(extractor.iter_extract(rpt_files, workers=1))
+
+        assert sorted(r.rpt_path for r in results) == sorted(rpt_files)
+        assert all(r.success for r in results)
+
+    def test_iter_extract_can_stop_early(self, extractor, rpt_files):
+        """Test that abandoning iter_extract leaves the pool usable."""
+        first = next(iter(extractor.iter_extract(rpt_files, workers=1)))
+
+        results = extractor.batch_extract(rpt_files, workers=1)
+
+        assert first.success
+        assert all(r.success for r in results)
+
+    def test_progress_batch_callback_groups_results(self, extractor, rpt_files, monkeypatch):
+        """Test that batched progress groups results and flushes the remainder."""
+        monkeypatch.setattr(rpt_extractor, "_PROGRESS_FLUSH_SECONDS", 3600.0)
+        batches: list[list[ExtractionResult]] = []
+
+        extractor.batch_extract(
+            rpt_files, workers=1, progress_batch_callback=batches.append, progress_batch_size=2
+        )
+
+        assert [len(batch) for batch in batches] == [2, 1]
+
+    def test_progress_batch_flushed_while_waiting(self, tmp_path, rpt_files, monkeypatch):
+        """Test that finished results are delivered while a slow report is still running."""
+        monkeypatch.setattr(rpt_extractor, "_PROGRESS_FLUSH_SECONDS", 0.3)
+        batches: list[list[str]] = []
+
+        with SlowExtractor(
+            rpttoxml_path="mock", temp_dir=str(tmp_path / "temp"), retry_attempts=0
+        ) as extractor:
+            extractor.batch_extract(
+                rpt_files,
+                workers=1,
+                progress_batch_callback=lambda batch: batches.append(
+                    [r.rpt_path.stem for r in batch]
+                ),
+            )
+
+        assert batches == [["alpha", "beta"], ["gamma"]]
+
+    def test_executor_reused_across_batches(self, extractor, rpt_files):
+        """Test that consecutive batches share one worker pool until close()."""
+        extractor.batch_extract(rpt_files[:1], workers=1)
+        executor = extractor._executor
+
+        extractor.batch_extract(rpt_files[1:], workers=1)
+
+        assert extractor._executor is executor
+        extractor.close()
+        assert extractor._executor is None
+
+    def test_worker_count_change_replaces_executor(self, extractor, rpt_files):
+        """Test that a different worker count gets a new pool."""
+        extractor.batch_extract(rpt_files, workers=1)
+        executor = extractor._executor
+
+        results = extractor.batch_extract(rpt_files, workers=2)
+
+        assert extractor._executor is not executor
+        assert all(r.success for r in results)
+
+
+FAKE_RPTTOXML = """#!{python}
+import os, sys, time
+
+assert sys.argv[1:] == ["--stdin-mode"]
+for line in sys.stdin:
+    rpt, xml = line.rstrip("\\n").split("\\t")
+    if "slow" in rpt:
+        with open(xml + ".pid", "w") as f:
+            f.write(str(os.getpid()))
+        time.sleep(30)
+    print("Processing", rpt)
+    with open(xml, "w") as f:
+        f.write(str(os.getpid()))
+    print("RPTTOXML-RESULT\\tOK", flush=True)
+"""
+
+
+# Starts the fake RptToXml as a child, like rpttoxml.sh did before it used exec
+WRAPPED_RPTTOXML = """#!/bin/sh
+"{python}" "{script}" "$@"
+exit $?
+"""
+
+
+@pytest.fixture
+def daemon_extractor(tmp_path):
+    """Create a Java-mode extractor backed by a fake persistent RptToXml."""
+    script = tmp_path / "rpttoxml.sh"
+    script.write_text(FAKE_RPTTOXML.format(python=sys.executable))
+    script.chmod(0o755)
+    yield RptExtractor(
+        str(script),
+        str(tmp_path / "temp"),
+        timeout_seconds=5,
+        retry_attempts=0,
+        persistent_process=True,
+    )
+    rpt_extractor.close_daemons()
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="fake RptToXml is a shebang script")
+class TestPersistentProcess:
+    """Test suite for extraction through a persistent RptToXml process."""
+
+    def test_process_is_reused(self, daemon_extractor, rpt_files):
+        """Test that consecutive extractions are served by the same process."""
+        first = daemon_extractor.extract(rpt_files[0])
+        second = daemon_extractor.extract(rpt_files[1])
+
+        assert first.success and second.success
+        assert first.xml_path.read_text() == second.xml_path.read_text()
+
+    def test_timeout_restarts_process(self, daemon_extractor, rpt_files, tmp_path):
+        """Test that a timed-out request kills the process and the next one starts fresh."""
+        daemon_extractor.timeout_seconds = 1
+        slow = tmp_path / "input" / "slow.rpt"
+        slow.write_bytes(b"RPT")
+        first = daemon_extractor.extract(rpt_files[0])
+
+        timed_out = daemon_extractor.extract(slow)
+        after = daemon_extractor.extract(rpt_files[1])
+
+        assert timed_out.error.category == ErrorCategory.EXTRACTION_TIMEOUT
+        assert after.success
+        assert after.xml_path.read_text() != first.xml_path.read_text()
+
+    def test_timeout_kills_wrapped_process(self, tmp_path, rpt_files):
+        """Test that a timeout also kills a process the daemon's wrapper script started."""
+        fake = tmp_path / "fake_rpttoxml.py"
+        fake.write_text(FAKE_RPTTOXML.format(python=sys.executable))
+        wrapper = tmp_path / "rpttoxml.sh"
+        wrapper.write_text(WRAPPED_RPTTOXML.format(python=sys.executable, script=fake))
+        wrapper.chmod(0o755)
+        slow = tmp_path / "input" / "slow.rpt"
+        slow.write_bytes(b"RPT")
+        extractor = RptExtractor(
+            str(wrapper),
+            str(tmp_path / "temp"),
+            timeout_seconds=1,
+            retry_attempts=0,
+            persistent_process=True,
+        )
+
+        try:
+            start = time.monotonic()
+            result = extractor.extract(slow)
+            elapsed = time.monotonic() - start
+        finally:
+            rpt_extractor.close_daemons()
+
+        assert result.error.category == ErrorCategory.EXTRACTION_TIMEOUT
+        assert elapsed < 10
+        child = int((extractor.temp_dir / "slow.xml.pid").read_text())
+        deadline = time.monotonic() + 5
+        while time.monotonic() < deadline:
+            try:
+                os.kill(child, 0)
+            except ProcessLookupError:
+                break
+            time.sleep(0.05)
+        else:
+            pytest.fail("process started by the wrapper is still running")
+
+
+class TestTempDir:
+    """Test suite for temp directory setup."""
+
+    def test_creates_missing_temp_dir(self, tmp_path):
+        """Test that a missing temp directory is created with its parents."""
+        temp_dir = tmp_path / "a" / "b"
+
+        MockRptExtractor("mock", str(temp_dir))
+
+        assert temp_dir.is_dir()
+
+    def test_temp_dir_that_is_a_file(self, tmp_path):
+        """Test that a file in place of the temp directory is rejected."""
+        temp_file = tmp_path / "temp"
+        temp_file.write_text("x")
+
+        with pytest.raises(NotADirectoryError):
+            MockRptExtractor("mock", str(temp_file))
+
+
+class TestCleanup:
+    """Test suite for temp file cleanup."""
+
+    @pytest.fixture
+    def temp_files(self, extractor):
+        """Populate the temp directory with assorted files."""
+        for name in ("a.xml", "b.tmp", "c.log", "d.txt"):
+            (extractor.temp_dir / name).write_text("x")
+        return extractor.temp_dir
+
+    def test_removes_xml_tmp_and_log(self, extractor, temp_files):
+        """Test that cleanup removes xml, tmp and log files only."""
+        assert extractor.cleanup_temp_files() == 3
+        assert sorted(os.listdir(temp_files)) == ["d.txt"]
+
+    def test_keep_xml(self, extractor, temp_files):
+        """Test that keep_xml leaves XML files in place."""
+        assert extractor.cleanup_temp_files(keep_xml=True) == 2
+        assert sorted(os.listdir(temp_files)) == ["a.xml", "d.txt"]
+
+    def test_missing_temp_dir(self, extractor):
+        """Test that cleanup of a missing temp directory removes nothing."""
+        extractor.temp_dir.rmdir()
+
+        assert extractor.cleanup_temp_files() == 0
+
+
+FAKE_ONESHOT_RPTTOXML = """#!{python}
+import subprocess, sys, time
+
+rpt, xml = sys.argv[1:]
+print("Processing", rpt)
+if "broken" in rpt:
+    with open(rpt + ".runs", "a") as f:
+        f.write("x")
+    sys.exit(1)
+if "slow" in rpt:
+    # A helper that inherits our pipes, like the CR runtime's
+    subprocess.Popen([sys.executable, "-c", "import time; time.sleep(30)"])
+    print("started", file=sys.stderr, flush=True)
+    time.sleep(30)
+with open(xml, "w") as f:
+    f.write(rpt)
+"""
+
+
+@pytest.fixture
+def script_extractor(tmp_path):
+    """Create an extractor that runs a fake one-shot RptToXml."""
+    script = tmp_path / "rpttoxml.sh"
+    script.write_text(FAKE_ONESHOT_RPTTOXML.format(python=sys.executable))
+    script.chmod(0o755)
+    return RptExtractor(str(script), str(tmp_path / "temp"), retry_attempts=0)
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="fake RptToXml is a shebang script")
+class TestProcessOutput:
+    """Test suite for output captured from a one-shot RptToXml."""
+
+    def test_success_drops_stdout(self, script_extractor, rpt_files):
+        """Test that successful results do not keep RptToXml's progress output."""
+        result = script_extractor.extract(rpt_files[0])
+
+        assert result.success
+        assert result.stdout == ""
+
+    def test_silent_failure_reports_stdout(self, script_extractor, tmp_path):
+        """Test that a failure without stderr is diagnosed from stdout."""
+        broken = tmp_path / "broken.rpt"
+        broken.write_bytes(b"RPT")
+
+        result = script_extractor.extract(broken)
+
+        assert not result.success
+        assert "Processing" in result.error.message
+
+    def test_silent_failure_runs_once(self, script_extractor, tmp_path):
+        """Test that a failure without stderr does not launch RptToXml again for stdout."""
+        broken = tmp_path / "broken.rpt"
+        broken.write_bytes(b"RPT")
+        script_extractor.retry_attempts = 2
+        script_extractor.base_delay = 0
+
+        script_extractor.extract(broken)
+
+        assert (tmp_path / "broken.rpt.runs").read_text() == "xxx"
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="fake RptToXml is a shebang script")
+class TestBatchExtractAsync:
+    """Test suite for asyncio batch extraction."""
+
+    def test_subprocess_results_follow_input_order(self, script_extractor, rpt_files):
+        """Test that async batch results are returned in input order."""
+        seen: list[Path] = []
+
+        results = asyncio.run(
+            script_extractor.batch_extract_async(
+                rpt_files, workers=2, progress_callback=lambda r: seen.append(r.rpt_path)
+            )
+        )
+
+        assert [r.rpt_path for r in results] == rpt_files
+        assert all(r.success for r in results)
+        assert results[1].xml_path.read_text() == str(rpt_files[1])
+        assert sorted(seen) == sorted(rpt_files)
+
+    def test_subprocess_timeout(self, script_extractor, tmp_path):
+        """Test that a slow RptToXml is killed and reported as a timeout."""
+        script_extractor.timeout_seconds = 2
+        slow = tmp_path / "slow.rpt"
+        slow.write_bytes(b"RPT")
+
+        result = asyncio.run(script_extractor.extract_async(slow))
+
+        assert result.error.category == ErrorCategory.EXTRACTION_TIMEOUT
+        assert "started" in result.stderr
+
+    def test_sync_timeout_kills_helpers(self, script_extractor, tmp_path):
+        """Test that a timeout kills RptToXml's children and keeps partial output."""
+        script_extractor.timeout_seconds = 2
+        slow = tmp_path / "slow.rpt"
+        slow.write_bytes(b"RPT")
+        start = time.monotonic()
+
+        result = script_extractor.extract(slow)
+
+        assert result.error.category == ErrorCategory.EXTRACTION_TIMEOUT
+        assert "started" in result.stderr
+        assert time.monotonic() - start < 10
+
+    def test_overridden_runner_is_used(self, extractor, rpt_files):
+        """Test that subclasses overriding _run_rpttoxml work with the async API."""
+        results = asyncio.run(extractor.batch_extract_async(rpt_files, workers=2))
+
+        assert all(r.success for r in results)
+        assert 'Name="beta"' in results[1].xml_path.read_text(encoding="utf-8")
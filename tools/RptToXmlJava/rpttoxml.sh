@@ -8,6 +8,7 @@
 # Usage:
 #   ./rpttoxml.sh <input.rpt> [output.xml]
 #   ./rpttoxml.sh -r <directory>
+#   ./rpttoxml.sh --stdin-mode
 #
 
 set -e
@@ -33,6 +34,7 @@ if [ "$1" = "-h" ] || [ "$1" = "--help" ]; then
     echo "Options:"
     echo "  -h, --help     Show this help message"
     echo "  -r             Recursive directory processing"
+    echo "  --stdin-mode   Read '<input.rpt><TAB><output.xml>' lines from stdin"
     echo ""
     echo "Examples:"
     echo "  $0 report.rpt"
@@ -41,6 +43,59 @@ if [ "$1" = "-h" ] || [ "$1" = "--help" ]; then
     exit 0
 fi
 
+# Create temp directory with WEB-INF structure and set TEMP_DIR and CLASSPATH.
+# This is required because the Crystal Reports SDK resolves paths relative to the JAR location
+# and expects JARs to be in WEB-INF/lib/ with config in WEB-INF/classes/
+prepare_web_inf() {
+    TEMP_DIR=$(mktemp -d)
+    trap "rm -rf $TEMP_DIR" EXIT
+
+    # Create WEB-INF structure
+    mkdir -p "$TEMP_DIR/WEB-INF/lib"
+    mkdir -p "$TEMP_DIR/WEB-INF/classes"
+
+    # Copy JARs to WEB-INF/lib
+    cp "$JAR_PATH" "$TEMP_DIR/WEB-INF/lib/"
+    cp "$LIB_PATH"/*.jar "$TEMP_DIR/WEB-INF/lib/"
+
+    # Create CRConfig.xml in WEB-INF/classes
+    cat > "$TEMP_DIR/WEB-INF/classes/CRConfig.xml" << 'EOF'
+<?xml version="1.0" encoding="utf-8"?>
+<CrystalReportEngine-configuration>
+    <timeout>0</timeout>
+</CrystalReportEngine-configuration>
+EOF
+
+    # Build classpath pointing to WEB-INF/lib
+    CLASSPATH="$TEMP_DIR/WEB-INF/lib/RptToXml.jar"
+    for jar in "$TEMP_DIR/WEB-INF/lib"/*.jar; do
+        CLASSPATH="$CLASSPATH:$jar"
+    done
+    CLASSPATH="$CLASSPATH:$TEMP_DIR/WEB-INF/classes"
+}
+
+# Persistent mode: one JVM serves every request line read from stdin.
+# The Java side copies each report into the working directory itself.
+if [ "$1" = "--stdin-mode" ]; then
+    prepare_web_inf
+    cd "$TEMP_DIR"
+
+    JAVA_OPTS=""
+    if java --enable-native-access=ALL-UNNAMED -version >/dev/null 2>&1; then
+        JAVA_OPTS="--enable-native-access=ALL-UNNAMED"
+    fi
+
+    # exec so the JVM replaces this shell: a caller killing the daemon kills the
+    # JVM, and no orphaned JVM is left holding its stdout open. The EXIT trap
+    # does not survive exec, so a watcher removes TEMP_DIR once the JVM exits.
+    trap - EXIT
+    (
+        while kill -0 $$ 2>/dev/null; do sleep 5; done
+        rm -rf "$TEMP_DIR"
+    ) </dev/null >/dev/null 2>&1 &
+    exec java -cp "$CLASSPATH" $JAVA_OPTS com.rpttoxml.RptToXml --stdin-mode
+fi
+
 # Handle recursive directory mode
 if [ "$1" = "-r" ] || [ "$1" = "--recursive" ]; then
     if [ -z "$2" ]; then
@@ -106,40 +161,13 @@ else
     OUTPUT_FILE=$(echo "$INPUT_FILE" | sed 's/\.[rR][pP][tT]$/.xml/')
 fi
 
-# Create temp directory with WEB-INF structure
-# This is required because the Crystal Reports SDK resolves paths relative to the JAR location
-# and expects JARs to be in WEB-INF/lib/ with config in WEB-INF/classes/
-TEMP_DIR=$(mktemp -d)
-trap "rm -rf $TEMP_DIR" EXIT
-
-# Create WEB-INF structure
-mkdir -p "$TEMP_DIR/WEB-INF/lib"
-mkdir -p "$TEMP_DIR/WEB-INF/classes"
-
-# Copy JARs to WEB-INF/lib
-cp "$JAR_PATH" "$TEMP_DIR/WEB-INF/lib/"
-cp "$LIB_PATH"/*.jar "$TEMP_DIR/WEB-INF/lib/"
-
-# Create CRConfig.xml in WEB-INF/classes
-cat > "$TEMP_DIR/WEB-INF/classes/CRConfig.xml" << 'EOF'
-<?xml version="1.0" encoding="utf-8"?>
-<CrystalReportEngine-configuration>
-    <timeout>0</timeout>
-</CrystalReportEngine-configuration>
-EOF
+prepare_web_inf
 
 # Copy the report file to the same directory as JARs (critical for path resolution!)
 cp "$INPUT_FILE" "$TEMP_DIR/$INPUT_NAME"
 
 echo "Processing: $INPUT_FILE"
 
-# Build classpath pointing to WEB-INF/lib
-CLASSPATH="$TEMP_DIR/WEB-INF/lib/RptToXml.jar"
-for jar in "$TEMP_DIR/WEB-INF/lib"/*.jar; do
-    CLASSPATH="$CLASSPATH:$jar"
-done
-CLASSPATH="$CLASSPATH:$TEMP_DIR/WEB-INF/classes"
-
 # Save current directory
 ORIG_DIR="$(pwd)"
 
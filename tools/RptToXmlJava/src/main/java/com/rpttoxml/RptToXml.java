@@ -7,17 +7,21 @@
  * Usage:
  *   java -jar RptToXml.jar <input.rpt> [output.xml]
  *   java -jar RptToXml.jar -r <directory>    (recursive)
+ *   java -jar RptToXml.jar --stdin-mode      (persistent request/response mode)
  *
  * Copyright (c) 2024 RPT-to-RDF Project
  */
 package com.rpttoxml;
 
+import java.io.BufferedReader;
 import java.io.File;
+import java.io.InputStreamReader;
 import java.io.PrintWriter;
 import java.io.StringWriter;
 import java.nio.file.Files;
 import java.nio.file.Path;
 import java.nio.file.Paths;
+import java.nio.file.StandardCopyOption;
 import java.util.ArrayList;
 import java.util.List;
 
@@ -49,6 +53,7 @@ import com.crystaldecisions.sdk.occa.report.lib.*;
 public class RptToXml {
 
     private static final String VERSION = "1.0.0";
+    private static final String RESULT_PREFIX = "RPTTOXML-RESULT\t";
     private boolean verbose = false;
 
     public static void main(String[] args) {
@@ -82,7 +87,9 @@ public class RptToXml {
                 System.exit(1);
             }
 
-            if (args[0].equals("-r") || args[0].equals("--recursive")) {
+            if (args[0].equals("--stdin-mode")) {
+                extractor.processStdin();
+            } else if (args[0].equals("-r") || args[0].equals("--recursive")) {
                 if (args.length < 2) {
                     System.err.println("Error: Directory path required for recursive mode");
                     System.exit(1);
@@ -113,6 +120,7 @@ public class RptToXml {
         System.out.println();
         System.out.println("Options:");
         System.out.println("  -r, --recursive    Process all .rpt files in directory recursively");
+        System.out.println("  --stdin-mode       Read '<input.rpt>\\t<output.xml>' lines from stdin until EOF");
         System.out.println("  --verbose          Show detailed error messages");
         System.out.println("  -h, --help         Show this help message");
         System.out.println("  -v, --version      Show version information");
@@ -157,6 +165,50 @@ public class RptToXml {
         System.out.println("Complete: " + success + " successful, " + failed + " failed");
     }
 
+    /**
+     * Process requests read from stdin, keeping the JVM and SDK loaded between files.
+     *
+     * Each request is one line: the input RPT path and output XML path separated by
+     * a tab. After each request a single status line is written to stdout, either
+     * "RPTTOXML-RESULT\tOK" or "RPTTOXML-RESULT\tERROR\t<message>". Other output
+     * may precede the status line. Processing stops at EOF or an empty line.
+     *
+     * The SDK resolves reports relative to the working directory, so each input is
+     * copied there first (the wrapper script runs us from its WEB-INF temp dir).
+     */
+    public void processStdin() throws Exception {
+        BufferedReader reader = new BufferedReader(new InputStreamReader(System.in, "UTF-8"));
+        Path workDir = Paths.get("").toAbsolutePath();
+        String line;
+
+        while ((line = reader.readLine()) != null && !line.isEmpty()) {
+            String[] parts = line.split("\t", 2);
+            Path staged = null;
+            try {
+                if (parts.length != 2) {
+                    throw new IllegalArgumentException("Expected '<input>\\t<output>': " + line);
+                }
+                Path input = Paths.get(parts[0]).toAbsolutePath();
+                staged = workDir.resolve(input.getFileName());
+                if (staged.equals(input)) {
+                    staged = null;
+                } else {
+                    Files.copy(input, staged, StandardCopyOption.REPLACE_EXISTING);
+                }
+                processFile(staged != null ? staged.toString() : input.toString(), parts[1]);
+                System.out.println(RESULT_PREFIX + "OK");
+            } catch (Exception e) {
+                String message = String.valueOf(e.getMessage()).replace('\n', ' ');
+                System.out.println(RESULT_PREFIX + "ERROR\t" + message);
+            } finally {
+                if (staged != null) {
+                    Files.deleteIfExists(staged);
+                }
+                System.out.flush();
+            }
+        }
+    }
+
     /**
      * Process a single RPT file and extract to XML.
      */